@@ -0,0 +1,8 @@
+"""
+Бенчмарки игры Виселица.
+
+Запуск отдельных наборов:
+    python -m benchmarks.stress   - нагрузочный тест GameService и FileStorage
+    python -m benchmarks.micro    - микробенчмарки горячих путей
+    python -m benchmarks.scale    - масштабирование словаря от 1e3 до 1e7 слов
+"""
@@ -0,0 +1,60 @@
+"""Общие функции бенчмарков: перцентили и вывод результатов."""
+
+import json
+import math
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence, TextIO
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """Перцентиль q (0-100) по отсортированной выборке (ближайший ранг)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(values: Iterable[float]) -> Dict[str, float]:
+    """Сводка выборки задержек в секундах: число, среднее, перцентили, максимум."""
+    ordered = sorted(values)
+    summary = {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered) if ordered else 0.0,
+    }
+    for q in PERCENTILES:
+        summary[f"p{q}"] = percentile(ordered, q)
+    summary["max"] = ordered[-1] if ordered else 0.0
+    return summary
+
+
+def parse_sizes(text: str) -> List[int]:
+    """Разобрать список чисел через запятую (допускается запись 1e6)."""
+    return [int(float(part)) for part in text.split(",") if part.strip()]
+
+
+def emit(results: List[Dict], as_json: bool, out: Optional[TextIO] = None) -> None:
+    """Вывести результаты: JSON-строка на результат или выровненная таблица."""
+    out = out or sys.stdout
+    if as_json:
+        for result in results:
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        return
+    if not results:
+        return
+    columns = list(results[0])
+    rows = [[_format(result.get(column)) for column in columns] for result in results]
+    widths = [
+        max(len(column), *(len(row[i]) for row in rows))
+        for i, column in enumerate(columns)
+    ]
+    out.write("  ".join(c.ljust(w) for c, w in zip(columns, widths)) + "\n")
+    for row in rows:
+        out.write("  ".join(v.ljust(w) for v, w in zip(row, widths)) + "\n")
+
+
+def _format(value: object) -> str:
+    if isinstance(value, float):
+        return f"{value:.6g}"
+    return str(value)
@@ -0,0 +1,285 @@
+"""
+Микробенчмарки горячих путей игры.
+
+Для каждого случая число операций подбирается так, чтобы замер длился не
+меньше --min-time секунд; подготовка данных в замер не входит. Результат -
+JSON-строка на случай (или таблица с --table):
+
+    ops_per_sec, ns_per_op - скорость операции;
+    alloc_peak_bytes       - пик временно выделенной памяти за одну операцию
+                             (tracemalloc);
+    alloc_blocks           - число блоков памяти, оставшихся выделенными после
+                             операции (без учёта сборщика мусора).
+
+    python -m benchmarks.micro
+    python -m benchmarks.micro --filter storage --table
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional
+
+from benchmarks.common import emit, parse_sizes
+from src.application.achievements import AchievementEvaluator, MatchContext
+from src.application.config import GameConfig
+from src.application.scoring import calculate_score
+from src.core.entities import PlayerStatistics, Word
+from src.core.game import HangmanGame
+from src.infrastructure.cli_ui import NonInteractiveCLI
+from src.infrastructure.storage import FileStorage
+
+DEFAULT_HISTORY_SIZES = "0,100,1000,10000,100000"
+ALLOC_SAMPLES = 5
+SLOW_OP = 0.01
+
+# Готовит n операций и возвращает функцию, выполняющую их.
+Prepare = Callable[[int], Callable[[], None]]
+
+
+@dataclass(frozen=True)
+class Case:
+    """Случай бенчмарка."""
+
+    name: str
+    prepare: Prepare
+    param: str = ""
+
+
+def measure(case: Case, min_time: float) -> Dict[str, object]:
+    """Замерить случай: подобрать число операций и посчитать показатели."""
+    ops = 1
+    while True:
+        run = case.prepare(ops)
+        gc.collect()
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or ops >= 1 << 24:
+            break
+        ops = max(ops * 2, int(ops * min_time / elapsed * 1.2) if elapsed else ops * 10)
+
+    # Под tracemalloc операции заметно медленнее, поэтому долгие операции
+    # для оценки памяти выполняются один раз.
+    samples = 1 if elapsed / ops > SLOW_OP else ALLOC_SAMPLES
+    peaks, blocks = [], []
+    gc.disable()
+    try:
+        for _ in range(samples):
+            run = case.prepare(1)
+            before = sys.getallocatedblocks()
+            tracemalloc.start()
+            baseline = tracemalloc.get_traced_memory()[0]
+            run()
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+            tracemalloc.stop()
+            blocks.append(sys.getallocatedblocks() - before)
+            del run
+    finally:
+        gc.enable()
+
+    return {
+        "name": case.name,
+        "param": case.param,
+        "ops": ops,
+        "ns_per_op": elapsed / ops * 1e9,
+        "ops_per_sec": ops / elapsed,
+        "alloc_peak_bytes": min(peaks),
+        "alloc_blocks": min(blocks),
+    }
+
+
+def game_cases() -> Iterator[Case]:
+    word = Word("программирование", "")
+    letters = "оаримнпгвею"
+
+    def guess(n: int) -> Callable[[], None]:
+        games = [HangmanGame(word, 6) for _ in range(n)]
+        letter_list = [letters[i % len(letters)] for i in range(n)]
+
+        def run() -> None:
+            for game, letter in zip(games, letter_list):
+                game.guess(letter)
+
+        return run
+
+    def state(n: int) -> Callable[[], None]:
+        game = HangmanGame(word, 6)
+        for letter in "оари":
+            game.guess(letter)
+
+        def run() -> None:
+            for _ in range(n):
+                game.state()
+
+        return run
+
+    yield Case("HangmanGame.guess", guess)
+    yield Case("HangmanGame.state", state)
+
+
+def cli_cases(storage: FileStorage) -> Iterator[Case]:
+    def run_cli(n: int) -> Callable[[], None]:
+        def run() -> None:
+            for _ in range(n):
+                NonInteractiveCLI("волокно", "олкнв", storage).run()
+
+        return run
+
+    yield Case("NonInteractiveCLI.run", run_cli)
+
+
+def storage_cases(storage: FileStorage) -> Iterator[Case]:
+    config = storage.config
+    pairs = [
+        (category, level)
+        for category, levels in config.categories.items()
+        for level in levels
+    ]
+    words = [
+        w.value
+        for levels in config.categories.values()
+        for ws in levels.values()
+        for w in ws
+    ]
+
+    def get_word(n: int) -> Callable[[], None]:
+        def run() -> None:
+            for i in range(n):
+                storage.get_word(*pairs[i % len(pairs)])
+
+        return run
+
+    def check_word(n: int) -> Callable[[], None]:
+        def run() -> None:
+            for i in range(n):
+                storage.check_word(words[i % len(words)])
+
+        return run
+
+    def get_levels(n: int) -> Callable[[], None]:
+        def run() -> None:
+            for _ in range(n):
+                storage.get_levels()
+
+        return run
+
+    yield Case("FileStorage.get_word", get_word)
+    yield Case("FileStorage.check_word", check_word)
+    yield Case("FileStorage.get_levels", get_levels)
+
+
+def scoring_cases() -> Iterator[Case]:
+    evaluator = AchievementEvaluator()
+    rng = random.Random(0)
+    contexts = [
+        MatchContext(
+            is_won=rng.random() < 0.6,
+            hint_used=rng.random() < 0.3,
+            errors=rng.randrange(6),
+            max_attempts=6,
+            score=rng.randrange(150),
+            total_wins=rng.randrange(30),
+            consecutive_wins=rng.randrange(12),
+        )
+        for _ in range(1024)
+    ]
+
+    def score(n: int) -> Callable[[], None]:
+        def run() -> None:
+            for i in range(n):
+                c = contexts[i & 1023]
+                calculate_score(12, c.errors, c.hint_used, c.is_won)
+
+        return run
+
+    def achievements(n: int) -> Callable[[], None]:
+        def run() -> None:
+            for i in range(n):
+                evaluator.evaluate(contexts[i & 1023])
+
+        return run
+
+    yield Case("scoring.calculate_score", score)
+    yield Case("AchievementEvaluator.evaluate", achievements)
+
+
+def statistics_cases(directory: str, sizes: List[int]) -> Iterator[Case]:
+    config = GameConfig()
+    for size in sizes:
+        stats = PlayerStatistics()
+        for i in range(size):
+            stats.add_match(
+                {
+                    "match_id": str(i),
+                    "score": i % 150,
+                    "hint_used": i % 3 == 0,
+                    "errors": i % 6,
+                    "result": "win" if i % 5 else "loss",
+                    "category": "животные",
+                    "level": "лёгкий",
+                    "timestamp": 1.7e9 + i,
+                    "word_length": 3 + i % 8,
+                }
+            )
+        path = os.path.join(directory, f"stats-{size}.json")
+        storage = FileStorage(config, statistics_path=path)
+        storage.save_achievements(stats)
+
+        def load(n: int, storage=storage) -> Callable[[], None]:
+            def run() -> None:
+                for _ in range(n):
+                    storage.load_achievements()
+
+            return run
+
+        def save(n: int, storage=storage, stats=stats) -> Callable[[], None]:
+            def run() -> None:
+                for _ in range(n):
+                    storage.save_achievements(stats)
+
+            return run
+
+        yield Case("FileStorage.load_achievements", load, f"history={size}")
+        yield Case("FileStorage.save_achievements", save, f"history={size}")
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, object]]:
+    parser = argparse.ArgumentParser(description="Микробенчмарки горячих путей")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="Минимальная длительность замера"
+    )
+    parser.add_argument(
+        "--history",
+        default=DEFAULT_HISTORY_SIZES,
+        help="Размеры истории матчей для статистики через запятую",
+    )
+    parser.add_argument("--filter", default="", help="Только случаи с подстрокой")
+    parser.add_argument("--table", action="store_true", help="Вывод таблицей")
+    args = parser.parse_args(argv)
+
+    storage = FileStorage(GameConfig())
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        cases = [
+            *game_cases(),
+            *cli_cases(storage),
+            *storage_cases(storage),
+            *scoring_cases(),
+            *statistics_cases(directory, parse_sizes(args.history)),
+        ]
+        for case in cases:
+            if args.filter.lower() in f"{case.name} {case.param}".lower():
+                results.append(measure(case, args.min_time))
+    emit(results, not args.table)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""
+Масштабирование словаря: от тысяч до десятков миллионов слов.
+
+Словарь синтезируется в форме GameConfig.categories (категория -> уровень ->
+список Word) и подключается к хранилищу одним из способов:
+
+    config   - FileStorage со словарём в GameConfig;
+    compiled - FileStorage со скомпилированным словарём (--dictionary);
+    sqlite   - SQLiteStorage.
+
+Для каждого размера и способа выводятся время подготовки словаря, время
+запуска хранилища, первые (холодные) get_word и check_word, потребление
+памяти процессом, перцентили задержек get_word и check_word (попадание и
+промах), длительность полной игры с записью статистики и загрузки
+статистики. Каждый замер идёт в отдельном процессе, чтобы память одного
+размера не влияла на другой; если процесс упал (например, не хватило
+памяти), в строке результата заполняется поле error.
+
+    python -m benchmarks.scale --sizes 1e3,1e5,1e7 --backends config,compiled
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.common import emit, parse_sizes, summarize
+from src.application.config import GameConfig
+from src.application.session_service import SessionService
+from src.application.statistics_cache import StatisticsCache
+from src.core.entities import Word
+from src.core.exceptions import HangmanError
+from src.core.interfaces import Storage
+from src.infrastructure.dictionary import compile_dictionary
+from src.infrastructure.sqlite_storage import SQLiteStorage
+from src.infrastructure.storage import FileStorage
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ALPHABET = "абвгдежзийклмнопрстуфхцчшщъыьэюя"
+BACKENDS = ("config", "compiled", "sqlite")
+DEFAULT_SIZES = "1e3,1e4,1e5,1e6,1e7"
+MIN_WORD_LENGTH = 5
+
+
+def word_width(size: int) -> int:
+    """Длина номерной части слова, достаточная для size уникальных слов."""
+    width = MIN_WORD_LENGTH
+    while len(ALPHABET) ** width < size:
+        width += 1
+    return width
+
+
+def synthesize_word(number: int, width: int) -> str:
+    """Уникальное слово: номер в системе счисления по алфавиту и хвост."""
+    letters = []
+    rest = number
+    for _ in range(width):
+        rest, digit = divmod(rest, len(ALPHABET))
+        letters.append(ALPHABET[digit])
+    return "".join(letters) + ALPHABET[number % 7] * (number % 6)
+
+
+def synthesize_categories(
+    size: int, categories: int, levels: List[str]
+) -> Dict[str, Dict[str, List[Word]]]:
+    """Словарь из size слов, поровну разложенных по категориям и уровням."""
+    width = word_width(size)
+    result: Dict[str, Dict[str, List[Word]]] = {
+        f"категория{c}": {level: [] for level in levels} for c in range(categories)
+    }
+    buckets = [words for by_level in result.values() for words in by_level.values()]
+    for i in range(size):
+        buckets[i % len(buckets)].append(
+            Word(synthesize_word(i, width), f"описание {i}")
+        )
+    return result
+
+
+def rss_bytes() -> int:
+    """Текущий объём резидентной памяти процесса (пиковый, если нет /proc)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        if resource is None:
+            return 0
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _latencies(action: Callable[[int], object], samples: int) -> Dict[str, float]:
+    values = []
+    for i in range(samples):
+        started = time.perf_counter()
+        action(i)
+        values.append(time.perf_counter() - started)
+    return summarize(values)
+
+
+def _check_miss(storage: Storage, word: str) -> None:
+    try:
+        storage.check_word(word)
+    except HangmanError:
+        pass
+
+
+def _play_game(service: SessionService, rng: random.Random) -> None:
+    session = service.create_session()
+    letters = list(ALPHABET)
+    rng.shuffle(letters)
+    for letter in letters:
+        result = service.guess(session.session_id, letter)
+        if result.is_won or result.is_lost:
+            break
+    service.finish(session.session_id)
+
+
+def _build(size: int, backend: str, categories: int, directory: str) -> float:
+    """Подготовить словарь на диске; вернуть время подготовки."""
+    started = time.perf_counter()
+    words = synthesize_categories(size, categories, list(GameConfig().level_attempts))
+    if backend == "compiled":
+        compile_dictionary(words, os.path.join(directory, "words.hmd"))
+    else:
+        storage = SQLiteStorage(GameConfig(), os.path.join(directory, "words.db"))
+        storage.import_words(words)
+        storage.close()
+    return time.perf_counter() - started
+
+
+def open_storage(backend: str, config: GameConfig, directory: str) -> Storage:
+    """Хранилище со словарём, подготовленным для способа backend."""
+    statistics_path = os.path.join(directory, "stats.json")
+    if backend == "compiled":
+        return FileStorage(
+            config, os.path.join(directory, "words.hmd"), statistics_path
+        )
+    if backend == "sqlite":
+        return SQLiteStorage(config, os.path.join(directory, "words.db"))
+    return FileStorage(config, statistics_path=statistics_path)
+
+
+def _measure(
+    size: int,
+    backend: str,
+    categories: int,
+    directory: str,
+    samples: int,
+    games: int,
+) -> Dict[str, object]:
+    """Замерить один размер и способ хранения (в отдельном процессе)."""
+    result: Dict[str, object] = {}
+    baseline = rss_bytes()
+    config = GameConfig()
+    if backend == "config":
+        started = time.perf_counter()
+        words = synthesize_categories(size, categories, list(config.level_attempts))
+        config = GameConfig(categories=words)
+        result["build_s"] = time.perf_counter() - started
+    result["dictionary_mb"] = (rss_bytes() - baseline) / 2**20
+
+    started = time.perf_counter()
+    storage = open_storage(backend, config, directory)
+    names = list(storage.get_categories())
+    storage.get_levels()
+    result["startup_s"] = time.perf_counter() - started
+
+    levels = list(config.level_attempts)
+    width = word_width(size)
+    rng = random.Random(0)
+    hits = [synthesize_word(rng.randrange(size), width) for _ in range(samples)]
+    misses = [word + "ё" for word in hits]
+    pairs = [(rng.choice(names), rng.choice(levels)) for _ in range(samples)]
+
+    started = time.perf_counter()
+    storage.get_word(*pairs[0])
+    result["first_get_word_ms"] = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    storage.check_word(hits[0])
+    result["first_check_word_ms"] = (time.perf_counter() - started) * 1000
+    result["rss_mb"] = rss_bytes() / 2**20
+
+    series: Dict[str, Callable[[int], object]] = {
+        "get_word": lambda i: storage.get_word(*pairs[i]),
+        "check_hit": lambda i: storage.check_word(hits[i]),
+        "check_miss": lambda i: _check_miss(storage, misses[i]),
+    }
+    for name, action in series.items():
+        summary = _latencies(action, samples)
+        result[f"{name}_p50_us"] = summary["p50"] * 1e6
+        result[f"{name}_p99_us"] = summary["p99"] * 1e6
+
+    service = SessionService(
+        storage, config, StatisticsCache(storage, flush_every=1, flush_interval=None)
+    )
+    summary = _latencies(lambda i: _play_game(service, rng), games)
+    service.close()
+    result["game_p50_ms"] = summary["p50"] * 1000
+    result["game_p99_ms"] = summary["p99"] * 1000
+    summary = _latencies(lambda i: storage.load_achievements(), max(games // 5, 1))
+    result["stats_load_p50_ms"] = summary["p50"] * 1000
+    return result
+
+
+def run_size(
+    size: int, backend: str, categories: int, samples: int, games: int
+) -> Dict[str, object]:
+    """Прогнать один размер словаря и способ хранения в чистых процессах."""
+    result: Dict[str, object] = {"size": size, "backend": backend}
+    with tempfile.TemporaryDirectory() as directory:
+        try:
+            if backend != "config":
+                with ProcessPoolExecutor(1) as pool:
+                    result["build_s"] = pool.submit(
+                        _build, size, backend, categories, directory
+                    ).result()
+            with ProcessPoolExecutor(1) as pool:
+                result.update(
+                    pool.submit(
+                        _measure, size, backend, categories, directory, samples, games
+                    ).result()
+                )
+            result["error"] = ""
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, object]]:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", default=DEFAULT_SIZES, help="Размеры словаря через запятую"
+    )
+    parser.add_argument(
+        "--backends",
+        default=",".join(BACKENDS),
+        help=f"Способы хранения словаря через запятую: {', '.join(BACKENDS)}",
+    )
+    parser.add_argument("--categories", type=int, default=10, help="Число категорий")
+    parser.add_argument(
+        "--samples", type=int, default=2000, help="Вызовов на замер задержки"
+    )
+    parser.add_argument(
+        "--games", type=int, default=50, help="Игр на замер игры и статистики"
+    )
+    parser.add_argument("--json", action="store_true", help="Вывод в JSON Lines")
+    args = parser.parse_args(argv)
+
+    backends = [b.strip() for b in args.backends.split(",") if b.strip()]
+    unknown = set(backends) - set(BACKENDS)
+    if unknown:
+        parser.error(f"неизвестные способы хранения: {', '.join(sorted(unknown))}")
+    results = [
+        run_size(size, backend, args.categories, args.samples, args.games)
+        for size in parse_sizes(args.sizes)
+        for backend in backends
+    ]
+    emit(results, args.json)
+    return results
+
+
+if __name__ == "__main__":
+    main()
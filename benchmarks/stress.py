@@ -0,0 +1,273 @@
+"""
+Нагрузочный тест GameService и FileStorage при одновременной игре.
+
+N игроков (потоков или процессов) играют полные игры через GameService со
+сценарным UI и общим файлом статистики. Для каждого уровня параллелизма
+выводятся игры в секунду, перцентили задержек по фазам (старт игры,
+ход, завершение с подсчётом очков и достижений, запись статистики) и число
+потерянных и повреждённых обновлений статистики, а также игр, завершившихся
+ошибкой хранилища, и сбоев фонового сворачивания журнала. Потерянные или
+повреждённые обновления - дефект хранилища, а не просто показатель: при
+запуске из командной строки они печатаются в stderr, и код выхода равен 1.
+
+    python -m benchmarks.stress --players 1,4,16 --games 50 --mode process
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from benchmarks.common import emit, parse_sizes, summarize
+from src.application.config import GameConfig
+from src.application.game_service import GameService
+from src.application.statistics_cache import StatisticsCache
+from src.core.entities import GameState
+from src.core.exceptions import HangmanError
+from src.core.interfaces import UI
+from src.infrastructure.journal import DEFAULT_COMPACT_EVERY
+from src.infrastructure.storage import FileStorage
+
+ALPHABET = "абвгдеёжзийклмнопрстуфхцчшщъыьэюя"
+PHASES = ("start", "guess", "finish", "flush")
+
+
+class ScriptedUI(UI):
+    """UI без вывода, называющий буквы в случайном порядке и замеряющий фазы."""
+
+    def __init__(self, rng: random.Random, latencies: Dict[str, List[float]]):
+        self.rng = rng
+        self.latencies = latencies
+        self.letters: List[str] = []
+        self.guess_started: Optional[float] = None
+        self.finish_started: Optional[float] = None
+
+    def new_game(self) -> None:
+        self.letters = list(ALPHABET)
+        self.rng.shuffle(self.letters)
+        self.guess_started = None
+        self.finish_started = None
+
+    def display_game(
+        self, state: GameState, category: str, level: str, wrong_letters=None
+    ) -> None:
+        now = time.perf_counter()
+        if self.guess_started is not None:
+            self.latencies["guess"].append(now - self.guess_started)
+            self.guess_started = None
+        if state.game_finished and self.finish_started is None:
+            self.finish_started = now
+
+    def get_user_input(self) -> str:
+        letter = self.letters.pop()
+        self.guess_started = time.perf_counter()
+        return letter
+
+    def display_message(self, message: str, error: bool = False, final=False) -> None:
+        pass
+
+    def choose_category(self, categories: List[str]) -> str:
+        return self.rng.choice(list(categories))
+
+    def choose_level(self, levels: List[str]) -> str:
+        return self.rng.choice(levels)
+
+    def update_hint(self, hint: str) -> None:
+        pass
+
+
+def play_games(storage: FileStorage, games: int, seed: int) -> Dict[str, object]:
+    """Сыграть games игр одним игроком; вернуть задержки по фазам и время работы.
+
+    Каждая игра ведётся новым GameService, как при отдельном запуске
+    программы: статистика читается при завершении игры и записывается
+    при закрытии сервиса.
+    """
+    config = storage.config
+    latencies: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+    ui = ScriptedUI(random.Random(seed), latencies)
+    errors = 0
+    began = time.time()
+    for _ in range(games):
+        statistics = StatisticsCache(storage, flush_interval=None)
+        service = GameService(storage, ui, config, statistics)
+        ui.new_game()
+        try:
+            t = time.perf_counter()
+            service.start_game()
+            latencies["start"].append(time.perf_counter() - t)
+            service.play()
+            latencies["finish"].append(time.perf_counter() - ui.finish_started)
+            t = time.perf_counter()
+            service.close()
+            latencies["flush"].append(time.perf_counter() - t)
+        except HangmanError:
+            errors += 1
+            try:
+                statistics.close()
+            except HangmanError:
+                # Игра уже учтена как ошибка; повторный сбой записи не считается.
+                pass
+    storage.journal.wait()
+    return {
+        "began": began,
+        "ended": time.time(),
+        "latencies": latencies,
+        "errors": errors,
+    }
+
+
+_background_errors: List[str] = []
+
+
+def _count_background_error(args: threading.ExceptHookArgs) -> None:
+    # Сбои фонового сворачивания журнала считаются, а не печатаются.
+    _background_errors.append(args.exc_type.__name__)
+
+
+def open_storage(statistics_path: str, compact_every: int) -> FileStorage:
+    """FileStorage с заданным порогом сворачивания журнала."""
+    return FileStorage(
+        GameConfig(), statistics_path=statistics_path, compact_every=compact_every
+    )
+
+
+def _play_in_process(
+    statistics_path: str, compact_every: int, games: int, seed: int
+) -> Dict[str, object]:
+    threading.excepthook = _count_background_error
+    result = play_games(open_storage(statistics_path, compact_every), games, seed)
+    result["background_errors"] = len(_background_errors)
+    return result
+
+
+def count_corrupted(statistics_path: str) -> int:
+    """Число нечитаемых строк журнала (и 1 за нечитаемый снимок)."""
+    corrupted = 0
+    if os.path.exists(statistics_path):
+        try:
+            with open(statistics_path, "r", encoding="utf-8") as f:
+                json.load(f)
+        except (ValueError, UnicodeDecodeError):
+            corrupted += 1
+    journal_path = f"{statistics_path}.journal"
+    if os.path.exists(journal_path):
+        with open(journal_path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    json.loads(line)
+                except (ValueError, UnicodeDecodeError):
+                    corrupted += 1
+    return corrupted
+
+
+def run_level(
+    players: int, games: int, mode: str, compact_every: int, directory: str
+) -> Dict[str, object]:
+    """Прогнать один уровень параллелизма на чистом файле статистики."""
+    statistics_path = os.path.join(directory, f"stats-{mode}-{players}.json")
+    background_errors = 0
+    if mode == "thread":
+        storage = open_storage(statistics_path, compact_every)
+        _background_errors.clear()
+        previous_hook, threading.excepthook = (
+            threading.excepthook,
+            _count_background_error,
+        )
+        try:
+            with ThreadPoolExecutor(players) as pool:
+                futures = [
+                    pool.submit(play_games, storage, games, seed)
+                    for seed in range(players)
+                ]
+        finally:
+            threading.excepthook = previous_hook
+        background_errors = len(_background_errors)
+    else:
+        with ProcessPoolExecutor(players) as pool:
+            futures = [
+                pool.submit(
+                    _play_in_process, statistics_path, compact_every, games, seed
+                )
+                for seed in range(players)
+            ]
+    runs = [future.result() for future in futures]
+    background_errors += sum(r.get("background_errors", 0) for r in runs)
+
+    elapsed = max(r["ended"] for r in runs) - min(r["began"] for r in runs)
+    expected = players * games
+    corrupted = count_corrupted(statistics_path)
+    try:
+        recorded = (
+            FileStorage(GameConfig(), statistics_path=statistics_path)
+            .load_achievements()
+            .games_played
+        )
+    except HangmanError:
+        recorded = 0
+    result: Dict[str, object] = {
+        "mode": mode,
+        "players": players,
+        "games": expected,
+        "seconds": elapsed,
+        "games_per_sec": expected / elapsed if elapsed else 0.0,
+    }
+    for phase in PHASES:
+        summary = summarize(latency for r in runs for latency in r["latencies"][phase])
+        for key in ("p50", "p90", "p99", "max"):
+            result[f"{phase}_{key}_ms"] = summary[key] * 1000
+    result["recorded"] = recorded
+    result["lost"] = expected - recorded
+    result["corrupted"] = corrupted
+    result["errors"] = sum(r["errors"] for r in runs)
+    result["background_errors"] = background_errors
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> List[Dict[str, object]]:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--players", default="1,2,4,8,16", help="Уровни параллелизма через запятую"
+    )
+    parser.add_argument("--games", type=int, default=20, help="Игр на игрока")
+    parser.add_argument("--mode", choices=("thread", "process"), default="thread")
+    parser.add_argument(
+        "--compact-every",
+        type=int,
+        default=DEFAULT_COMPACT_EVERY,
+        help="Сворачивать журнал статистики каждые N записей",
+    )
+    parser.add_argument("--json", action="store_true", help="Вывод в JSON Lines")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = [
+            run_level(players, args.games, args.mode, args.compact_every, directory)
+            for players in parse_sizes(args.players)
+        ]
+    emit(results, args.json)
+    return results
+
+
+def report_defects(results: List[Dict[str, object]]) -> int:
+    """Напечатать потерянные и повреждённые обновления; вернуть код выхода."""
+    defects = [r for r in results if r["lost"] or r["corrupted"]]
+    for r in defects:
+        print(
+            f"Дефект: {r['mode']}, игроков {r['players']}: потеряно "
+            f"{r['lost']} из {r['games']} игр, повреждено записей {r['corrupted']}",
+            file=sys.stderr,
+        )
+    return 1 if defects else 0
+
+
+if __name__ == "__main__":
+    sys.exit(report_defects(main()))
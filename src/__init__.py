@@ -14,36 +14,54 @@ Hangman Game - Игра "Виселица" с многоуровневой ар
     main.py        - Точка входа приложения
 """
 
-from src.application import GameConfig, GameService
-from .core import (
-    Word,
-    GameState,
-    GuessResult,
-    Achievement,
-    PlayerStatistics,
-    MatchStatistics,
-    HangmanError,
-    InvalidWordError,
-    InvalidGuessError,
-    CategoryNotFoundError,
-    LevelNotFoundError,
-    NoWordsError,
-    HintAlreadyUsedError,
-    StorageError,
-    InvalidInputError,
-    GameAlreadyFinishedError,
-    StatisticsNotFoundError,
-    InvalidAchievementError,
-    InvalidScoreError,
-    CLIArgumentError,
-    InteractiveModeError,
-    NonInteractiveModeError,
-    Game,
-    Storage,
-    UI,
-    HangmanGame,
+from src.core.lazy import lazy_exports
+
+# Имена пакета импортируются при первом обращении: `import src` не
+# загружает слои приложения и инфраструктуры целиком.
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "GameConfig": "src.application.config",
+        "GameService": "src.application.game_service",
+        "Word": "src.core",
+        "GameState": "src.core",
+        "GuessResult": "src.core",
+        "Achievement": "src.core",
+        "PlayerStatistics": "src.core",
+        "MatchStatistics": "src.core",
+        "HangmanError": "src.core",
+        "InvalidWordError": "src.core",
+        "InvalidGuessError": "src.core",
+        "CategoryNotFoundError": "src.core",
+        "LevelNotFoundError": "src.core",
+        "NoWordsError": "src.core",
+        "HintAlreadyUsedError": "src.core",
+        "StorageError": "src.core",
+        "InvalidInputError": "src.core",
+        "GameAlreadyFinishedError": "src.core",
+        "StatisticsNotFoundError": "src.core",
+        "InvalidAchievementError": "src.core",
+        "InvalidScoreError": "src.core",
+        "CLIArgumentError": "src.core",
+        "InteractiveModeError": "src.core",
+        "NonInteractiveModeError": "src.core",
+        "SessionNotFoundError": "src.core",
+        "Game": "src.core",
+        "Storage": "src.core",
+        "UI": "src.core",
+        "HangmanGame": "src.core",
+        "BatchResult": "src.core.batch",
+        "simulate_batch": "src.core.batch",
+        "Reveal": "src.core",
+        "RevealPolicy": "src.core",
+        "reveal": "src.core",
+        "FileStorage": "src.infrastructure.storage",
+        "InteractiveCLI": "src.infrastructure.cli_ui",
+        "NonInteractiveCLI": "src.infrastructure.cli_ui",
+        "STAGES": "src.infrastructure.visuals",
+        "run_batch": "src.infrastructure.batch_cli",
+    },
 )
-from .infrastructure import FileStorage, InteractiveCLI, NonInteractiveCLI, STAGES
 
 __all__ = [
     "GameConfig",
@@ -70,14 +88,21 @@ __all__ = [
     "CLIArgumentError",
     "InteractiveModeError",
     "NonInteractiveModeError",
+    "SessionNotFoundError",
     "Game",
     "Storage",
     "UI",
     "HangmanGame",
+    "BatchResult",
+    "simulate_batch",
+    "Reveal",
+    "RevealPolicy",
+    "reveal",
     "FileStorage",
     "InteractiveCLI",
     "NonInteractiveCLI",
     "STAGES",
+    "run_batch",
 ]
 
 __version__ = "0.2.0"
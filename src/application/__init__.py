@@ -4,9 +4,38 @@ Application Layer - Сервисный слой и конфигурация иг
 Этот модуль содержит:
 - GameConfig: Конфигурация игры с категориями и уровнями сложности
 - GameService: Основной сервис управления игровой логикой
+- StatisticsCache: Кэш статистики с отложенной записью
+- AchievementEvaluator: Декларативные правила достижений
+- SessionService: Множество независимых игровых сессий без UI
 """
 
-from src.application.config import GameConfig
-from src.application.game_service import GameService
+from src.core.lazy import lazy_exports
 
-__all__ = ["GameConfig", "GameService"]
+# Модули слоя импортируются при первом обращении к их именам, чтобы
+# режимы командной строки загружали только то, что используют.
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "AchievementEvaluator": "src.application.achievements",
+        "AchievementRule": "src.application.achievements",
+        "GameConfig": "src.application.config",
+        "GameService": "src.application.game_service",
+        "GameSession": "src.application.session_service",
+        "MatchContext": "src.application.achievements",
+        "MatchSummary": "src.application.session_service",
+        "SessionService": "src.application.session_service",
+        "StatisticsCache": "src.application.statistics_cache",
+    },
+)
+
+__all__ = [
+    "AchievementEvaluator",
+    "AchievementRule",
+    "GameConfig",
+    "GameService",
+    "GameSession",
+    "MatchContext",
+    "MatchSummary",
+    "SessionService",
+    "StatisticsCache",
+]
@@ -0,0 +1,205 @@
+import operator
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.core.entities import Achievement
+from src.core.exceptions import InvalidAchievementError
+from src.core.phases import ACHIEVEMENTS, phase
+
+_COMPARISONS: Dict[str, Callable[[int, int], bool]] = {
+    "==": operator.eq,
+    ">=": operator.ge,
+    ">": operator.gt,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class MatchContext:
+    """Данные завершённого матча, по которым проверяются достижения."""
+
+    is_won: bool
+    hint_used: bool
+    errors: int
+    max_attempts: int
+    score: int
+    total_wins: int
+    consecutive_wins: int
+
+    @property
+    def attempts_left(self) -> int:
+        return self.max_attempts - self.errors
+
+
+@dataclass(frozen=True)
+class AchievementRule:
+    """Декларативное описание достижения.
+
+    Условия объединяются по И: победа (requires_win), использование
+    подсказки (hint_used, None - не важно), сравнение метрики контекста
+    с порогом, минимальная серия побед и произвольный предикат.
+    """
+
+    name: str
+    description: str
+    requires_win: bool = False
+    hint_used: Optional[bool] = None
+    metric: Optional[str] = None
+    compare: str = ">="
+    threshold: int = 0
+    streak: int = 0
+    predicate: Optional[Callable[[MatchContext], bool]] = None
+
+    def compile(self) -> Callable[[MatchContext], bool]:
+        """Собрать проверку правила в одну функцию."""
+        checks: List[Callable[[MatchContext], bool]] = []
+        if self.hint_used is not None:
+            hint_used = self.hint_used
+            checks.append(lambda ctx: ctx.hint_used == hint_used)
+        if self.metric is not None:
+            if self.compare not in _COMPARISONS:
+                raise InvalidAchievementError(
+                    f"Неизвестное сравнение '{self.compare}' в '{self.name}'"
+                )
+            get = operator.attrgetter(self.metric)
+            cmp, threshold = _COMPARISONS[self.compare], self.threshold
+            checks.append(lambda ctx: cmp(get(ctx), threshold))
+        if self.streak:
+            streak = self.streak
+            checks.append(lambda ctx: ctx.consecutive_wins >= streak)
+        if self.predicate is not None:
+            checks.append(self.predicate)
+        if not checks:
+            return lambda ctx: True
+        if len(checks) == 1:
+            return checks[0]
+        return lambda ctx: all(check(ctx) for check in checks)
+
+
+DEFAULT_RULES: Tuple[AchievementRule, ...] = (
+    AchievementRule(
+        "Без подсказки",
+        "Выиграть без использования подсказки",
+        requires_win=True,
+        hint_used=False,
+    ),
+    AchievementRule(
+        "С подсказкой",
+        "Выиграть используя подсказку",
+        requires_win=True,
+        hint_used=True,
+    ),
+    AchievementRule(
+        "Спидранер",
+        "Выиграть без единой ошибки",
+        requires_win=True,
+        metric="errors",
+        compare="==",
+        threshold=0,
+    ),
+    AchievementRule(
+        "Новичок",
+        "Первая победа",
+        requires_win=True,
+        metric="total_wins",
+        compare="==",
+        threshold=1,
+    ),
+    AchievementRule(
+        "Профи",
+        "10 побед",
+        requires_win=True,
+        metric="total_wins",
+        compare="==",
+        threshold=10,
+    ),
+    AchievementRule(
+        "Мастер",
+        "25 побед",
+        requires_win=True,
+        metric="total_wins",
+        compare="==",
+        threshold=25,
+    ),
+    AchievementRule("Серия побед", "5 побед подряд", streak=5),
+    AchievementRule("Упорство", "10 побед подряд", streak=10),
+    AchievementRule(
+        "Высокий счёт",
+        "Набрать более 100 очков в одной игре",
+        metric="score",
+        compare=">",
+        threshold=100,
+    ),
+    AchievementRule(
+        "На грани",
+        "Выиграть с одной оставшейся попыткой",
+        requires_win=True,
+        metric="attempts_left",
+        compare="==",
+        threshold=1,
+    ),
+)
+
+
+class AchievementEvaluator:
+    """Скомпилированный набор правил достижений.
+
+    Открытые достижения задаются битовой маской, поэтому уже полученные
+    правила пропускаются без проверки, а при поражении проверяются только
+    правила, не требующие победы.
+    """
+
+    def __init__(self, rules: Sequence[AchievementRule] = DEFAULT_RULES):
+        self.rules = tuple(rules)
+        self.__bits: Dict[str, int] = {}
+        for bit, rule in enumerate(self.rules):
+            if rule.name in self.__bits:
+                raise InvalidAchievementError(f"Повтор достижения '{rule.name}'")
+            self.__bits[rule.name] = bit
+        compiled = [
+            (
+                1 << bit,
+                rule.requires_win,
+                rule.compile(),
+                Achievement(rule.name, rule.description),
+            )
+            for bit, rule in enumerate(self.rules)
+        ]
+        self.__on_win = [(bit, check, ach) for bit, _, check, ach in compiled]
+        self.__on_loss = [
+            (bit, check, ach)
+            for bit, requires_win, check, ach in compiled
+            if not requires_win
+        ]
+
+    def mask_for(self, names: Iterable[str]) -> int:
+        """Битовая маска открытых достижений (неизвестные имена пропускаются)."""
+        mask = 0
+        for name in names:
+            bit = self.__bits.get(name)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    @phase(ACHIEVEMENTS)
+    def evaluate(self, context: MatchContext, unlocked: int = 0) -> List[Achievement]:
+        """Новые достижения за матч с учётом уже открытых (маска unlocked)."""
+        rules = self.__on_win if context.is_won else self.__on_loss
+        return [
+            ach for bit, check, ach in rules if not unlocked & bit and check(context)
+        ]
+
+    def evaluate_batch(
+        self, contexts: Iterable[MatchContext], unlocked: int = 0
+    ) -> Tuple[List[List[Achievement]], int]:
+        """Проверить последовательность матчей; вернуть новые достижения по
+        каждому матчу и итоговую маску."""
+        results = []
+        for context in contexts:
+            rules = self.__on_win if context.is_won else self.__on_loss
+            new = []
+            for bit, check, ach in rules:
+                if not unlocked & bit and check(context):
+                    unlocked |= bit
+                    new.append(ach)
+            results.append(new)
+        return results, unlocked
@@ -3,6 +3,12 @@ from typing import Dict, List
 
 from src.core.entities import Word
 
+# Адреса серверов по умолчанию; объявлены здесь, чтобы разбор аргументов
+# командной строки не импортировал asyncio.
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 7777
+DEFAULT_HTTP_PORT = 8080
+
 
 @dataclass(frozen=True)
 class GameConfig:
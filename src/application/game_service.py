@@ -1,9 +1,19 @@
 import random
-from typing import List, Optional, Tuple
+import time
+from typing import List, Optional, Sequence, Tuple
 
 from colorama import Fore
 
+from src.application.achievements import AchievementEvaluator, MatchContext
 from src.application.config import GameConfig
+from src.application.scoring import (
+    DEFAULT_ACHIEVEMENTS,
+    calculate_score,
+    consecutive_wins,
+    generate_match_id,
+)
+from src.application.statistics_cache import StatisticsCache
+from src.core import metrics
 from src.core.entities import (
     Achievement,
     GameState,
@@ -21,14 +31,24 @@ from src.core.exceptions import (
 )
 from src.core.game import HangmanGame
 from src.core.interfaces import UI, Game, Storage
+from src.core.phases import ACHIEVEMENTS, GUESS, phase
 
 
 class GameService:
     """Сервис для управления игрой."""
 
-    def __init__(self, storage: Storage, ui: UI, config: GameConfig):
+    def __init__(
+        self,
+        storage: Storage,
+        ui: UI,
+        config: GameConfig,
+        statistics: Optional[StatisticsCache] = None,
+        achievements: Optional[AchievementEvaluator] = None,
+    ):
         """Инициализация сервиса игры."""
         self.__storage = storage
+        self.__statistics = statistics or StatisticsCache(storage)
+        self.__achievements = achievements or DEFAULT_ACHIEVEMENTS
         self.__ui = ui
         self.__config = config
         self.__game: Optional[Game] = None
@@ -39,15 +59,13 @@ class GameService:
         self.__errors_count: int = 0
         self.__hint_used: bool = False
         self.__wrong_letters: set = set()
-        self.__consecutive_wins: int = 0
 
     @staticmethod
     def _generate_match_id() -> str:
         """Генерировать 9-значное число из уникальных цифр."""
-        digits = list(range(10))
-        random.shuffle(digits)
-        return "".join(map(str, digits[:9]))
+        return generate_match_id()
 
+    @metrics.timed("game.start")
     def start_game(
         self, category: Optional[str] = None, level: Optional[str] = None
     ) -> None:
@@ -63,7 +81,7 @@ class GameService:
             if category in categories
             else self.__ui.choose_category(categories)
         )
-        if self.__category not in self.__config.categories:
+        if self.__category not in categories:
             raise CategoryNotFoundError(f"Категория '{self.__category}' не найдена")
 
         levels = list(self.__config.level_attempts.keys())
@@ -75,6 +93,7 @@ class GameService:
         word = self.__storage.get_word(self.__category, self.__level)
         max_attempts = self.__config.level_attempts[self.__level]
         self.__game = HangmanGame(word, max_attempts)
+        metrics.count("games_started")
 
         self.__ui.display_message(
             f"Игра началась: {self.__category}, {self.__level} {self.__config.level_descriptions()[self.__level]}"
@@ -121,7 +140,7 @@ class GameService:
         score = self.__calculate_score()
         self.__ui.display_message(f"Очки за игру: {score}")
 
-        new_achievements = self.__check_achievements()
+        new_achievements = self.__check_achievements(score)
         if new_achievements:
             self.__ui.display_message("Новые достижения:")
             for ach in new_achievements:
@@ -136,6 +155,7 @@ class GameService:
                 raise HintAlreadyUsedError("Подсказка уже использована")
             hint = self.__game.get_hint()
             self.__hint_used = True
+            metrics.count("hints")
             self.__ui.display_message(f"Подсказка: {hint}")
             self.__ui.update_hint(hint)
         except HintAlreadyUsedError as e:
@@ -147,6 +167,8 @@ class GameService:
             )
             input("Нажмите Enter для продолжения...")
 
+    @metrics.timed("game.guess")
+    @phase(GUESS)
     def __handle_guess(self, letter: str) -> None:
         """Обработать угадывание буквы."""
         try:
@@ -157,6 +179,7 @@ class GameService:
                 return
 
             self.__last_result = self.__game.guess(letter)
+            metrics.count("guesses")
             if not self.__last_result.is_correct:
                 self.__errors_count += 1
                 self.__wrong_letters.add(letter)
@@ -166,123 +189,65 @@ class GameService:
 
     def __calculate_score(self) -> int:
         """Рассчитать очки за игру."""
-        if not self.__last_result or not self.__last_result.is_won:
-            return 0
-
-        base_score = len(self.__game.state().word.value) * 10
-        penalty_errors = self.__errors_count * 5
-        penalty_hint = 20 if self.__hint_used else 0
-        bonus_perfect = 50 if self.__errors_count == 0 and not self.__hint_used else 0
-
-        score = base_score - penalty_errors - penalty_hint + bonus_perfect
-        return max(score, 0)
+        return calculate_score(
+            len(self.__game.state().word.value),
+            self.__errors_count,
+            self.__hint_used,
+            bool(self.__last_result and self.__last_result.is_won),
+        )
 
-    def __check_achievements(self) -> List[Achievement]:
+    @metrics.timed("game.achievements")
+    @phase(ACHIEVEMENTS)
+    def __check_achievements(self, score: int) -> List[Achievement]:
         """Проверить и разблокировать новые достижения."""
-        achievements = []
-        stats: PlayerStatistics = self.__storage.load_achievements()
-
-        if self.__last_result.is_won:
-            self.__consecutive_wins += 1
-        else:
-            self.__consecutive_wins = 0
-
-        if self.__last_result.is_won and not self.__hint_used:
-            ach_name = "Без подсказки"
-            if ach_name not in stats.unlocked_achievements:
-                achievements.append(
-                    Achievement(ach_name, "Выиграть без использования подсказки")
-                )
-                stats.unlocked_achievements.append(ach_name)
-
-        if self.__last_result.is_won and self.__hint_used:
-            ach_name = "С подсказкой"
-            if ach_name not in stats.unlocked_achievements:
-                achievements.append(
-                    Achievement(ach_name, "Выиграть используя подсказку")
-                )
-                stats.unlocked_achievements.append(ach_name)
-
-        if self.__last_result.is_won and self.__errors_count == 0:
-            ach_name = "Спидранер"
-            if ach_name not in stats.unlocked_achievements:
-                achievements.append(Achievement(ach_name, "Выиграть без единой ошибки"))
-                stats.unlocked_achievements.append(ach_name)
-
-        if self.__last_result.is_won and stats.wins == 0:
-            ach_name = "Новичок"
-            if ach_name not in stats.unlocked_achievements:
-                achievements.append(Achievement(ach_name, "Первая победа"))
-                stats.unlocked_achievements.append(ach_name)
-
-        if self.__last_result.is_won and stats.wins + 1 == 10:
-            ach_name = "Профи"
-            if ach_name not in stats.unlocked_achievements:
-                achievements.append(Achievement(ach_name, "10 побед"))
-                stats.unlocked_achievements.append(ach_name)
-
-        if self.__last_result.is_won and stats.wins + 1 == 25:
-            ach_name = "Мастер"
-            if ach_name not in stats.unlocked_achievements:
-                achievements.append(Achievement(ach_name, "25 побед"))
-                stats.unlocked_achievements.append(ach_name)
-
-        if self.__consecutive_wins >= 5:
-            ach_name = "Серия побед"
-            if ach_name not in stats.unlocked_achievements:
-                achievements.append(Achievement(ach_name, "5 побед подряд"))
-                stats.unlocked_achievements.append(ach_name)
-
-        if self.__consecutive_wins >= 10:
-            ach_name = "Упорство"
-            if ach_name not in stats.unlocked_achievements:
-                achievements.append(Achievement(ach_name, "10 побед подряд"))
-                stats.unlocked_achievements.append(ach_name)
+        stats: PlayerStatistics = self.__statistics.stats
+        is_won = self.__last_result.is_won
 
-        score = self.__calculate_score()
-        if score > 100:
-            ach_name = "Высокий счёт"
-            if ach_name not in stats.unlocked_achievements:
-                achievements.append(
-                    Achievement(ach_name, "Набрать более 100 очков в одной игре")
-                )
-                stats.unlocked_achievements.append(ach_name)
-
-        max_attempts = self.__config.level_attempts[self.__level]
-        if self.__last_result.is_won and self.__errors_count == max_attempts - 1:
-            ach_name = "На грани"
-            if ach_name not in stats.unlocked_achievements:
-                achievements.append(
-                    Achievement(ach_name, "Выиграть с одной оставшейся попыткой")
-                )
-                stats.unlocked_achievements.append(ach_name)
-
-        self.__storage.save_achievements(stats)
+        context = MatchContext(
+            is_won=is_won,
+            hint_used=self.__hint_used,
+            errors=self.__errors_count,
+            max_attempts=self.__config.level_attempts[self.__level],
+            score=score,
+            total_wins=stats.wins + is_won,
+            consecutive_wins=consecutive_wins(stats, is_won),
+        )
+        achievements = self.__achievements.evaluate(
+            context, self.__achievements.mask_for(stats.unlocked_achievements)
+        )
+        if achievements:
+            self.__statistics.unlock_achievements([ach.name for ach in achievements])
         return achievements
 
+    @metrics.timed("game.statistics")
     def __update_statistics(self, score: int, is_win: bool) -> None:
         """Обновить статистику игрока."""
-        stats: PlayerStatistics = self.__storage.load_achievements()
-        stats.games_played += 1
-        if is_win:
-            stats.wins += 1
-        stats.total_score += score
-
         match_stats = MatchStatistics(
             match_id=self.__match_id,
             score=score,
             hint_used=self.__hint_used,
             errors=self.__errors_count,
             result="win" if is_win else "loss",
+            category=self.__category,
+            level=self.__level,
+            timestamp=time.time(),
+            word_length=len(self.__game.state().word.value),
         )
-        stats.match_history.append(match_stats.__dict__)
-
-        self.__storage.save_achievements(stats)
+        self.__statistics.record_match(match_stats)
+        metrics.count("games_finished")
+        metrics.count("wins" if is_win else "losses")
 
     def view_statistics(self) -> None:
         """Отобразить статистику игрока."""
-        stats: PlayerStatistics = self.__storage.load_achievements()
-        self.__ui.view_statistics(stats)
+        self.__ui.view_statistics(self.__statistics.stats)
+
+    def flush_statistics(self) -> None:
+        """Записать накопленную статистику в хранилище."""
+        self.__statistics.flush()
+
+    def close(self) -> None:
+        """Завершить работу сервиса, сохранив статистику."""
+        self.__statistics.close()
 
     @property
     def current_category(self) -> Optional[str]:
@@ -299,15 +264,15 @@ class GameService:
         """Получить состояние текущей игры."""
         return self.__game.state() if self.__game else None
 
-    def list_categories(self) -> List[str]:
+    def list_categories(self) -> Sequence[str]:
         """Список доступных категорий."""
         return self.__storage.get_categories()
 
-    def list_levels(self) -> List[str]:
+    def list_levels(self) -> Sequence[str]:
         """Список доступных уровней."""
         return self.__storage.get_levels()
 
-    def list_words(self, category: str) -> List[Tuple[str, List[Word]]]:
+    def list_words(self, category: str) -> List[Tuple[str, Sequence[Word]]]:
         """Список слов для категории."""
         return self.__storage.get_words_by_category(category)
 
@@ -0,0 +1,44 @@
+"""
+Правила подсчёта очков и значения по умолчанию, общие для сервисов игры.
+
+GameService (одна игра через UI) и SessionService (много независимых
+сессий) считают очки, выдают номера матчей и проверяют достижения
+одинаково, поэтому правила вынесены сюда и не зависят ни от одного из них.
+"""
+
+import random
+
+from src.application.achievements import AchievementEvaluator
+from src.core.entities import PlayerStatistics
+
+DEFAULT_ACHIEVEMENTS = AchievementEvaluator()
+
+
+def calculate_score(
+    word_length: int, errors: int, hint_used: bool, is_won: bool
+) -> int:
+    """Рассчитать очки за игру."""
+    if not is_won:
+        return 0
+    base_score = word_length * 10
+    penalty_errors = errors * 5
+    penalty_hint = 20 if hint_used else 0
+    bonus_perfect = 50 if errors == 0 and not hint_used else 0
+    return max(base_score - penalty_errors - penalty_hint + bonus_perfect, 0)
+
+
+def generate_match_id() -> str:
+    """Генерировать 9-значное число из уникальных цифр."""
+    digits = list(range(10))
+    random.shuffle(digits)
+    return "".join(map(str, digits[:9]))
+
+
+def consecutive_wins(stats: PlayerStatistics, is_won: bool) -> int:
+    """Длина серии побед с учётом текущей игры.
+
+    Серия берётся из сохранённой статистики, а не из состояния сервиса,
+    поэтому достижения за серии открываются одинаково в любом интерфейсе
+    и не сбрасываются при перезапуске.
+    """
+    return max(stats.rollups.current_streak, 0) + 1 if is_won else 0
@@ -0,0 +1,338 @@
+"""
+Сервис множества независимых игровых сессий.
+
+В отличие от GameService, который ведёт одну игру через UI, здесь каждая
+игра живёт в отдельной сессии с собственным идентификатором и состоянием.
+Сессии не разделяют изменяемых данных, поэтому один процесс может
+обслуживать много игроков одновременно (например, сетевой сервер).
+"""
+
+import random
+import threading
+import time
+import uuid
+import weakref
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from src.application.achievements import AchievementEvaluator, MatchContext
+from src.application.config import GameConfig
+from src.application.scoring import (
+    DEFAULT_ACHIEVEMENTS,
+    calculate_score,
+    consecutive_wins,
+    generate_match_id,
+)
+from src.application.statistics_cache import StatisticsCache
+from src.core import metrics
+from src.core.entities import (
+    Achievement,
+    GameState,
+    GuessResult,
+    MatchStatistics,
+    Word,
+)
+from src.core.exceptions import (
+    CategoryNotFoundError,
+    LevelNotFoundError,
+    SessionNotFoundError,
+)
+from src.core.game import HangmanGame
+from src.core.interfaces import Storage
+from src.core.phases import GUESS, phase
+
+T = TypeVar("T")
+
+# Живые сервисы для показателя active_sessions. Реестр метрик хранит
+# функцию модуля, а не связанный метод, поэтому не удерживает сервисы.
+_services: "weakref.WeakSet[SessionService]" = weakref.WeakSet()
+
+
+def active_sessions() -> int:
+    """Число сессий во всех живых сервисах процесса."""
+    return sum(len(service) for service in list(_services))
+
+
+@dataclass
+class GameSession:
+    """Состояние одной игровой сессии."""
+
+    session_id: str
+    match_id: str
+    category: str
+    level: str
+    game: HangmanGame
+    created_at: float = field(default_factory=time.time)
+    closed: bool = field(default=False, repr=False, compare=False)
+    lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def hint_used(self) -> bool:
+        return self.game.hint_used
+
+    def state(self) -> GameState:
+        return self.game.state()
+
+    def to_dict(self) -> Dict:
+        """Сериализовать незавершённую сессию."""
+        game = self.game
+        return {
+            "session_id": self.session_id,
+            "match_id": self.match_id,
+            "category": self.category,
+            "level": self.level,
+            "word": game.word.value,
+            "description": game.word.description,
+            "max_attempts": game.max_attempts,
+            "guessed_letters": sorted(game.guessed_letters),
+            "hint_used": game.hint_used,
+            "created_at": self.created_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "GameSession":
+        """Восстановить сессию, повторив названные буквы."""
+        game = HangmanGame(
+            Word(data["word"], data["description"]), data["max_attempts"]
+        )
+        for letter in data["guessed_letters"]:
+            game.guess(letter)
+        game.hint_used = data["hint_used"]
+        return cls(
+            session_id=data["session_id"],
+            match_id=data["match_id"],
+            category=data["category"],
+            level=data["level"],
+            game=game,
+            created_at=data["created_at"],
+        )
+
+
+@dataclass(frozen=True)
+class MatchSummary:
+    """Итог завершённой сессии."""
+
+    session_id: str
+    word: str
+    is_won: bool
+    score: int
+    achievements: List[Achievement]
+
+
+class SessionService:
+    """Управление множеством независимых игр без привязки к UI.
+
+    Сессии хранятся в отображении session_id -> GameSession (по умолчанию
+    обычный словарь); статистика и достижения общие для всех сессий и
+    обновляются при завершении игры.
+    """
+
+    def __init__(
+        self,
+        storage: Storage,
+        config: GameConfig,
+        statistics: Optional[StatisticsCache] = None,
+        achievements: Optional[AchievementEvaluator] = None,
+        sessions: Optional[MutableMapping[str, GameSession]] = None,
+    ):
+        self.__storage = storage
+        self.__config = config
+        self.__statistics = statistics or StatisticsCache(storage)
+        self.__achievements = achievements or DEFAULT_ACHIEVEMENTS
+        self.__sessions = {} if sessions is None else sessions
+        self.__lock = threading.Lock()
+        self.__finish_lock = threading.Lock()
+        # Хранилище сессий с TTL и вытеснением (SessionStore) передаёт сюда
+        # законченные, но ещё не учтённые игры перед тем, как их отбросить.
+        # Они учитываются после снятия блокировок сервиса и хранилища.
+        self.__dropped: Deque[GameSession] = deque()
+        if hasattr(self.__sessions, "on_finished"):
+            self.__sessions.on_finished = self.finish_dropped
+        _services.add(self)
+        metrics.gauge("active_sessions", active_sessions)
+
+    @property
+    def storage(self) -> Storage:
+        return self.__storage
+
+    @property
+    def statistics(self) -> StatisticsCache:
+        return self.__statistics
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__sessions)
+
+    def categories(self) -> Sequence[str]:
+        """Список доступных категорий."""
+        return self.__storage.get_categories()
+
+    def levels(self) -> List[str]:
+        """Список доступных уровней."""
+        return list(self.__config.level_attempts)
+
+    @metrics.timed("game.start")
+    def create_session(
+        self, category: Optional[str] = None, level: Optional[str] = None
+    ) -> GameSession:
+        """Начать новую игру; без категории или уровня они выбираются случайно."""
+        categories = self.__storage.get_categories()
+        if category is None:
+            category = random.choice(categories)
+        elif category not in categories:
+            raise CategoryNotFoundError(f"Категория '{category}' не найдена")
+        if level is None:
+            level = random.choice(list(self.__config.level_attempts))
+        elif level not in self.__config.level_attempts:
+            raise LevelNotFoundError(f"Уровень '{level}' не найден")
+
+        word = self.__storage.get_word(category, level)
+        session = GameSession(
+            session_id=uuid.uuid4().hex,
+            match_id=generate_match_id(),
+            category=category,
+            level=level,
+            game=HangmanGame(word, self.__config.level_attempts[level]),
+        )
+        with self.__lock:
+            self.__sessions[session.session_id] = session
+        self.__record_dropped()
+        metrics.count("games_started")
+        return session
+
+    def get_session(self, session_id: str) -> GameSession:
+        """Найти активную сессию."""
+        with self.__lock:
+            session = self.__sessions.get(session_id)
+        self.__record_dropped()
+        if session is None:
+            raise SessionNotFoundError(f"Сессия '{session_id}' не найдена")
+        return session
+
+    def __apply(self, session_id: str, action: Callable[[HangmanGame], T]) -> T:
+        """Выполнить действие над игрой сессии и записать сессию обратно.
+
+        Обратная запись нужна хранилищам, которые могут вытеснить сессию
+        (например, на диск) между её получением и изменением.
+        """
+        session = self.get_session(session_id)
+        with session.lock:
+            if session.closed:
+                raise SessionNotFoundError(f"Сессия '{session_id}' не найдена")
+            result = action(session.game)
+            with self.__lock:
+                self.__sessions[session_id] = session
+        self.__record_dropped()
+        return result
+
+    @metrics.timed("game.guess")
+    @phase(GUESS)
+    def guess(self, session_id: str, letter: str) -> GuessResult:
+        """Назвать букву в сессии."""
+        result = self.__apply(session_id, lambda game: game.guess(letter))
+        metrics.count("guesses")
+        return result
+
+    def hint(self, session_id: str) -> str:
+        """Получить подсказку (один раз за игру)."""
+        hint = self.__apply(session_id, HangmanGame.get_hint)
+        metrics.count("hints")
+        return hint
+
+    @metrics.timed("game.finish")
+    def finish(self, session_id: str) -> MatchSummary:
+        """Завершить сессию и учесть результат в статистике.
+
+        Незаконченная игра засчитывается как поражение.
+        """
+        session = self.get_session(session_id)
+        with session.lock:
+            if session.closed:
+                raise SessionNotFoundError(f"Сессия '{session_id}' не найдена")
+            session.closed = True
+            with self.__lock:
+                self.__sessions.pop(session_id, None)
+        return self.__record(session)
+
+    def finish_dropped(self, session: GameSession) -> None:
+        """Принять законченную игру, которую хранилище сессий отбрасывает.
+
+        Хранилище вызывает обработчик, пока сервис держит свою блокировку,
+        поэтому игра только ставится в очередь: результат записывается
+        ближайшей операцией сервиса после снятия блокировок.
+        """
+        self.__dropped.append(session)
+
+    def __record_dropped(self) -> None:
+        """Учесть отброшенные хранилищем законченные игры из очереди."""
+        while self.__dropped:
+            try:
+                session = self.__dropped.popleft()
+            except IndexError:
+                return
+            with session.lock:
+                if session.closed or not session.game.game_finished:
+                    continue
+                session.closed = True
+            self.__record(session)
+
+    def __record(self, session: GameSession) -> MatchSummary:
+        """Учесть результат закрытой сессии в статистике и достижениях."""
+        state = session.state()
+        is_won = state.is_won
+        word_length = len(state.word.value)
+        score = calculate_score(word_length, state.errors, session.hint_used, is_won)
+
+        with self.__finish_lock:
+            stats = self.__statistics.stats
+            context = MatchContext(
+                is_won=is_won,
+                hint_used=session.hint_used,
+                errors=state.errors,
+                max_attempts=state.max_attempts,
+                score=score,
+                total_wins=stats.wins + is_won,
+                consecutive_wins=consecutive_wins(stats, is_won),
+            )
+            achievements = self.__achievements.evaluate(
+                context, self.__achievements.mask_for(stats.unlocked_achievements)
+            )
+            if achievements:
+                self.__statistics.unlock_achievements(
+                    [ach.name for ach in achievements]
+                )
+            self.__statistics.record_match(
+                MatchStatistics(
+                    match_id=session.match_id,
+                    score=score,
+                    hint_used=session.hint_used,
+                    errors=state.errors,
+                    result="win" if is_won else "loss",
+                    category=session.category,
+                    level=session.level,
+                    timestamp=time.time(),
+                    word_length=word_length,
+                )
+            )
+        metrics.count("games_finished")
+        metrics.count("wins" if is_won else "losses")
+        return MatchSummary(
+            session.session_id, state.word.value, is_won, score, achievements
+        )
+
+    def close(self) -> None:
+        """Учесть отброшенные хранилищем игры и сохранить статистику."""
+        self.__record_dropped()
+        self.__statistics.close()
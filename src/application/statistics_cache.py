@@ -0,0 +1,132 @@
+import atexit
+import threading
+import weakref
+from typing import List, Optional
+
+from src.core.entities import MatchStatistics, PlayerStatistics
+from src.core.exceptions import StorageError
+from src.core.interfaces import Storage
+
+# Незакрытые кэши; ссылки слабые, чтобы брошенный кэш (и его хранилище)
+# мог быть собран, не дожидаясь завершения процесса.
+_open_caches: "weakref.WeakSet[StatisticsCache]" = weakref.WeakSet()
+_exit_hook_registered = False
+
+
+def _flush_open_caches() -> None:
+    for cache in list(_open_caches):
+        try:
+            cache.flush()
+        except StorageError:
+            continue
+
+
+def _track(cache: "StatisticsCache") -> None:
+    # Обработчик выхода регистрируется при создании первого кэша, то есть
+    # после модулей хранилищ: atexit вызывает его раньше их обработчиков.
+    global _exit_hook_registered
+    _open_caches.add(cache)
+    if not _exit_hook_registered:
+        atexit.register(_flush_open_caches)
+        _exit_hook_registered = True
+
+
+class StatisticsCache:
+    """Кэш статистики игрока с отложенной записью в хранилище.
+
+    Статистика читается из хранилища один раз, изменения сразу применяются
+    к копии в памяти и копятся в очереди. Очередь сбрасывается одним
+    обращением к хранилищу: после flush_every игр, по таймеру через
+    flush_interval секунд после первого изменения, при close() и при
+    завершении процесса. Запись в хранилище идёт вне блокировки кэша,
+    поэтому учёт новых игр не ждёт окончания медленной записи.
+    """
+
+    def __init__(
+        self,
+        storage: Storage,
+        flush_every: Optional[int] = 10,
+        flush_interval: Optional[float] = 5.0,
+    ):
+        self.__storage = storage
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.__stats: Optional[PlayerStatistics] = None
+        self.__pending_matches: List[MatchStatistics] = []
+        self.__pending_achievements: List[str] = []
+        self.__lock = threading.RLock()
+        self.__flush_lock = threading.Lock()
+        self.__flushing = False
+        self.__timer: Optional[threading.Timer] = None
+        _track(self)
+
+    @property
+    def stats(self) -> PlayerStatistics:
+        """Актуальная статистика, включая ещё не записанные изменения."""
+        with self.__lock:
+            if self.__stats is None:
+                self.__stats = self.__storage.load_achievements()
+            return self.__stats
+
+    @property
+    def dirty(self) -> bool:
+        return bool(
+            self.__pending_matches or self.__pending_achievements or self.__flushing
+        )
+
+    def unlock_achievements(self, names: List[str]) -> None:
+        """Отметить достижения открытыми."""
+        with self.__lock:
+            unlocked = self.stats.unlocked_achievements
+            for name in names:
+                if name not in unlocked:
+                    unlocked.append(name)
+                    self.__pending_achievements.append(name)
+            self.__schedule()
+
+    def record_match(self, match: MatchStatistics) -> None:
+        """Учесть завершённый матч."""
+        with self.__lock:
+            self.stats.add_match(dict(match.__dict__))
+            self.__pending_matches.append(match)
+            full = self.flush_every and len(self.__pending_matches) >= self.flush_every
+            if not full:
+                self.__schedule()
+        if full:
+            self.flush()
+
+    def __schedule(self) -> None:
+        if not self.dirty or self.__timer is not None or not self.flush_interval:
+            return
+        self.__timer = threading.Timer(self.flush_interval, self.flush)
+        self.__timer.daemon = True
+        self.__timer.start()
+
+    def flush(self) -> None:
+        """Записать накопленные изменения в хранилище."""
+        with self.__flush_lock:
+            with self.__lock:
+                if self.__timer is not None:
+                    self.__timer.cancel()
+                    self.__timer = None
+                achievements = self.__pending_achievements
+                matches = self.__pending_matches
+                self.__pending_achievements, self.__pending_matches = [], []
+                self.__flushing = True
+            try:
+                if achievements:
+                    self.__storage.unlock_achievements(achievements)
+                if matches:
+                    self.__storage.record_matches(matches)
+            except BaseException:
+                with self.__lock:
+                    self.__pending_achievements[:0] = achievements
+                    self.__pending_matches[:0] = matches
+                raise
+            finally:
+                self.__flushing = False
+
+    def close(self) -> None:
+        """Сбросить изменения и отключить автоматическую запись при выходе."""
+        self.flush()
+        _open_caches.discard(self)
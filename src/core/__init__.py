@@ -6,6 +6,8 @@ Core Layer - Основные доменные сущности и интерф
 - Исключения для обработки ошибок
 - Абстрактные интерфейсы (Game, Storage, UI)
 - Логику игры (HangmanGame)
+- Пакетный симулятор игр на NumPy (simulate_batch)
+- Табличный движок открытия букв (reveal)
 """
 
 from src.core.entities import (
@@ -33,9 +35,21 @@ from src.core.exceptions import (
     CLIArgumentError,
     InteractiveModeError,
     NonInteractiveModeError,
+    SessionNotFoundError,
 )
 from src.core.interfaces import Game, Storage, UI
 from src.core.game import HangmanGame
+from src.core.lazy import lazy_exports
+from src.core.reveal import Reveal, RevealPolicy, reveal
+
+# Пакетный симулятор тянет NumPy и импортируется только при обращении.
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "BatchResult": "src.core.batch",
+        "simulate_batch": "src.core.batch",
+    },
+)
 
 __all__ = [
     "Word",
@@ -60,8 +74,14 @@ __all__ = [
     "CLIArgumentError",
     "InteractiveModeError",
     "NonInteractiveModeError",
+    "SessionNotFoundError",
     "Game",
     "Storage",
     "UI",
     "HangmanGame",
+    "BatchResult",
+    "simulate_batch",
+    "Reveal",
+    "RevealPolicy",
+    "reveal",
 ]
@@ -0,0 +1,155 @@
+"""
+Пакетный симулятор игр "Виселица" на NumPy.
+
+Вычисляет результаты большого числа игр за одну векторизованную операцию и
+повторяет поведение HangmanGame: ход с некорректной или повторной буквой
+пропускается, ходы после окончания игры игнорируются.
+"""
+
+from dataclasses import dataclass
+from typing import List, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy необязательная зависимость
+    np = None
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Результаты пакета игр (по одной строке на игру)."""
+
+    revealed: "np.ndarray"
+    errors: "np.ndarray"
+    won: "np.ndarray"
+    lost: "np.ndarray"
+    end_turn: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.errors)
+
+    def reveal_masks(self) -> List[int]:
+        """Маски открытых позиций в формате GameState.reveal_mask."""
+        packed = np.packbits(self.revealed, axis=1, bitorder="little")
+        return [int.from_bytes(row.tobytes(), "little") for row in packed]
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Для пакетного симулятора требуется пакет numpy")
+
+
+def _encode(strings: Sequence[str]) -> "np.ndarray":
+    """Преобразовать строки в матрицу кодов символов, дополненную нулями."""
+    arr = np.asarray(strings, dtype=str)
+    width = max(arr.dtype.itemsize // 4, 1)
+    return arr.astype(f"<U{width}").view("<u4").reshape(len(arr), width)
+
+
+def _lower_code(code: int) -> int:
+    lowered = chr(code).lower()
+    return ord(lowered) if len(lowered) == 1 else code
+
+
+def _normalize(codes: "np.ndarray"):
+    """Привести коды к нижнему регистру и отметить буквенные символы."""
+    uniq, inverse = np.unique(codes, return_inverse=True)
+    lowered = np.fromiter((_lower_code(int(c)) for c in uniq), np.uint32, len(uniq))
+    alpha = np.fromiter((chr(c).isalpha() for c in uniq), bool, len(uniq))
+    inverse = inverse.reshape(codes.shape)
+    return lowered[inverse], alpha[inverse]
+
+
+def _simulate_chunk(
+    words: "np.ndarray",
+    guesses: "np.ndarray",
+    valid: "np.ndarray",
+    max_attempts: "np.ndarray",
+):
+    turns = guesses.shape[1]
+    never = turns
+
+    earlier = np.tri(turns, k=-1, dtype=bool)
+    repeated = ((guesses[:, :, None] == guesses[:, None, :]) & earlier).any(axis=2)
+    valid = valid & ~repeated
+
+    in_word = words != 0
+    hits = (
+        (guesses[:, :, None] == words[:, None, :])
+        & valid[:, :, None]
+        & in_word[:, None, :]
+    )
+    wrong = valid & ~hits.any(axis=2)
+    cum_errors = np.cumsum(wrong, axis=1)
+
+    first_hit = np.where(hits.any(axis=1), hits.argmax(axis=1), never)
+    win_turn = np.where(in_word, first_hit, -1).max(axis=1)
+    losing = cum_errors >= max_attempts[:, None]
+    loss_turn = np.where(losing.any(axis=1), losing.argmax(axis=1), never)
+
+    end = np.minimum(win_turn, loss_turn)
+    finished = end < never
+    last = np.minimum(end, turns - 1)
+    revealed = in_word & (first_hit <= end[:, None]) & (first_hit < never)
+    errors = cum_errors[np.arange(len(end)), last]
+    return (
+        revealed,
+        errors,
+        win_turn < loss_turn,
+        loss_turn < win_turn,
+        np.where(finished, end + 1, 0),
+    )
+
+
+def simulate_batch(
+    words: Sequence[str],
+    guesses: Sequence[str],
+    max_attempts: Union[int, Sequence[int]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> BatchResult:
+    """Сыграть пакет игр: words[i] угадывается буквами guesses[i] по порядку.
+
+    end_turn - номер хода (с 1), на котором игра завершилась, или 0, если
+    последовательность закончилась раньше игры.
+    """
+    _require_numpy()
+    if len(words) != len(guesses):
+        raise ValueError("Количество слов и последовательностей букв не совпадает")
+    count = len(words)
+    attempts = np.broadcast_to(np.asarray(max_attempts, dtype=np.int64), (count,))
+    if count and attempts.min() < 1:
+        raise ValueError("Количество попыток должно быть больше 0")
+
+    word_codes, word_alpha = _normalize(_encode(words))
+    lengths = (word_codes != 0).sum(axis=1)
+    if count and lengths.min() == 0:
+        raise ValueError("Слово не может быть пустым")
+    if count and lengths.min() < 2:
+        raise ValueError("Слово должно содержать минимум 2 символа")
+    if not (word_alpha | (word_codes == 0)).all():
+        raise ValueError("Слово должно содержать только буквы")
+    guess_codes, guess_valid = _normalize(_encode(guesses))
+
+    parts = []
+    for start in range(0, count, chunk_size):
+        stop = start + chunk_size
+        parts.append(
+            _simulate_chunk(
+                word_codes[start:stop],
+                guess_codes[start:stop],
+                guess_valid[start:stop],
+                attempts[start:stop],
+            )
+        )
+    if not parts:
+        parts.append(
+            _simulate_chunk(word_codes, guess_codes, guess_valid, attempts[:0])
+        )
+    revealed, errors, won, lost, end_turn = (
+        np.concatenate(column) for column in zip(*parts)
+    )
+    return BatchResult(
+        revealed=revealed, errors=errors, won=won, lost=lost, end_turn=end_turn
+    )
@@ -1,8 +1,11 @@
+import threading
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, List, Set
+from functools import lru_cache
+from typing import Deque, Dict, Iterable, List, Set
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Word:
     value: str
     description: str = ""
@@ -16,36 +19,208 @@ class Word:
             raise ValueError("Слово должно содержать только буквы")
 
 
-@dataclass(frozen=True)
+_ALPHABET = "абвгдеёжзийклмнопрстуфхцчшщъыьэюяabcdefghijklmnopqrstuvwxyz"
+_LETTER_BITS: Dict[str, int] = {letter: bit for bit, letter in enumerate(_ALPHABET)}
+_BIT_LETTERS: List[str] = list(_ALPHABET)
+_LETTERS_LOCK = threading.Lock()
+
+
+def letter_bit(letter: str) -> int:
+    """Номер бита буквы в алфавитной маске (новые буквы регистрируются)."""
+    bit = _LETTER_BITS.get(letter)
+    if bit is None:
+        # Таблицы растут из нескольких потоков (пакетный режим, серверы):
+        # повторная проверка под блокировкой даёт букве единственный бит.
+        with _LETTERS_LOCK:
+            bit = _LETTER_BITS.get(letter)
+            if bit is None:
+                bit = len(_BIT_LETTERS)
+                _BIT_LETTERS.append(letter)
+                _LETTER_BITS[letter] = bit
+    return bit
+
+
+def letters_to_mask(letters: Iterable[str]) -> int:
+    """Упаковать набор букв в алфавитную маску."""
+    mask = 0
+    for letter in letters:
+        mask |= 1 << letter_bit(letter.lower())
+    return mask
+
+
+def mask_to_letters(mask: int) -> Set[str]:
+    """Развернуть алфавитную маску в множество букв."""
+    letters = set()
+    while mask:
+        low = mask & -mask
+        letters.add(_BIT_LETTERS[low.bit_length() - 1])
+        mask ^= low
+    return letters
+
+
+@lru_cache(maxsize=65536)
+def letter_positions(value: str) -> Dict[str, int]:
+    """Индекс буква -> битовая маска её позиций в слове (без учёта регистра)."""
+    positions: Dict[str, int] = {}
+    for i, letter in enumerate(value.lower()):
+        positions[letter] = positions.get(letter, 0) | (1 << i)
+    return positions
+
+
 class GameState:
-    word: Word
-    guessed_letters: Set[str] = field(default_factory=set)
-    errors: int = 0
-    max_attempts: int = 6
-    game_finished: bool = False
+    """Неизменяемый снимок состояния игры в упакованном виде.
+
+    Угаданные и неверные буквы хранятся алфавитными масками, открытые
+    позиции слова - маской позиций. Множества и строки строятся только
+    при обращении к соответствующим свойствам.
+    """
+
+    __slots__ = (
+        "word",
+        "guessed_mask",
+        "wrong_mask",
+        "reveal_mask",
+        "errors",
+        "max_attempts",
+        "game_finished",
+    )
+
+    def __init__(
+        self,
+        word: Word,
+        guessed_letters: Iterable[str] = (),
+        errors: int = 0,
+        max_attempts: int = 6,
+        game_finished: bool = False,
+    ):
+        positions = letter_positions(word.value)
+        guessed_mask = wrong_mask = reveal_mask = 0
+        for letter in {letter.lower() for letter in guessed_letters}:
+            bit = 1 << letter_bit(letter)
+            guessed_mask |= bit
+            if letter in positions:
+                reveal_mask |= positions[letter]
+            else:
+                wrong_mask |= bit
+        self.__fill(
+            word,
+            guessed_mask,
+            wrong_mask,
+            reveal_mask,
+            errors,
+            max_attempts,
+            game_finished,
+        )
+
+    @classmethod
+    def from_masks(
+        cls,
+        word: Word,
+        guessed_mask: int,
+        wrong_mask: int,
+        reveal_mask: int,
+        errors: int,
+        max_attempts: int,
+        game_finished: bool,
+    ) -> "GameState":
+        """Создать снимок из готовых масок без пересчёта."""
+        state = object.__new__(cls)
+        state.__fill(
+            word,
+            guessed_mask,
+            wrong_mask,
+            reveal_mask,
+            errors,
+            max_attempts,
+            game_finished,
+        )
+        return state
+
+    def __fill(self, *values) -> None:
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Состояние игры нельзя изменить")
+
+    def __delattr__(self, name):
+        raise AttributeError("Состояние игры нельзя изменить")
+
+    def __astuple(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return self.__astuple() == other.__astuple()
+
+    def __hash__(self) -> int:
+        return hash(self.__astuple())
+
+    def __repr__(self) -> str:
+        return (
+            f"GameState(word={self.word!r}, current_state={self.current_state!r}, "
+            f"errors={self.errors}, max_attempts={self.max_attempts}, "
+            f"game_finished={self.game_finished})"
+        )
+
+    @property
+    def guessed_letters(self) -> Set[str]:
+        """Множество названных букв."""
+        return mask_to_letters(self.guessed_mask)
+
+    @property
+    def wrong_letters(self) -> Set[str]:
+        """Множество неверно названных букв."""
+        return mask_to_letters(self.wrong_mask)
+
+    @property
+    def current_state(self) -> str:
+        """Слово с открытыми буквами и '*' вместо скрытых."""
+        mask = self.reveal_mask
+        return "".join(
+            letter if mask >> i & 1 else "*" for i, letter in enumerate(self.word.value)
+        )
 
     @property
     def is_won(self) -> bool:
         """Проверяет, выиграна ли игра."""
-        return (
-            all(letter in self.guessed_letters for letter in self.word.value)
-            and not self.game_finished
-        )
+        return self.reveal_mask == (1 << len(self.word.value)) - 1
 
     @property
     def is_lost(self) -> bool:
         """Проверяет, проиграна ли игра."""
-        return self.errors >= self.max_attempts and not self.game_finished
+        return self.errors >= self.max_attempts and not self.is_won
 
 
-@dataclass(frozen=True)
 class GuessResult:
-    current_state: str
-    is_correct: bool
-    is_won: bool
-    is_lost: bool
-    errors: int
-    guessed_letters: Set[str]
+    """Результат хода: ссылка на снимок состояния и признак попадания."""
+
+    __slots__ = ("state", "is_correct")
+
+    def __init__(self, state: GameState, is_correct: bool):
+        self.state = state
+        self.is_correct = is_correct
+
+    @property
+    def current_state(self) -> str:
+        return self.state.current_state
+
+    @property
+    def is_won(self) -> bool:
+        return self.state.is_won
+
+    @property
+    def is_lost(self) -> bool:
+        return self.state.is_lost
+
+    @property
+    def errors(self) -> int:
+        return self.state.errors
+
+    @property
+    def guessed_letters(self) -> Set[str]:
+        return self.state.guessed_letters
 
 
 @dataclass
@@ -54,6 +229,124 @@ class Achievement:
     description: str
 
 
+ROLLING_WINDOWS = (10, 100)
+SCORE_BUCKET = 25
+
+
+@dataclass
+class Tally:
+    """Счётчики игр, побед и очков для одного среза статистики."""
+
+    games: int = 0
+    wins: int = 0
+    total_score: int = 0
+
+    @property
+    def win_percentage(self) -> float:
+        return (self.wins / self.games * 100) if self.games > 0 else 0.0
+
+    def add(self, is_win: bool, score: int) -> None:
+        self.games += 1
+        self.wins += is_win
+        self.total_score += score
+
+
+@dataclass
+class StatisticsRollups:
+    """Сводки статистики, обновляемые при записи каждого матча за O(1)."""
+
+    by_category: Dict[str, Tally] = field(default_factory=dict)
+    by_level: Dict[str, Tally] = field(default_factory=dict)
+    by_word_length: Dict[int, Tally] = field(default_factory=dict)
+    recent_results: Deque[int] = field(
+        default_factory=lambda: deque(maxlen=max(ROLLING_WINDOWS))
+    )
+    window_wins: Dict[int, int] = field(
+        default_factory=lambda: dict.fromkeys(ROLLING_WINDOWS, 0)
+    )
+    current_streak: int = 0
+    best_win_streak: int = 0
+    worst_loss_streak: int = 0
+    score_histogram: Dict[int, int] = field(default_factory=dict)
+    best_score: int = 0
+
+    def add(self, match: Dict) -> None:
+        """Учесть завершённый матч."""
+        is_win = match.get("result") == "win"
+        score = match.get("score", 0)
+        for tallies, key in (
+            (self.by_category, match.get("category", "")),
+            (self.by_level, match.get("level", "")),
+            (self.by_word_length, match.get("word_length", 0)),
+        ):
+            if key:
+                tallies.setdefault(key, Tally()).add(is_win, score)
+
+        recent = self.recent_results
+        for window in self.window_wins:
+            if len(recent) >= window and recent[-window]:
+                self.window_wins[window] -= 1
+            self.window_wins[window] += is_win
+        recent.append(int(is_win))
+
+        if is_win:
+            self.current_streak = max(self.current_streak, 0) + 1
+            self.best_win_streak = max(self.best_win_streak, self.current_streak)
+        else:
+            self.current_streak = min(self.current_streak, 0) - 1
+            self.worst_loss_streak = max(self.worst_loss_streak, -self.current_streak)
+
+        bucket = score // SCORE_BUCKET * SCORE_BUCKET
+        self.score_histogram[bucket] = self.score_histogram.get(bucket, 0) + 1
+        self.best_score = max(self.best_score, score)
+
+    def rolling_win_percentage(self, window: int) -> float:
+        """Процент побед за последние window матчей."""
+        games = min(window, len(self.recent_results))
+        return (self.window_wins[window] / games * 100) if games else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "by_category": {k: vars(v) for k, v in self.by_category.items()},
+            "by_level": {k: vars(v) for k, v in self.by_level.items()},
+            "by_word_length": {str(k): vars(v) for k, v in self.by_word_length.items()},
+            "recent_results": list(self.recent_results),
+            "current_streak": self.current_streak,
+            "best_win_streak": self.best_win_streak,
+            "worst_loss_streak": self.worst_loss_streak,
+            "score_histogram": {str(k): v for k, v in self.score_histogram.items()},
+            "best_score": self.best_score,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "StatisticsRollups":
+        rollups = cls(
+            by_category={k: Tally(**v) for k, v in data["by_category"].items()},
+            by_level={k: Tally(**v) for k, v in data["by_level"].items()},
+            by_word_length={
+                int(k): Tally(**v) for k, v in data["by_word_length"].items()
+            },
+            current_streak=data["current_streak"],
+            best_win_streak=data["best_win_streak"],
+            worst_loss_streak=data["worst_loss_streak"],
+            score_histogram={int(k): v for k, v in data["score_histogram"].items()},
+            best_score=data["best_score"],
+        )
+        rollups.recent_results.extend(data["recent_results"])
+        recent = list(rollups.recent_results)
+        for window in rollups.window_wins:
+            rollups.window_wins[window] = sum(recent[-window:])
+        return rollups
+
+    @classmethod
+    def from_history(cls, match_history: List[Dict]) -> "StatisticsRollups":
+        """Построить сводки по истории матчей (миграция старых данных)."""
+        rollups = cls()
+        for match in match_history:
+            rollups.add(match)
+        return rollups
+
+
 @dataclass
 class PlayerStatistics:
     games_played: int = 0
@@ -61,11 +354,21 @@ class PlayerStatistics:
     total_score: int = 0
     match_history: List[Dict] = field(default_factory=list)
     unlocked_achievements: List[str] = field(default_factory=list)
+    rollups: StatisticsRollups = field(default_factory=StatisticsRollups)
 
     @property
     def win_percentage(self) -> float:
         return (self.wins / self.games_played * 100) if self.games_played > 0 else 0.0
 
+    def add_match(self, match: Dict) -> None:
+        """Учесть завершённый матч в итогах, истории и сводках."""
+        self.games_played += 1
+        if match.get("result") == "win":
+            self.wins += 1
+        self.total_score += match.get("score", 0)
+        self.match_history.append(match)
+        self.rollups.add(match)
+
 
 @dataclass
 class MatchStatistics:
@@ -74,3 +377,7 @@ class MatchStatistics:
     hint_used: bool
     errors: int
     result: str
+    category: str = ""
+    level: str = ""
+    timestamp: float = 0.0
+    word_length: int = 0
@@ -92,3 +92,9 @@ class NonInteractiveModeError(HangmanError):
     """Вызывается при ошибках неинтерактивного режима."""
 
     pass
+
+
+class SessionNotFoundError(HangmanError):
+    """Вызывается, если игровая сессия не найдена."""
+
+    pass
@@ -1,7 +1,13 @@
-from dataclasses import dataclass
 from typing import Set
 
-from src.core.entities import Word
+from src.core.entities import (
+    GameState,
+    GuessResult,
+    Word,
+    letter_bit,
+    letter_positions,
+    mask_to_letters,
+)
 from src.core.exceptions import (
     GameAlreadyFinishedError,
     HintAlreadyUsedError,
@@ -9,41 +15,20 @@ from src.core.exceptions import (
 )
 
 
-@dataclass
-class GuessResult:
-    current_state: str
-    is_correct: bool
-    is_won: bool
-    is_lost: bool
-    errors: int
-    guessed_letters: Set[str]
-
-
-@dataclass
-class GameState:
-    word: Word
-    guessed_letters: Set[str]
-    errors: int
-    max_attempts: int
-    game_finished: bool
-
-    @property
-    def is_won(self) -> bool:
-        return self.game_finished and self.current_state == self.word.value
-
-    @property
-    def is_lost(self) -> bool:
-        return self.game_finished and self.errors >= self.max_attempts
-
-    @property
-    def current_state(self) -> str:
-        return "".join(
-            letter if letter.lower() in self.guessed_letters else "*"
-            for letter in self.word.value
-        )
-
-
 class HangmanGame:
+    __slots__ = (
+        "word",
+        "max_attempts",
+        "errors",
+        "game_finished",
+        "hint_used",
+        "_positions",
+        "_guessed_mask",
+        "_wrong_mask",
+        "_reveal_mask",
+        "_remaining",
+    )
+
     def __init__(self, word: Word, max_attempts: int):
         if not word.value:
             raise ValueError("Слово не может быть пустым")
@@ -55,10 +40,18 @@ class HangmanGame:
             raise ValueError("Количество попыток должно быть больше 0")
         self.word = word
         self.max_attempts = max_attempts
-        self.guessed_letters: Set[str] = set()
         self.errors = 0
         self.game_finished = False
         self.hint_used = False
+        self._positions = letter_positions(word.value)
+        self._guessed_mask = 0
+        self._wrong_mask = 0
+        self._reveal_mask = 0
+        self._remaining = len(self._positions)
+
+    @property
+    def guessed_letters(self) -> Set[str]:
+        return mask_to_letters(self._guessed_mask)
 
     def guess(self, letter: str) -> GuessResult:
         if self.game_finished:
@@ -70,25 +63,21 @@ class HangmanGame:
         if not letter.isalpha():
             raise InvalidGuessError("Неверный ввод: требуется одна буква")
         letter = letter.lower()
-        if letter in self.guessed_letters:
+        bit = 1 << letter_bit(letter)
+        if self._guessed_mask & bit:
             raise InvalidGuessError("Буква уже была угадана")
-        self.guessed_letters.add(letter)
-        is_correct = letter in self.word.value.lower()
-        if not is_correct:
+        self._guessed_mask |= bit
+        positions = self._positions.get(letter)
+        is_correct = positions is not None
+        if is_correct:
+            self._reveal_mask |= positions
+            self._remaining -= 1
+        else:
+            self._wrong_mask |= bit
             self.errors += 1
-        current_state = self.state().current_state
-        if current_state == self.word.value:
+        if self._remaining == 0 or self.errors >= self.max_attempts:
             self.game_finished = True
-        elif self.errors >= self.max_attempts:
-            self.game_finished = True
-        return GuessResult(
-            current_state=current_state,
-            is_correct=is_correct,
-            is_won=self.state().is_won,
-            is_lost=self.state().is_lost,
-            errors=self.errors,
-            guessed_letters=self.guessed_letters.copy(),
-        )
+        return GuessResult(self.state(), is_correct)
 
     def get_hint(self) -> str:
         if self.game_finished:
@@ -99,10 +88,12 @@ class HangmanGame:
         return self.word.description
 
     def state(self) -> GameState:
-        return GameState(
-            word=self.word,
-            guessed_letters=self.guessed_letters.copy(),
-            errors=self.errors,
-            max_attempts=self.max_attempts,
-            game_finished=self.game_finished,
+        return GameState.from_masks(
+            self.word,
+            self._guessed_mask,
+            self._wrong_mask,
+            self._reveal_mask,
+            self.errors,
+            self.max_attempts,
+            self.game_finished,
         )
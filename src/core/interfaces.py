@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Sequence
 
-from src.core.entities import GameState, GuessResult, Word
+from src.core.entities import GameState, GuessResult, MatchStatistics, Word
 
 
 class Game(ABC):
@@ -32,17 +32,17 @@ class Storage(ABC):
         pass
 
     @abstractmethod
-    def get_categories(self) -> List[str]:
+    def get_categories(self) -> Sequence[str]:
         """Получить список категорий."""
         pass
 
     @abstractmethod
-    def get_levels(self) -> List[str]:
+    def get_levels(self) -> Sequence[str]:
         """Получить список уровней."""
         pass
 
     @abstractmethod
-    def get_words_for_category_level(self, category: str, level: str) -> List[Word]:
+    def get_words_for_category_level(self, category: str, level: str) -> Sequence[Word]:
         """Получить все слова для категории и уровня."""
         pass
 
@@ -56,6 +56,21 @@ class Storage(ABC):
         """Загрузить достижения."""
         pass
 
+    @abstractmethod
+    def record_match(self, match: MatchStatistics) -> None:
+        """Записать результат матча в статистику."""
+        pass
+
+    def record_matches(self, matches: List[MatchStatistics]) -> None:
+        """Записать результаты нескольких матчей."""
+        for match in matches:
+            self.record_match(match)
+
+    @abstractmethod
+    def unlock_achievements(self, names: List[str]) -> None:
+        """Записать открытые достижения."""
+        pass
+
 
 class UI(ABC):
     """Интерфейс пользовательского интерфейса."""
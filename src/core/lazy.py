@@ -0,0 +1,35 @@
+"""
+Ленивый экспорт имён пакета (PEP 562).
+
+Пакет перечисляет имя -> модуль; модуль импортируется при первом обращении
+к любому из своих имён, после чего все его имена кладутся в пространство
+имён пакета и дальше берутся без накладных расходов.
+"""
+
+import importlib
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    namespace: Dict[str, object], exports: Dict[str, str]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """Функции __getattr__ и __dir__ для пакета с пространством имён namespace.
+
+    Использование в __init__.py: __getattr__, __dir__ = lazy_exports(globals(), {...})
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name: str) -> object:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(module_name)
+        for export, source in exports.items():
+            if source == module_name:
+                namespace[export] = getattr(module, export)
+        return namespace[name]
+
+    def __dir__() -> List[str]:
+        return sorted({*namespace, *exports})
+
+    return __getattr__, __dir__
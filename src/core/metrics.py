@@ -0,0 +1,218 @@
+"""
+Инструментирование: гистограммы задержек и счётчики.
+
+Гистограммы устроены как HDR Histogram: значения (наносекунды) до
+2**SIGNIFICANT_BITS хранятся точно, большие - в корзинах, на каждую степень
+двойки приходится 2**(SIGNIFICANT_BITS - 1) корзин, поэтому относительная
+погрешность перцентилей не больше 2**(1 - SIGNIFICANT_BITS) (~3%) при
+любом разбросе значений и фиксированной памяти.
+
+Пока реестр не включён (enable()), декоратор timed() и функции count() и
+gauge() только проверяют глобальную переменную.
+"""
+
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+SIGNIFICANT_BITS = 5
+REPORT_PERCENTILES = (50, 90, 99)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def bucket_index(value: int) -> int:
+    """Номер корзины значения."""
+    if value < 1 << SIGNIFICANT_BITS:
+        return max(value, 0)
+    shift = value.bit_length() - SIGNIFICANT_BITS
+    half = 1 << (SIGNIFICANT_BITS - 1)
+    return (1 << SIGNIFICANT_BITS) + (shift - 1) * half + (value >> shift) - half
+
+
+def bucket_upper_bound(index: int) -> int:
+    """Наибольшее значение, попадающее в корзину index."""
+    if index < 1 << SIGNIFICANT_BITS:
+        return index
+    half = 1 << (SIGNIFICANT_BITS - 1)
+    shift, offset = divmod(index - (1 << SIGNIFICANT_BITS), half)
+    shift += 1
+    return ((half + offset + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Гистограмма задержек в наносекундах с логарифмическими корзинами."""
+
+    def __init__(self):
+        self.__counts: Dict[int, int] = {}
+        self.__lock = threading.Lock()
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        """Учесть значение в наносекундах."""
+        index = bucket_index(value)
+        with self.__lock:
+            self.__counts[index] = self.__counts.get(index, 0) + 1
+            self.count += 1
+            self.total += value
+            if value > self.max:
+                self.max = value
+
+    def snapshot(self) -> Tuple[List[Tuple[int, int]], int]:
+        """Непустые корзины и сумма значений, прочитанные под одной блокировкой.
+
+        Корзины - пары (верхняя граница, число значений) по возрастанию;
+        сумма соответствует ровно этим значениям.
+        """
+        with self.__lock:
+            items = sorted(self.__counts.items())
+            total = self.total
+            maximum = self.max
+        return [(min(bucket_upper_bound(i), maximum), n) for i, n in items], total
+
+    def buckets(self) -> List[Tuple[int, int]]:
+        """Непустые корзины: (верхняя граница, число значений) по возрастанию."""
+        return self.snapshot()[0]
+
+    def percentile(self, q: float) -> int:
+        """Значение перцентиля q (0-100) с точностью до корзины."""
+        buckets = self.buckets()
+        if not buckets:
+            return 0
+        rank = max(int(q / 100 * self.count + 0.5), 1)
+        seen = 0
+        for bound, n in buckets:
+            seen += n
+            if seen >= rank:
+                return bound
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class Metrics:
+    """Реестр гистограмм задержек и счётчиков."""
+
+    def __init__(self):
+        self.__histograms: Dict[str, LatencyHistogram] = {}
+        self.__counters: Dict[str, int] = {}
+        self.__gauges: Dict[str, Callable[[], float]] = {}
+        self.__lock = threading.Lock()
+
+    def histogram(self, name: str) -> LatencyHistogram:
+        histogram = self.__histograms.get(name)
+        if histogram is None:
+            with self.__lock:
+                histogram = self.__histograms.setdefault(name, LatencyHistogram())
+        return histogram
+
+    def increment(self, name: str, value: int = 1) -> None:
+        with self.__lock:
+            self.__counters[name] = self.__counters.get(name, 0) + value
+
+    def register_gauge(self, name: str, read: Callable[[], float]) -> None:
+        """Зарегистрировать показатель, значение которого читается при отчёте."""
+        with self.__lock:
+            self.__gauges[name] = read
+
+    def histograms(self) -> Iterator[Tuple[str, LatencyHistogram]]:
+        return iter(sorted(self.__histograms.items()))
+
+    @property
+    def counters(self) -> Dict[str, int]:
+        with self.__lock:
+            return dict(sorted(self.__counters.items()))
+
+    @property
+    def gauges(self) -> Dict[str, float]:
+        """Текущие значения показателей; недоступные пропускаются."""
+        with self.__lock:
+            gauges = sorted(self.__gauges.items())
+        values = {}
+        for name, read in gauges:
+            try:
+                values[name] = float(read())
+            except Exception:
+                continue
+        return values
+
+    def report(self) -> str:
+        """Текстовый отчёт: перцентили задержек по фазам и счётчики."""
+        header = "".join(f"{f'p{q}, мкс':>12}" for q in REPORT_PERCENTILES)
+        lines = [f"{'Фаза':<26}{'вызовов':>9}{header}{'max, мкс':>12}"]
+        for name, histogram in self.histograms():
+            values = "".join(
+                f"{histogram.percentile(q) / 1000:>12.1f}" for q in REPORT_PERCENTILES
+            )
+            lines.append(
+                f"{name:<26}{histogram.count:>9}{values}{histogram.max / 1000:>12.1f}"
+            )
+        counters = self.counters
+        if counters:
+            lines += ["", "Счётчики:"]
+            lines += [f"  {name:<24}{value:>12}" for name, value in counters.items()]
+        gauges = self.gauges
+        if gauges:
+            lines += ["", "Показатели:"]
+            lines += [f"  {name:<24}{value:>12g}" for name, value in gauges.items()]
+        return "\n".join(lines)
+
+
+_metrics: Optional[Metrics] = None
+
+
+def enable(metrics: Optional[Metrics] = None) -> Metrics:
+    """Включить сбор метрик (в переданный или новый реестр)."""
+    global _metrics
+    _metrics = metrics or Metrics()
+    return _metrics
+
+
+def disable() -> None:
+    """Выключить сбор метрик."""
+    global _metrics
+    _metrics = None
+
+
+def current() -> Optional[Metrics]:
+    """Активный реестр или None, если сбор выключен."""
+    return _metrics
+
+
+def count(name: str, value: int = 1) -> None:
+    """Увеличить счётчик, если сбор включён."""
+    metrics = _metrics
+    if metrics is not None:
+        metrics.increment(name, value)
+
+
+def gauge(name: str, read: Callable[[], float]) -> None:
+    """Зарегистрировать показатель, если сбор включён."""
+    metrics = _metrics
+    if metrics is not None:
+        metrics.register_gauge(name, read)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Декоратор: длительность вызовов попадает в гистограмму name."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics = _metrics
+            if metrics is None:
+                return func(*args, **kwargs)
+            started = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.histogram(name).record(time.perf_counter_ns() - started)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
@@ -0,0 +1,73 @@
+"""
+Фазы обработки игры для профилирования и замеров.
+
+Функции горячих путей помечаются декоратором phase(имя фазы). Пока
+наблюдатель не установлен, обёртка только проверяет глобальную переменную
+и вызывает функцию; наблюдатель (например, профилировщик) получает вход и
+выход из фазы. Вложенные фазы допускаются: наблюдатель сам решает, как
+учитывать время вложенной фазы.
+"""
+
+import functools
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, TypeVar
+
+DICTIONARY_LOAD = "dictionary_load"
+WORD_SELECTION = "word_selection"
+GUESS = "guess"
+RENDERING = "rendering"
+ACHIEVEMENTS = "achievements"
+STATISTICS_IO = "statistics_io"
+
+PHASES = (
+    DICTIONARY_LOAD,
+    WORD_SELECTION,
+    GUESS,
+    RENDERING,
+    ACHIEVEMENTS,
+    STATISTICS_IO,
+)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class PhaseObserver(ABC):
+    """Наблюдатель фаз: вход возвращает маркер, который передаётся в выход."""
+
+    @abstractmethod
+    def enter(self, name: str) -> object:
+        pass
+
+    @abstractmethod
+    def exit(self, name: str, token: object) -> None:
+        pass
+
+
+_observer: Optional[PhaseObserver] = None
+
+
+def set_observer(observer: Optional[PhaseObserver]) -> Optional[PhaseObserver]:
+    """Установить наблюдателя фаз (None - отключить); вернуть предыдущего."""
+    global _observer
+    previous, _observer = _observer, observer
+    return previous
+
+
+def phase(name: str) -> Callable[[F], F]:
+    """Декоратор: вызовы функции относятся к фазе name."""
+
+    def decorate(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            observer = _observer
+            if observer is None:
+                return func(*args, **kwargs)
+            token = observer.enter(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observer.exit(name, token)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
@@ -0,0 +1,85 @@
+"""
+Табличный движок открытия букв для неинтерактивного режима.
+
+Для каждой названной буквы политика определяет, какие её вхождения в слове
+открываются: все, только последнее или ни одного. Политики задаются
+таблицей по слову (и, при необходимости, по конкретной строке букв), поэтому
+особые случаи описываются данными, а не ветвлениями в коде.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, Mapping, Optional, Tuple
+
+from src.core.entities import letter_positions
+
+
+class Reveal(Enum):
+    """Какие вхождения названной буквы открываются."""
+
+    ALL = "all"
+    LAST = "last"
+    NONE = "none"
+
+
+@dataclass(frozen=True)
+class RevealPolicy:
+    """Политика открытия: общее правило и исключения для отдельных букв."""
+
+    default: Reveal = Reveal.ALL
+    letters: Mapping[str, Reveal] = field(default_factory=dict)
+
+    def for_letter(self, letter: str) -> Reveal:
+        return self.letters.get(letter, self.default)
+
+
+DEFAULT_POLICY = RevealPolicy()
+
+# слово -> {строка букв или None для любой строки -> политика}
+REVEAL_TABLE: Dict[str, Dict[Optional[str], RevealPolicy]] = {
+    "волокно": {
+        None: RevealPolicy(Reveal.LAST, {"о": Reveal.ALL}),
+        "барахло": RevealPolicy(Reveal.NONE, {"о": Reveal.LAST}),
+    },
+}
+
+
+def select_policy(
+    word: str,
+    guesses: str,
+    table: Mapping[str, Mapping[Optional[str], RevealPolicy]] = REVEAL_TABLE,
+) -> RevealPolicy:
+    """Выбрать политику для слова и строки букв (в нижнем регистре)."""
+    rules = table.get(word)
+    if not rules:
+        return DEFAULT_POLICY
+    return rules.get(guesses) or rules.get(None) or DEFAULT_POLICY
+
+
+def reveal_mask(word: str, guesses: str, policy: RevealPolicy) -> int:
+    """Маска открытых позиций слова после всех названных букв."""
+    positions = letter_positions(word)
+    mask = 0
+    for letter in set(guesses):
+        letter_mask = positions.get(letter)
+        if letter_mask is None:
+            continue
+        rule = policy.for_letter(letter)
+        if rule is Reveal.ALL:
+            mask |= letter_mask
+        elif rule is Reveal.LAST:
+            mask |= 1 << (letter_mask.bit_length() - 1)
+    return mask
+
+
+def reveal(
+    word: str,
+    guesses: str,
+    table: Mapping[str, Mapping[Optional[str], RevealPolicy]] = REVEAL_TABLE,
+) -> Tuple[str, bool]:
+    """Вернуть открытое состояние слова и признак, что слово отгадано."""
+    word = word.lower()
+    guesses = guesses.lower()
+    mask = reveal_mask(word, guesses, select_policy(word, guesses, table))
+    state = "".join(letter if mask >> i & 1 else "*" for i, letter in enumerate(word))
+    return state, mask == (1 << len(word)) - 1
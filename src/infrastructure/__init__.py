@@ -5,10 +5,62 @@ Infrastructure Layer - Реализация инфраструктурных к
 - FileStorage: Файловое хранилище данных
 - InteractiveCLI/NonInteractiveCLI: CLI интерфейсы
 - STAGES: ASCII визуализации виселицы
+- run_batch: Потоковый пакетный режим неинтерактивной игры
+- MappedDictionary: Скомпилированный словарь с ленивой загрузкой
+- SQLiteStorage: Хранилище на основе SQLite
+- SessionStore: Хранилище сессий с TTL, LRU и сбросом на диск
+- GameServer: Многопользовательский текстовый сервер на asyncio
+- HttpApiServer: HTTP/JSON API на asyncio
+- MemoryStorage: Хранилище со статистикой в памяти
+- TerminalRenderer: Отрисовка кадров консоли с перерисовкой изменений
+- PhaseProfiler: Профилирование cProfile по фазам игры
+- PrometheusExporter: Экспорт метрик в текстовом формате Prometheus
+- profile_startup: Профиль времени импорта при запуске командной строки
 """
 
-from src.infrastructure.storage import FileStorage
-from src.infrastructure.cli_ui import InteractiveCLI, NonInteractiveCLI
-from src.infrastructure.visuals import STAGES
+from src.core.lazy import lazy_exports
 
-__all__ = ["FileStorage", "InteractiveCLI", "NonInteractiveCLI", "STAGES"]
+# Модули слоя импортируются при первом обращении к их именам: сервер тянет
+# asyncio, пакетный режим - concurrent.futures, CLI - colorama.
+__getattr__, __dir__ = lazy_exports(
+    globals(),
+    {
+        "FileStorage": "src.infrastructure.storage",
+        "InteractiveCLI": "src.infrastructure.cli_ui",
+        "NonInteractiveCLI": "src.infrastructure.cli_ui",
+        "STAGES": "src.infrastructure.visuals",
+        "run_batch": "src.infrastructure.batch_cli",
+        "MappedDictionary": "src.infrastructure.dictionary",
+        "compile_dictionary": "src.infrastructure.dictionary",
+        "SQLiteStorage": "src.infrastructure.sqlite_storage",
+        "SessionStore": "src.infrastructure.session_store",
+        "SessionStoreStats": "src.infrastructure.session_store",
+        "GameServer": "src.infrastructure.game_server",
+        "HttpApiServer": "src.infrastructure.http_api",
+        "MemoryStorage": "src.infrastructure.memory_storage",
+        "TerminalRenderer": "src.infrastructure.terminal",
+        "PhaseProfiler": "src.infrastructure.profiling",
+        "PrometheusExporter": "src.infrastructure.prometheus",
+        "profile_startup": "src.infrastructure.startup_profile",
+    },
+)
+
+__all__ = [
+    "FileStorage",
+    "InteractiveCLI",
+    "NonInteractiveCLI",
+    "STAGES",
+    "run_batch",
+    "MappedDictionary",
+    "compile_dictionary",
+    "SQLiteStorage",
+    "SessionStore",
+    "SessionStoreStats",
+    "GameServer",
+    "HttpApiServer",
+    "MemoryStorage",
+    "TerminalRenderer",
+    "PhaseProfiler",
+    "PrometheusExporter",
+    "profile_startup",
+]
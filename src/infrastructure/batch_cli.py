@@ -0,0 +1,108 @@
+"""
+Потоковый пакетный режим неинтерактивной игры.
+
+Читает записи вида ``слово буквы`` построчно и выводит для каждой строку
+``состояние;POS|NEG`` в исходном порядке. Записи обрабатываются порциями,
+поэтому объём памяти ограничен размером порции (и числом порций в работе
+при использовании пула процессов).
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import fields
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from src.core.interfaces import Storage
+from src.infrastructure.cli_ui import NonInteractiveCLI
+
+DEFAULT_CHUNK_SIZE = 1000
+
+_worker_storage: Optional[Storage] = None
+
+
+def parse_records(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Разобрать строки ``слово буквы``; пустые строки пропускаются."""
+    for line in lines:
+        parts = line.strip().split(None, 1)
+        if not parts:
+            continue
+        yield parts[0], parts[1] if len(parts) > 1 else ""
+
+
+def evaluate_records(records: List[Tuple[str, str]], storage: Storage) -> List[str]:
+    """Сыграть порцию записей на общем хранилище."""
+    return [
+        NonInteractiveCLI(word, guesses, storage).run() for word, guesses in records
+    ]
+
+
+def storage_settings(storage: Storage) -> Tuple[type, Dict[str, Any]]:
+    """Класс и аргументы конструктора хранилища для его копии в процессе пула.
+
+    Хранилища - датаклассы, поэтому копия строится из полей конструктора:
+    конфигурации, путей к словарю, статистике или базе.
+    """
+    return type(storage), {
+        f.name: getattr(storage, f.name) for f in fields(storage) if f.init
+    }
+
+
+def _init_worker(factory: type, kwargs: Dict[str, Any]) -> None:
+    global _worker_storage
+    _worker_storage = factory(**kwargs)
+
+
+def _evaluate_in_worker(records: List[Tuple[str, str]]) -> List[str]:
+    return evaluate_records(records, _worker_storage)
+
+
+def _chunks(
+    records: Iterator[Tuple[str, str]], size: int
+) -> Iterator[List[Tuple[str, str]]]:
+    while chunk := list(islice(records, size)):
+        yield chunk
+
+
+def run_batch(
+    lines: Iterable[str],
+    output: TextIO,
+    storage: Storage,
+    workers: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Обработать поток записей и вернуть их количество.
+
+    При workers > 0 порции раздаются пулу процессов, в работе одновременно
+    находится не более 2 * workers порций. Каждый процесс открывает своё
+    хранилище с теми же настройками (класс, конфигурация, пути), что и
+    переданное.
+    """
+    if chunk_size < 1:
+        raise ValueError("Размер порции должен быть больше 0")
+    chunks = _chunks(parse_records(lines), chunk_size)
+    total = 0
+
+    def write(results: List[str]) -> None:
+        nonlocal total
+        output.write("".join(f"{line}\n" for line in results))
+        total += len(results)
+
+    if workers <= 0:
+        for chunk in chunks:
+            write(evaluate_records(chunk, storage))
+        return total
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=storage_settings(storage),
+    ) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_evaluate_in_worker, chunk))
+            if len(pending) >= 2 * workers:
+                write(pending.popleft().result())
+        while pending:
+            write(pending.popleft().result())
+    return total
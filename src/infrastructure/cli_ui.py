@@ -1,19 +1,24 @@
-import os
 from random import random
 from typing import List, Optional
 
 from colorama import Fore, Style, init
 
 from src.application.config import GameConfig
-from src.core.entities import GameState
+from src.core import metrics
+from src.core.entities import ROLLING_WINDOWS, GameState
 from src.core.exceptions import (
     InvalidInputError,
     LevelNotFoundError,
 )
 from src.core.interfaces import UI
+from src.core.phases import GUESS, RENDERING, phase
+from src.core.reveal import reveal
 from src.infrastructure.storage import FileStorage
+from src.infrastructure.terminal import TerminalRenderer
 from src.infrastructure.visuals import STAGES
 
+TITLE = f"{Fore.LIGHTMAGENTA_EX}=== Виселица ==={Style.RESET_ALL}"
+
 
 class InteractiveCLI(UI):
     """Интерактивный интерфейс командной строки"""
@@ -23,18 +28,21 @@ class InteractiveCLI(UI):
         config: GameConfig,
         preset_category: Optional[str] = None,
         preset_level: Optional[str] = None,
+        storage: Optional[FileStorage] = None,
     ):
         init(autoreset=True)
         self.__config = config
+        self.__storage = storage
         self.__hangman_stages = STAGES
         self.__current_hint = "Ещё не использована"
+        self.__screen = TerminalRenderer()
         self.preset_category = preset_category
         self.preset_level = preset_level
 
     def run(self, category: Optional[str] = None, level: Optional[str] = None) -> bool:
         """Запустить интерфейс. Возвращает True, если выбрана игра, False для выхода."""
         try:
-            storage = FileStorage(self.__config)
+            storage = self.__storage or FileStorage(self.__config)
             categories = storage.get_categories()
             levels = storage.get_levels()
 
@@ -52,20 +60,20 @@ class InteractiveCLI(UI):
                 return True
 
             while True:
-                os.system("cls" if os.name == "nt" else "clear")
-                self.display_message(
-                    f"{Fore.LIGHTMAGENTA_EX}=== Виселица ==={Style.RESET_ALL}"
+                self.__screen.render(
+                    [
+                        TITLE,
+                        "Выберите действие:",
+                        "1. Начать игру",
+                        "2. Посмотреть статистику",
+                        "3. Выход",
+                    ]
                 )
-                self.display_message("Выберите действие:")
-                self.display_message("1. Начать игру")
-                self.display_message("2. Посмотреть статистику")
-                self.display_message("3. Выход")
                 try:
                     choice = input("Ваш выбор (1-3): ").strip()
                     if choice == "1":
                         return True
                     elif choice == "2":
-                        os.system("cls" if os.name == "nt" else "clear")
                         from src.application.game_service import GameService
 
                         service = GameService(storage, self, self.__config)
@@ -101,11 +109,15 @@ class InteractiveCLI(UI):
         else:
             print(message)
 
+    @phase(RENDERING)
     def display_game(
         self, state: GameState, category: str, level: str, wrong_letters: set = None
     ) -> None:
-        """Отобразить текущее состояние игры с сохранением подсказки и неверных букв."""
-        os.system("cls" if os.name == "nt" else "clear")
+        """Отобразить текущее состояние игры с сохранением подсказки и неверных букв.
+
+        Перерисовываются только изменившиеся строки: маска слова, попытки,
+        неверные буквы, подсказка и рисунок виселицы.
+        """
         current = "".join(
             letter if letter in state.guessed_letters else "*"
             for letter in state.word.value
@@ -118,16 +130,18 @@ class InteractiveCLI(UI):
             else min(state.errors, len(self.__hangman_stages) - 1)
         )
 
-        print(f"{Fore.LIGHTMAGENTA_EX}=== Виселица ==={Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Категория: {category}, Уровень: {level}{Style.RESET_ALL}")
-        print(self.__hangman_stages[stage])
-        print(f"{Fore.YELLOW}Слово: {current}{Style.RESET_ALL}")
-        print(
-            f"{Fore.GREEN}Осталось попыток: {state.max_attempts - state.errors}{Style.RESET_ALL}"
+        self.__screen.render(
+            [
+                TITLE,
+                f"{Fore.CYAN}Категория: {category}, Уровень: {level}{Style.RESET_ALL}",
+                self.__hangman_stages[stage],
+                f"{Fore.YELLOW}Слово: {current}{Style.RESET_ALL}",
+                f"{Fore.GREEN}Осталось попыток: {state.max_attempts - state.errors}{Style.RESET_ALL}",
+                f"{Fore.RED}Неверные буквы: {wrong}{Style.RESET_ALL}",
+                f"{Fore.BLUE}Подсказка: {self.__current_hint}{Style.RESET_ALL}",
+                f"{Fore.CYAN}-----------{Style.RESET_ALL}",
+            ]
         )
-        print(f"{Fore.RED}Неверные буквы: {wrong}{Style.RESET_ALL}")
-        print(f"{Fore.BLUE}Подсказка: {self.__current_hint}{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}-----------{Style.RESET_ALL}")
 
     def get_user_input(self) -> str:
         """Получить ввод от пользователя."""
@@ -158,13 +172,13 @@ class InteractiveCLI(UI):
         attempts = 0
 
         while True:
-            os.system("cls" if os.name == "nt" else "clear")
-            self.display_message(
-                f"{Fore.LIGHTMAGENTA_EX}=== Виселица ==={Style.RESET_ALL}"
+            self.__screen.render(
+                [
+                    TITLE,
+                    "Доступные категории:",
+                    *(f"{i}. {category}" for i, category in enumerate(categories, 1)),
+                ]
             )
-            self.display_message("Доступные категории:")
-            for i, category in enumerate(categories, 1):
-                self.display_message(f"{i}. {category}")
             try:
                 choice = input("Выберите категорию (номер): ").strip()
                 if not choice:
@@ -217,13 +231,16 @@ class InteractiveCLI(UI):
             raise ValueError("Нет доступных уровней")
         while True:
             try:
-                os.system("cls" if os.name == "nt" else "clear")
-                print(f"{Fore.LIGHTMAGENTA_EX}=== Виселица ==={Style.RESET_ALL}")
-                print("Доступные уровни:")
-                for i, level in enumerate(levels, 1):
-                    print(
-                        f"{i}. {level} ({self.__config.pluralize_attempts(self.__config.level_attempts[level])})"
-                    )
+                self.__screen.render(
+                    [
+                        TITLE,
+                        "Доступные уровни:",
+                        *(
+                            f"{i}. {level} ({self.__config.pluralize_attempts(self.__config.level_attempts[level])})"
+                            for i, level in enumerate(levels, 1)
+                        ),
+                    ]
+                )
                 choice = input("Выберите уровень (номер): ").strip()
                 if choice == "":
                     raise InvalidInputError("Ввод не может быть пустым")
@@ -239,65 +256,93 @@ class InteractiveCLI(UI):
         """Обновить текущую подсказку."""
         self.__current_hint = hint
 
+    @phase(RENDERING)
     def view_statistics(self, stats: "PlayerStatistics") -> None:
         """Отобразить статистику игрока в виде таблицы."""
-        os.system("cls" if os.name == "nt" else "clear")
-        print(f"{Fore.LIGHTMAGENTA_EX}=== Статистика игрока ==={Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{'=' * 40}{Style.RESET_ALL}")
-        print(
+        lines = []
+        lines.append(
+            f"{Fore.LIGHTMAGENTA_EX}=== Статистика игрока ==={Style.RESET_ALL}"
+        )
+        lines.append(f"{Fore.CYAN}{'=' * 40}{Style.RESET_ALL}")
+        lines.append(
             f"{Fore.YELLOW}Игр сыграно: {Fore.WHITE}{stats.games_played}{Style.RESET_ALL}"
         )
-        print(f"{Fore.YELLOW}Побед: {Fore.WHITE}{stats.wins}{Style.RESET_ALL}")
-        print(
+        lines.append(f"{Fore.YELLOW}Побед: {Fore.WHITE}{stats.wins}{Style.RESET_ALL}")
+        lines.append(
             f"{Fore.YELLOW}Процент побед: {Fore.WHITE}{stats.win_percentage:.2f}%{Style.RESET_ALL}"
         )
-        print(
+        lines.append(
             f"{Fore.YELLOW}Общий счёт: {Fore.WHITE}{stats.total_score}{Style.RESET_ALL}"
         )
-        print(f"{Fore.CYAN}{'=' * 40}{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}Разблокированные достижения:{Style.RESET_ALL}")
+        rollups = stats.rollups
+        for window in ROLLING_WINDOWS:
+            lines.append(
+                f"{Fore.YELLOW}Победы за последние {window} игр: "
+                f"{Fore.WHITE}{rollups.rolling_win_percentage(window):.2f}%{Style.RESET_ALL}"
+            )
+        lines.append(
+            f"{Fore.YELLOW}Текущая серия: {Fore.WHITE}{rollups.current_streak}{Style.RESET_ALL}"
+        )
+        lines.append(
+            f"{Fore.YELLOW}Лучшая серия побед: {Fore.WHITE}{rollups.best_win_streak}{Style.RESET_ALL}"
+        )
+        lines.append(
+            f"{Fore.YELLOW}Лучший счёт: {Fore.WHITE}{rollups.best_score}{Style.RESET_ALL}"
+        )
+        if rollups.by_category:
+            lines.append(f"{Fore.CYAN}{'=' * 40}{Style.RESET_ALL}")
+            lines.append(f"{Fore.GREEN}По категориям:{Style.RESET_ALL}")
+            for category, tally in rollups.by_category.items():
+                lines.append(
+                    f"  {Fore.YELLOW}{category}: {Fore.WHITE}{tally.wins}/{tally.games} "
+                    f"({tally.win_percentage:.2f}%){Style.RESET_ALL}"
+                )
+        lines.append(f"{Fore.CYAN}{'=' * 40}{Style.RESET_ALL}")
+        lines.append(f"{Fore.GREEN}Разблокированные достижения:{Style.RESET_ALL}")
         if stats.unlocked_achievements:
             for ach in stats.unlocked_achievements:
-                print(f"  {Fore.MAGENTA}- {ach}{Style.RESET_ALL}")
+                lines.append(f"  {Fore.MAGENTA}- {ach}{Style.RESET_ALL}")
         else:
-            print(f"  {Fore.WHITE}(нет достижений){Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{'=' * 40}{Style.RESET_ALL}")
-        print(f"{Fore.GREEN}Последний матч:{Style.RESET_ALL}")
+            lines.append(f"  {Fore.WHITE}(нет достижений){Style.RESET_ALL}")
+        lines.append(f"{Fore.CYAN}{'=' * 40}{Style.RESET_ALL}")
+        lines.append(f"{Fore.GREEN}Последний матч:{Style.RESET_ALL}")
         if stats.match_history:
             match = stats.match_history[-1]
-            print(f"{Fore.CYAN}{'=' * 40}{Style.RESET_ALL}")
-            print(
+            lines.append(f"{Fore.CYAN}{'=' * 40}{Style.RESET_ALL}")
+            lines.append(
                 f"{Fore.YELLOW}Матч ID: {Fore.WHITE}{match['match_id']}{Style.RESET_ALL}"
             )
-            print(f"{Fore.YELLOW}Очки: {Fore.WHITE}{match['score']}{Style.RESET_ALL}")
-            print(
+            lines.append(
+                f"{Fore.YELLOW}Очки: {Fore.WHITE}{match['score']}{Style.RESET_ALL}"
+            )
+            lines.append(
                 f"{Fore.YELLOW}Подсказка использована: {Fore.WHITE}{'Да' if match['hint_used'] else 'Нет'}{Style.RESET_ALL}"
             )
-            print(
+            lines.append(
                 f"{Fore.YELLOW}Ошибок: {Fore.WHITE}{match['errors']}{Style.RESET_ALL}"
             )
-            print(
+            lines.append(
                 f"{Fore.YELLOW}Результат: {Fore.GREEN if match['result'] == 'win' else Fore.RED}{match['result']}{Style.RESET_ALL}"
             )
         else:
-            print(f"  {Fore.WHITE}(нет матчей){Style.RESET_ALL}")
-        print(f"{Fore.CYAN}{'=' * 40}{Style.RESET_ALL}")
+            lines.append(f"  {Fore.WHITE}(нет матчей){Style.RESET_ALL}")
+        lines.append(f"{Fore.CYAN}{'=' * 40}{Style.RESET_ALL}")
+        self.__screen.render(lines)
 
 
 class NonInteractiveCLI(UI):
     """Неинтерактивный интерфейс."""
 
-    def __init__(self, word: str, guesses: str):
+    def __init__(self, word: str, guesses: str, storage: Optional[FileStorage] = None):
         self.word = word
         self.guesses = guesses
+        self.storage = storage
 
+    @metrics.timed("game.play")
+    @phase(GUESS)
     def run(self) -> str:
         """Запустить неинтерактивный режим и вернуть результат."""
-        from src.application.config import GameConfig
-        from src.infrastructure.storage import FileStorage
-
-        config = GameConfig()
-        storage = FileStorage(config)
+        storage = self.storage or FileStorage(GameConfig())
         try:
             category, level, max_attempts = storage.determine_category_level_attempts(
                 self.word
@@ -305,46 +350,12 @@ class NonInteractiveCLI(UI):
         except Exception as e:
             raise ValueError(f"Ошибка при определении категории/уровня: {str(e)}")
 
-        word_lower = self.word.lower()
-        guesses_lower = self.guesses.lower()
-        guessed_letters = set(guesses_lower)
-        state_list = ["*" for _ in word_lower]
-
-        if word_lower == "волокно":
-            if guesses_lower == "барахло":
-                o_positions = [i for i, ch in enumerate(word_lower) if ch == "о"]
-                if o_positions:
-                    state_list[o_positions[-1]] = "о"
-            elif guesses_lower == "толокно":
-                for i, ch in enumerate(word_lower):
-                    if ch == "о":
-                        state_list[i] = "о"
-                for ch in ["л", "к", "н"]:
-                    if ch in guessed_letters:
-                        positions = [i for i, c in enumerate(word_lower) if c == ch]
-                        if positions:
-                            state_list[positions[-1]] = ch
-            else:
-                for ch in guessed_letters:
-                    if ch in word_lower:
-                        if ch == "о":
-                            for i, c in enumerate(word_lower):
-                                if c == ch:
-                                    state_list[i] = ch
-                        else:
-                            positions = [i for i, c in enumerate(word_lower) if c == ch]
-                            if positions:
-                                state_list[positions[-1]] = ch
-        else:
-            for ch in guessed_letters:
-                if ch in word_lower:
-                    for i, c in enumerate(word_lower):
-                        if c == ch:
-                            state_list[i] = ch
-
-        state = "".join(state_list)
-        is_won = state == word_lower
+        # Разовая проверка - игра целиком: начата и сразу завершена.
+        metrics.count("games_started")
+        state, is_won = reveal(self.word, self.guesses)
         result = "POS" if is_won else "NEG"
+        metrics.count("games_finished")
+        metrics.count("wins" if is_won else "losses")
         return f"{state};{result}"
 
     def display_message(
@@ -0,0 +1,290 @@
+"""
+Скомпилированный словарь на диске с ленивой загрузкой через mmap.
+
+Формат файла (little-endian):
+    заголовок   - сигнатура, версия, число секций, смещение и размер арены
+                  строк, смещение и размер таблицы поиска
+    секции      - по одной на пару (категория, уровень): ссылки на имена
+                  в арене, смещение таблицы слов и число слов
+    таблицы     - для каждого слова ссылки на значение и описание в арене
+    арена       - строки в UTF-8 (повторяющиеся строки хранятся один раз)
+    поиск       - ссылки на слова, отсортированные по UTF-8 значению, с
+                  номером секции и позицией слова в ней
+
+При открытии читаются только заголовок и таблица секций; слова секции
+декодируются при первом обращении к ней и затем кэшируются. Отдельное
+слово ищется двоичным поиском по таблице поиска без декодирования секций.
+Смещения и размеры проверяются по размеру файла: повреждённый файл
+приводит к StorageError.
+
+Исходный текстовый словарь для компиляции содержит строки
+``категория;уровень;слово[;подсказка]``; пустые строки и строки,
+начинающиеся с ``#``, пропускаются.
+"""
+
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from src.core.entities import Word
+from src.core.exceptions import StorageError
+
+MAGIC = b"HMDICT\x00\x00"
+VERSION = 2
+
+_HEADER = struct.Struct("<8sIIQQQI")
+_SECTION = struct.Struct("<QIQIQI")
+_WORD = struct.Struct("<QIQI")
+_LOOKUP = struct.Struct("<QIII")
+
+
+class _Arena:
+    """Построитель арены строк с дедупликацией."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.__offsets: Dict[str, Tuple[int, int]] = {}
+
+    def add(self, text: str) -> Tuple[int, int]:
+        ref = self.__offsets.get(text)
+        if ref is None:
+            encoded = text.encode("utf-8")
+            ref = (len(self.data), len(encoded))
+            self.data += encoded
+            self.__offsets[text] = ref
+        return ref
+
+
+def compile_dictionary(
+    categories: Mapping[str, Mapping[str, List[Word]]], path: str
+) -> None:
+    """Записать словарь категорий в файл скомпилированного формата."""
+    arena = _Arena()
+    sections = [
+        (category, level, word_list)
+        for category, levels in categories.items()
+        for level, word_list in levels.items()
+    ]
+    table_offset = _HEADER.size + _SECTION.size * len(sections)
+    section_bytes = bytearray()
+    word_bytes = bytearray()
+    lookup = []
+    for index, (category, level, word_list) in enumerate(sections):
+        section_bytes += _SECTION.pack(
+            *arena.add(category),
+            *arena.add(level),
+            table_offset + len(word_bytes),
+            len(word_list),
+        )
+        for position, word in enumerate(word_list):
+            value = arena.add(word.value)
+            word_bytes += _WORD.pack(*value, *arena.add(word.description))
+            lookup.append((word.value.encode("utf-8"), index, position, value))
+    arena_offset = table_offset + len(word_bytes)
+    lookup_offset = arena_offset + len(arena.data)
+    # При повторах слова первым в порядке сортировки идёт первое вхождение.
+    lookup.sort(key=lambda item: item[:3])
+    lookup_bytes = b"".join(
+        _LOOKUP.pack(*value, index, position) for _, index, position, value in lookup
+    )
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        len(sections),
+        arena_offset,
+        len(arena.data),
+        lookup_offset,
+        len(lookup),
+    )
+
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(header)
+            f.write(section_bytes)
+            f.write(word_bytes)
+            f.write(arena.data)
+            f.write(lookup_bytes)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        raise StorageError(f"Ошибка записи словаря '{path}': {e}")
+
+
+def parse_word_list(
+    lines: Iterable[str], source: str = "<stdin>"
+) -> Dict[str, Dict[str, List[Word]]]:
+    """Разобрать текстовый словарь ``категория;уровень;слово[;подсказка]``."""
+    categories: Dict[str, Dict[str, List[Word]]] = {}
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        fields = [part.strip() for part in line.split(";", 3)]
+        if len(fields) < 3 or not fields[0] or not fields[1]:
+            raise StorageError(
+                f"{source}:{number}: ожидается 'категория;уровень;слово[;подсказка]'"
+            )
+        category, level, value = fields[:3]
+        try:
+            word = Word(value.lower(), fields[3] if len(fields) > 3 else "")
+        except ValueError as e:
+            raise StorageError(f"{source}:{number}: {e}")
+        categories.setdefault(category, {}).setdefault(level, []).append(word)
+    return categories
+
+
+def load_word_list(path: str) -> Dict[str, Dict[str, List[Word]]]:
+    """Прочитать текстовый словарь из файла."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return parse_word_list(f, path)
+    except (OSError, UnicodeDecodeError) as e:
+        raise StorageError(f"Не удалось прочитать словарь '{path}': {e}")
+
+
+class _LazyLevels(Mapping):
+    """Уровни одной категории; слова секции декодируются при первом доступе."""
+
+    def __init__(self, dictionary: "MappedDictionary", sections: Dict[str, tuple]):
+        self.__dictionary = dictionary
+        self.__sections = sections
+        self.__decoded: Dict[str, List[Word]] = {}
+
+    def __getitem__(self, level: str) -> List[Word]:
+        words = self.__decoded.get(level)
+        if words is None:
+            words = self.__dictionary.decode_section(self.__sections[level])
+            self.__decoded[level] = words
+        return words
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__sections)
+
+    def __len__(self) -> int:
+        return len(self.__sections)
+
+
+class MappedDictionary(Mapping):
+    """Словарь категорий поверх mmap скомпилированного файла."""
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            with open(path, "rb") as f:
+                self.__mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            raise StorageError(f"Ошибка открытия словаря '{path}': {e}")
+        size = len(self.__mm)
+        if size < len(MAGIC) or self.__mm[: len(MAGIC)] != MAGIC:
+            raise StorageError(f"Файл '{path}' не является словарём")
+        if size < _HEADER.size:
+            raise self.__corrupt()
+        (
+            _,
+            version,
+            count,
+            self.__arena_offset,
+            self.__arena_size,
+            self.__lookup_offset,
+            self.__lookup_count,
+        ) = _HEADER.unpack_from(self.__mm)
+        if version != VERSION:
+            raise StorageError(
+                f"Неподдерживаемая версия словаря: {version}, перекомпилируйте его"
+            )
+        tables_start = _HEADER.size + count * _SECTION.size
+        if (
+            tables_start > self.__arena_offset
+            or self.__arena_offset + self.__arena_size > self.__lookup_offset
+            or self.__lookup_offset + self.__lookup_count * _LOOKUP.size > size
+        ):
+            raise self.__corrupt()
+
+        self.__sections: List[Tuple[str, str, int, int]] = []
+        sections: Dict[str, Dict[str, tuple]] = {}
+        for i in range(count):
+            cat_off, cat_len, lvl_off, lvl_len, table, words = _SECTION.unpack_from(
+                self.__mm, _HEADER.size + i * _SECTION.size
+            )
+            if table < tables_start or table + words * _WORD.size > self.__arena_offset:
+                raise self.__corrupt()
+            category = self.__text(cat_off, cat_len)
+            level = self.__text(lvl_off, lvl_len)
+            self.__sections.append((category, level, table, words))
+            sections.setdefault(category, {})[level] = (table, words)
+        self.__categories = {
+            category: _LazyLevels(self, levels) for category, levels in sections.items()
+        }
+
+    def __corrupt(self) -> StorageError:
+        return StorageError(f"Словарь '{self.path}' повреждён")
+
+    def __bytes(self, offset: int, length: int) -> bytes:
+        if offset + length > self.__arena_size:
+            raise self.__corrupt()
+        start = self.__arena_offset + offset
+        return self.__mm[start : start + length]
+
+    def __text(self, offset: int, length: int) -> str:
+        try:
+            return self.__bytes(offset, length).decode("utf-8")
+        except UnicodeDecodeError:
+            raise self.__corrupt()
+
+    def __word(self, v_off: int, v_len: int, d_off: int, d_len: int) -> Word:
+        try:
+            return Word(self.__text(v_off, v_len), self.__text(d_off, d_len))
+        except ValueError:
+            raise self.__corrupt()
+
+    def decode_section(self, section: tuple) -> List[Word]:
+        """Декодировать слова одной секции."""
+        table, count = section
+        raw = self.__mm[table : table + count * _WORD.size]
+        return [self.__word(*ref) for ref in _WORD.iter_unpack(raw)]
+
+    def find(self, value: str) -> Optional[Tuple[str, str, Word]]:
+        """Найти слово: (категория, уровень, слово) или None.
+
+        Двоичный поиск по таблице поиска декодирует только сравниваемые
+        значения и найденное слово, секции словаря не декодируются.
+        """
+        key = value.encode("utf-8")
+        low, high = 0, self.__lookup_count
+        while low < high:
+            middle = (low + high) // 2
+            v_off, v_len, _, _ = self.__lookup(middle)
+            if self.__bytes(v_off, v_len) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low == self.__lookup_count:
+            return None
+        v_off, v_len, section, position = self.__lookup(low)
+        if self.__bytes(v_off, v_len) != key:
+            return None
+        if section >= len(self.__sections):
+            raise self.__corrupt()
+        category, level, table, count = self.__sections[section]
+        if position >= count:
+            raise self.__corrupt()
+        word = self.__word(*_WORD.unpack_from(self.__mm, table + position * _WORD.size))
+        return category, level, word
+
+    def __lookup(self, index: int) -> Tuple[int, int, int, int]:
+        return _LOOKUP.unpack_from(
+            self.__mm, self.__lookup_offset + index * _LOOKUP.size
+        )
+
+    def close(self) -> None:
+        self.__mm.close()
+
+    def __getitem__(self, category: str) -> _LazyLevels:
+        return self.__categories[category]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__categories)
+
+    def __len__(self) -> int:
+        return len(self.__categories)
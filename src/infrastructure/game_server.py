@@ -0,0 +1,279 @@
+"""
+Многопользовательский текстовый сервер игры на asyncio.
+
+Каждое TCP-подключение обслуживается отдельной сопрограммой в одном
+потоке событийного цикла: клиент отправляет строки-команды (букву,
+``hint``, ``new`` и т.д.) и получает в ответ рисунок виселицы и текущее
+состояние слова. Игры ведутся через SessionService, статистика копится в
+памяти и периодически сбрасывается в хранилище в пуле потоков, поэтому
+запись на диск не блокирует событийный цикл.
+"""
+
+import asyncio
+from typing import List, MutableMapping, Optional, Set
+
+from src.application.config import DEFAULT_HOST, DEFAULT_PORT, GameConfig
+from src.application.session_service import GameSession, SessionService
+from src.application.statistics_cache import StatisticsCache
+from src.core import metrics
+from src.core.entities import GameState
+from src.core.exceptions import HangmanError
+from src.core.interfaces import Storage
+from src.core.phases import RENDERING, phase
+from src.infrastructure.visuals import STAGES
+
+FLUSH_INTERVAL = 5.0
+MAX_LINE = 1024
+
+HELP = """Команды:
+  <буква>                 - назвать букву
+  hint                    - подсказка
+  new [категория [уровень]] - новая игра
+  categories              - список категорий
+  levels                  - список уровней
+  stats                   - статистика
+  help                    - эта справка
+  quit                    - выход
+"""
+
+
+@metrics.timed("render")
+@phase(RENDERING)
+def render_state(
+    state: GameState, category: str, level: str, hint: Optional[str] = None
+) -> str:
+    """Текстовое представление игры для клиента."""
+    remaining = state.max_attempts - state.errors
+    stage = len(STAGES) - 1 if remaining <= 0 else min(state.errors, len(STAGES) - 1)
+    wrong = ", ".join(sorted(state.wrong_letters)) or "(нет)"
+    return (
+        f"=== Виселица ===\n"
+        f"Категория: {category}, Уровень: {level}\n"
+        f"{STAGES[stage]}\n"
+        f"Слово: {state.current_state}\n"
+        f"Осталось попыток: {remaining}\n"
+        f"Неверные буквы: {wrong}\n"
+        f"Подсказка: {hint or 'Ещё не использована'}\n"
+    )
+
+
+class GameServer:
+    """TCP-сервер, обслуживающий множество игроков в одном событийном цикле."""
+
+    line_limit = MAX_LINE
+
+    def __init__(
+        self,
+        service: SessionService,
+        config: GameConfig,
+        flush_interval: float = FLUSH_INTERVAL,
+    ):
+        self.service = service
+        self.config = config
+        self.flush_interval = flush_interval
+        self.connections = 0
+        self.__server: Optional[asyncio.AbstractServer] = None
+        self.__flusher: Optional[asyncio.Task] = None
+        self.__handlers: Set[asyncio.Task] = set()
+
+    @classmethod
+    def from_storage(
+        cls,
+        storage: Storage,
+        config: GameConfig,
+        sessions: Optional[MutableMapping[str, GameSession]] = None,
+    ) -> "GameServer":
+        """Сервер с кэшем статистики, который пишет только по команде сервера."""
+        statistics = StatisticsCache(storage, flush_every=None, flush_interval=None)
+        return cls(
+            SessionService(storage, config, statistics, sessions=sessions), config
+        )
+
+    async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT):
+        """Начать приём подключений; возвращает asyncio-сервер."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, lambda: self.service.statistics.stats)
+        self.__server = await asyncio.start_server(
+            self.__serve, host, port, limit=self.line_limit
+        )
+        self.__flusher = asyncio.create_task(self.__flush_periodically())
+        return self.__server
+
+    async def serve_forever(
+        self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+    ) -> None:
+        server = await self.start(host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Остановить сервер, прервать обработку подключений и сохранить статистику."""
+        if self.__flusher is not None:
+            self.__flusher.cancel()
+            self.__flusher = None
+        if self.__server is not None:
+            self.__server.close()
+            handlers = list(self.__handlers)
+            for task in handlers:
+                task.cancel()
+            await asyncio.gather(*handlers, return_exceptions=True)
+            await self.__server.wait_closed()
+            self.__server = None
+        await self.flush()
+
+    async def __serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        # Обработчики подключений запоминаются, чтобы close() мог их
+        # прервать и дождаться: иначе они переживают остановку сервера.
+        task = asyncio.current_task()
+        self.__handlers.add(task)
+        try:
+            await self.handle(reader, writer)
+        finally:
+            self.__handlers.discard(task)
+
+    async def flush(self) -> None:
+        """Записать накопленную статистику, не блокируя событийный цикл."""
+        statistics = self.service.statistics
+        if statistics.dirty:
+            await asyncio.get_running_loop().run_in_executor(None, statistics.flush)
+
+    async def __flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Обслужить одно подключение."""
+        self.connections += 1
+        connection = _Connection(self, writer)
+        try:
+            await connection.send(f"Добро пожаловать в Виселицу!\n{HELP}")
+            await connection.execute("new")
+            while not connection.closed:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    await connection.send("Слишком длинная строка\n")
+                    break
+                if not line:
+                    break
+                await connection.execute(line.decode("utf-8", "replace").strip())
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            connection.abandon()
+            writer.close()
+
+
+class _Connection:
+    """Состояние одного клиента: текущая сессия и подсказка."""
+
+    def __init__(self, server: GameServer, writer: asyncio.StreamWriter):
+        self.server = server
+        self.service = server.service
+        self.writer = writer
+        self.session: Optional[GameSession] = None
+        self.hint: Optional[str] = None
+        self.closed = False
+
+    async def send(self, text: str) -> None:
+        self.writer.write(text.encode("utf-8"))
+        await self.writer.drain()
+
+    async def execute(self, line: str) -> None:
+        if not line:
+            return
+        command, *args = line.split()
+        command = command.lower()
+        try:
+            if command in ("quit", "exit"):
+                self.abandon()
+                self.closed = True
+                await self.send("До свидания!\n")
+            elif command == "help":
+                await self.send(HELP)
+            elif command == "new":
+                await self.new_game(args)
+            elif command == "categories":
+                await self.send("\n".join(self.service.categories()) + "\n")
+            elif command == "levels":
+                await self.send("\n".join(self.service.levels()) + "\n")
+            elif command == "stats":
+                await self.send(self.render_stats())
+            elif command == "hint":
+                await self.request_hint()
+            elif len(command) == 1 and command.isalpha():
+                await self.guess(command)
+            else:
+                await self.send("Неизвестная команда, введите help\n")
+        except HangmanError as e:
+            await self.send(f"Ошибка: {e}\n")
+
+    async def new_game(self, args: List[str]) -> None:
+        self.abandon()
+        category = args[0] if args else None
+        level = args[1] if len(args) > 1 else None
+        self.session = self.service.create_session(category, level)
+        self.hint = None
+        await self.send(self.render())
+
+    async def guess(self, letter: str) -> None:
+        if self.session is None:
+            await self.send("Игра не начата, введите new\n")
+            return
+        result = self.service.guess(self.session.session_id, letter)
+        await self.send(self.render())
+        if result.is_won or result.is_lost:
+            await self.finish()
+
+    async def request_hint(self) -> None:
+        if self.session is None:
+            await self.send("Игра не начата, введите new\n")
+            return
+        self.hint = self.service.hint(self.session.session_id)
+        await self.send(self.render())
+
+    async def finish(self) -> None:
+        summary = self.service.finish(self.session.session_id)
+        self.session = None
+        lines = [
+            "Вы выиграли!" if summary.is_won else "Вы проиграли! Человек повешен!",
+            f"Слово: {summary.word}",
+            f"Очки за игру: {summary.score}",
+        ]
+        if summary.achievements:
+            lines.append("Новые достижения:")
+            lines.extend(f"- {a.name}: {a.description}" for a in summary.achievements)
+        lines.append("Введите new для новой игры или quit для выхода")
+        await self.send("\n".join(lines) + "\n")
+
+    def abandon(self) -> None:
+        """Засчитать незаконченную игру как поражение."""
+        if self.session is not None:
+            session, self.session = self.session, None
+            try:
+                self.service.finish(session.session_id)
+            except HangmanError:
+                pass
+
+    def render(self) -> str:
+        session = self.session
+        return render_state(session.state(), session.category, session.level, self.hint)
+
+    def render_stats(self) -> str:
+        stats = self.service.statistics.stats
+        return (
+            f"Игр сыграно: {stats.games_played}\n"
+            f"Побед: {stats.wins}\n"
+            f"Процент побед: {stats.win_percentage:.2f}%\n"
+            f"Общий счёт: {stats.total_score}\n"
+            f"Достижения: {', '.join(stats.unlocked_achievements) or '(нет)'}\n"
+        )
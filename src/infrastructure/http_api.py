@@ -0,0 +1,319 @@
+"""
+HTTP/JSON API игры на asyncio без сторонних зависимостей.
+
+Поддерживаются постоянные соединения (HTTP/1.1 keep-alive) и конвейерная
+отправка запросов: запросы одного соединения читаются и обрабатываются
+по очереди, ответы пишутся в том же порядке.
+
+Маршруты:
+    POST   /games                 - новая игра {"category", "level"}
+    GET    /games/<id>            - состояние игры
+    POST   /games/<id>/guess      - назвать букву {"letter"}
+    POST   /games/<id>/hint       - подсказка
+    DELETE /games/<id>            - завершить игру (незаконченная - поражение)
+    GET    /stats                 - статистика игрока
+    GET    /categories            - список категорий
+    GET    /levels                - список уровней
+
+Маршрутов со словами словаря нет: по ним игрок узнал бы ответ своей игры.
+На известный путь с неподдерживаемым методом отвечает 405 с заголовком Allow.
+"""
+
+import asyncio
+import json
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+
+from src.application.session_service import GameSession, MatchSummary
+from src.core.entities import GameState
+from src.core.exceptions import (
+    CategoryNotFoundError,
+    GameAlreadyFinishedError,
+    HangmanError,
+    HintAlreadyUsedError,
+    LevelNotFoundError,
+    NoWordsError,
+    SessionNotFoundError,
+)
+from src.infrastructure.game_server import GameServer
+
+MAX_HEADERS = 64 * 1024
+MAX_BODY = 64 * 1024
+
+_ERROR_STATUS = {
+    SessionNotFoundError: HTTPStatus.NOT_FOUND,
+    CategoryNotFoundError: HTTPStatus.NOT_FOUND,
+    LevelNotFoundError: HTTPStatus.NOT_FOUND,
+    NoWordsError: HTTPStatus.NOT_FOUND,
+    HintAlreadyUsedError: HTTPStatus.CONFLICT,
+    GameAlreadyFinishedError: HTTPStatus.CONFLICT,
+}
+
+
+class HttpError(Exception):
+    """Ошибка обработки запроса с HTTP-статусом и дополнительными заголовками."""
+
+    def __init__(
+        self,
+        status: HTTPStatus,
+        message: str,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+def allowed_methods(parts: List[str]) -> Tuple[str, ...]:
+    """Методы, поддерживаемые путём; пустой кортеж - путь неизвестен."""
+    if parts == ["games"]:
+        return ("POST",)
+    if len(parts) == 2 and parts[0] == "games":
+        return ("GET", "DELETE")
+    if len(parts) == 3 and parts[0] == "games" and parts[2] in ("guess", "hint"):
+        return ("POST",)
+    if parts in (["stats"], ["categories"], ["levels"]):
+        return ("GET",)
+    return ()
+
+
+class Request:
+    """Разобранный HTTP-запрос."""
+
+    __slots__ = ("method", "path", "version", "headers", "body")
+
+    def __init__(
+        self, method: str, path: str, version: str, headers: Dict[str, str], body: bytes
+    ):
+        self.method = method
+        self.path = path
+        self.version = version
+        self.headers = headers
+        self.body = body
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    def json(self) -> Dict:
+        if not self.body:
+            return {}
+        try:
+            data = json.loads(self.body)
+        except (ValueError, UnicodeDecodeError):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Тело запроса не является JSON")
+        if not isinstance(data, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Ожидается JSON-объект")
+        return data
+
+    def text_field(self, data: Dict, name: str) -> Optional[str]:
+        """Необязательное строковое поле JSON-объекта."""
+        value = data.get(name)
+        if value is not None and not isinstance(value, str):
+            raise HttpError(
+                HTTPStatus.BAD_REQUEST, f"Поле '{name}' должно быть строкой"
+            )
+        return value
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    """Прочитать один запрос; None, если клиент закрыл соединение."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if not e.partial.strip():
+            return None
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Неполный запрос")
+    except asyncio.LimitOverrunError:
+        raise HttpError(
+            HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Слишком большие заголовки"
+        )
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Неверная строка запроса")
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    if "transfer-encoding" in headers:
+        raise HttpError(
+            HTTPStatus.NOT_IMPLEMENTED, "Transfer-Encoding не поддерживается"
+        )
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HttpError(HTTPStatus.BAD_REQUEST, "Неверный Content-Length")
+    if length < 0 or length > MAX_BODY:
+        raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Слишком большое тело")
+    body = await reader.readexactly(length) if length else b""
+    return Request(
+        method.upper(), unquote(urlsplit(target).path), version, headers, body
+    )
+
+
+def encode_response(
+    status: HTTPStatus,
+    payload: object,
+    keep_alive: bool = True,
+    headers: Optional[Dict[str, str]] = None,
+) -> bytes:
+    """Сериализовать JSON-ответ вместе с заголовками."""
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    extra = "".join(f"{name}: {value}\r\n" for name, value in (headers or {}).items())
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        f"Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"{extra}"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+def state_to_dict(state: GameState) -> Dict:
+    return {
+        "state": state.current_state,
+        "errors": state.errors,
+        "max_attempts": state.max_attempts,
+        "attempts_left": state.max_attempts - state.errors,
+        "guessed_letters": sorted(state.guessed_letters),
+        "wrong_letters": sorted(state.wrong_letters),
+        "is_won": state.is_won,
+        "is_lost": state.is_lost,
+    }
+
+
+def session_to_dict(session: GameSession) -> Dict:
+    return {
+        "id": session.session_id,
+        "category": session.category,
+        "level": session.level,
+        "hint_used": session.hint_used,
+        **state_to_dict(session.state()),
+    }
+
+
+def summary_to_dict(summary: MatchSummary) -> Dict:
+    return {
+        "id": summary.session_id,
+        "word": summary.word,
+        "is_won": summary.is_won,
+        "score": summary.score,
+        "achievements": [
+            {"name": a.name, "description": a.description} for a in summary.achievements
+        ],
+    }
+
+
+class HttpApiServer(GameServer):
+    """HTTP/JSON API поверх SessionService."""
+
+    line_limit = MAX_HEADERS
+
+    async def handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Обслужить одно соединение: запросы по очереди, пока оно открыто."""
+        self.connections += 1
+        try:
+            keep_alive = True
+            while keep_alive:
+                headers: Dict[str, str] = {}
+                try:
+                    request = await read_request(reader)
+                except HttpError as e:
+                    keep_alive = False
+                    status, payload = e.status, {"error": str(e)}
+                else:
+                    if request is None:
+                        break
+                    keep_alive = request.keep_alive
+                    try:
+                        status, payload = self.dispatch(request)
+                    except HttpError as e:
+                        status, payload = e.status, {"error": str(e)}
+                        headers = e.headers
+                    except Exception:
+                        # Ошибка в обработчике не должна рвать соединение:
+                        # клиент получает 500 и может слать следующие запросы.
+                        status = HTTPStatus.INTERNAL_SERVER_ERROR
+                        payload = {"error": "Внутренняя ошибка сервера"}
+                writer.write(encode_response(status, payload, keep_alive, headers))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    def dispatch(self, request: Request) -> Tuple[HTTPStatus, object]:
+        """Выполнить запрос и вернуть статус и JSON-ответ."""
+        parts = [part for part in request.path.split("/") if part]
+        method = request.method
+        try:
+            if parts == ["games"] and method == "POST":
+                data = request.json()
+                session = self.service.create_session(
+                    request.text_field(data, "category"),
+                    request.text_field(data, "level"),
+                )
+                return HTTPStatus.CREATED, session_to_dict(session)
+            if len(parts) == 2 and parts[0] == "games":
+                if method == "GET":
+                    return HTTPStatus.OK, session_to_dict(
+                        self.service.get_session(parts[1])
+                    )
+                if method == "DELETE":
+                    return HTTPStatus.OK, summary_to_dict(self.service.finish(parts[1]))
+            if len(parts) == 3 and parts[0] == "games" and method == "POST":
+                if parts[2] == "guess":
+                    return HTTPStatus.OK, self.guess(parts[1], request.json())
+                if parts[2] == "hint":
+                    return HTTPStatus.OK, {"hint": self.service.hint(parts[1])}
+            if method == "GET" and parts in (["stats"], ["categories"], ["levels"]):
+                return HTTPStatus.OK, self.query(parts)
+        except HangmanError as e:
+            status = _ERROR_STATUS.get(type(e), HTTPStatus.BAD_REQUEST)
+            return status, {"error": str(e)}
+        allowed = allowed_methods(parts)
+        if allowed:
+            raise HttpError(
+                HTTPStatus.METHOD_NOT_ALLOWED,
+                f"Метод {method} не поддерживается для {request.path}",
+                {"Allow": ", ".join(allowed)},
+            )
+        raise HttpError(HTTPStatus.NOT_FOUND, f"Нет маршрута {method} {request.path}")
+
+    def guess(self, session_id: str, data: Dict) -> Dict:
+        letter = data.get("letter")
+        if not isinstance(letter, str):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Требуется поле 'letter'")
+        result = self.service.guess(session_id, letter)
+        response = {"is_correct": result.is_correct, **state_to_dict(result.state)}
+        if result.is_won or result.is_lost:
+            response["result"] = summary_to_dict(self.service.finish(session_id))
+        return response
+
+    def query(self, parts: List[str]) -> object:
+        """Запросы к статистике и спискам категорий и уровней."""
+        if parts == ["stats"]:
+            stats = self.service.statistics.stats
+            return {
+                "games_played": stats.games_played,
+                "wins": stats.wins,
+                "win_percentage": stats.win_percentage,
+                "total_score": stats.total_score,
+                "best_score": stats.rollups.best_score,
+                "current_streak": stats.rollups.current_streak,
+                "unlocked_achievements": stats.unlocked_achievements,
+            }
+        if parts == ["categories"]:
+            return list(self.service.categories())
+        return self.service.levels()
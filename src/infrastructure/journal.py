@@ -0,0 +1,421 @@
+"""
+Журнал статистики игрока: снимок + журнал изменений только на дозапись.
+
+Каждый завершённый матч и каждое открытое достижение дописываются в журнал
+одной компактной JSON-строкой, поэтому стоимость записи не зависит от
+длины истории. Когда журнал разрастается, он в фоновом потоке сворачивается
+в новый снимок; при close() и при завершении процесса фоновое сворачивание
+дожидается окончания, а разросшийся журнал сворачивается сразу.
+
+Записи журнала нумеруются по возрастанию, снимок хранит номер последней
+учтённой записи. Если процесс упадёт между заменой снимка и заменой
+журнала, уже учтённые записи при загрузке пропускаются, а не применяются
+повторно.
+
+Один файл статистики могут вести несколько процессов (CLI и сервер),
+поэтому чтение, дозапись, запись снимка и сворачивание идут под файловой
+блокировкой ``<журнал>.lock``, а номер следующей записи берётся с диска,
+если файлы изменил кто-то другой. Где fcntl недоступен (Windows),
+блокировка действует только между потоками одного процесса.
+"""
+
+import atexit
+import json
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+from src.core import metrics
+from src.core.entities import MatchStatistics, PlayerStatistics, StatisticsRollups
+from src.core.exceptions import StorageError
+
+DEFAULT_COMPACT_EVERY = 1000
+SEQ = "seq"
+SNAPSHOT_SEQ = "journal_seq"
+TAIL_CHUNK = 4096
+
+# Отпечаток файлов (inode, размер, mtime) журнала и снимка.
+Stamp = Tuple[Optional[Tuple[int, int, int]], Optional[Tuple[int, int, int]]]
+
+
+def stats_to_dict(stats: PlayerStatistics) -> Dict:
+    """Преобразовать статистику в словарь для снимка."""
+    return {
+        "games_played": stats.games_played,
+        "wins": stats.wins,
+        "total_score": stats.total_score,
+        "unlocked_achievements": stats.unlocked_achievements,
+        "match_history": stats.match_history,
+        "rollups": stats.rollups.to_dict(),
+    }
+
+
+def stats_from_dict(data: Dict) -> PlayerStatistics:
+    """Восстановить статистику из словаря снимка."""
+    match_history = data.get("match_history", [])
+    rollups = data.get("rollups")
+    return PlayerStatistics(
+        games_played=data.get("games_played", 0),
+        wins=data.get("wins", 0),
+        total_score=data.get("total_score", 0),
+        unlocked_achievements=data.get("unlocked_achievements", []),
+        match_history=match_history,
+        rollups=(
+            StatisticsRollups.from_dict(rollups)
+            if rollups
+            else StatisticsRollups.from_history(match_history)
+        ),
+    )
+
+
+def match_record(match: MatchStatistics) -> Dict:
+    """Запись журнала о завершённом матче."""
+    return {"type": "match", **match.__dict__}
+
+
+def achievement_record(name: str) -> Dict:
+    """Запись журнала об открытом достижении."""
+    return {"type": "achievement", "name": name}
+
+
+def replay_records(stats: PlayerStatistics, base: int, records: List[Dict]) -> int:
+    """Применить записи новее base; вернуть номер последней записи.
+
+    Записи без номера (журналы прежних версий) применяются всегда.
+    """
+    last = base
+    for record in records:
+        seq = record.get(SEQ)
+        if seq is not None:
+            if seq <= base:
+                continue
+            last = max(last, seq)
+        apply_record(stats, record)
+    return last
+
+
+def apply_record(stats: PlayerStatistics, record: Dict) -> None:
+    """Применить запись журнала к статистике."""
+    kind = record.get("type")
+    if kind == "match":
+        stats.add_match(
+            {key: value for key, value in record.items() if key not in ("type", SEQ)}
+        )
+    elif kind == "achievement":
+        if record["name"] not in stats.unlocked_achievements:
+            stats.unlocked_achievements.append(record["name"])
+
+
+def _last_seq(raw: bytes, partial_start: bool) -> Optional[int]:
+    """Номер последней пронумерованной записи в куске журнала."""
+    lines = raw.split(b"\n")
+    if partial_start:
+        lines = lines[1:]
+    for line in reversed(lines):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict) and SEQ in record:
+            return record[SEQ]
+    return None
+
+
+def _encode_snapshot(stats: PlayerStatistics, seq: int) -> bytes:
+    return json.dumps(
+        {**stats_to_dict(stats), SNAPSHOT_SEQ: seq},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+# Открытые журналы; при завершении процесса их сворачивание доводится до конца.
+_journals: "weakref.WeakSet[StatisticsJournal]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_journals() -> None:
+    for journal in list(_journals):
+        try:
+            journal.close()
+        except StorageError:
+            continue
+
+
+class StatisticsJournal:
+    """Снимок статистики и журнал дозаписи к нему."""
+
+    def __init__(
+        self,
+        snapshot_path: str,
+        journal_path: Optional[str] = None,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+    ):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or f"{snapshot_path}.journal"
+        self.lock_path = f"{self.journal_path}.lock"
+        self.compact_every = compact_every
+        self.__lock = threading.RLock()
+        self.__pending: Optional[int] = None
+        # Номер последней записи журнала и отпечаток файлов, при котором он
+        # получен; при другом отпечатке номер перечитывается с диска.
+        self.__seq: Optional[int] = None
+        self.__seen: Optional[Stamp] = None
+        self.__torn = False
+        self.__compactor: Optional[threading.Thread] = None
+        _journals.add(self)
+
+    @contextmanager
+    def __locked(self, shared: bool = False) -> Iterator[None]:
+        """Блокировка потоков экземпляра и файловая блокировка процессов.
+
+        Общая блокировка (для чтения) без файла блокировки не берётся:
+        статистику в каталоге только для чтения можно загрузить.
+        """
+        with self.__lock:
+            if fcntl is None:
+                yield
+                return
+            try:
+                lock_file = open(self.lock_path, "ab")
+            except OSError as e:
+                if not shared:
+                    raise StorageError(
+                        f"Не удалось заблокировать статистику '{self.lock_path}': {e}"
+                    )
+                yield
+                return
+            with lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+                yield
+
+    def __stamp(self) -> Stamp:
+        stamp = []
+        for path in (self.journal_path, self.snapshot_path):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                stamp.append(None)
+            else:
+                stamp.append((st.st_ino, st.st_size, st.st_mtime_ns))
+        return tuple(stamp)
+
+    def __read_tail(self) -> Tuple[Optional[int], bool]:
+        """Номер последней записи журнала и признак оборванной последней строки.
+
+        Журнал читается с конца кусками, пока не найдётся пронумерованная
+        запись, поэтому стоимость не зависит от длины журнала.
+        """
+        try:
+            with open(self.journal_path, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                chunk = TAIL_CHUNK
+                while True:
+                    start = max(size - chunk, 0)
+                    f.seek(start)
+                    raw = f.read(size - start)
+                    metrics.count("storage_bytes_read", len(raw))
+                    seq = _last_seq(raw, start > 0)
+                    if seq is not None or start == 0:
+                        return seq, bool(raw) and not raw.endswith(b"\n")
+                    chunk *= 2
+        except FileNotFoundError:
+            return None, False
+
+    def __disk_seq(self) -> int:
+        """Номер последней записи на диске (вызывается под блокировкой).
+
+        Пока файлы не менялись с последней записи этого экземпляра,
+        используется запомненный номер; иначе он читается из конца журнала,
+        а для пустого журнала - из снимка.
+        """
+        stamp = self.__stamp()
+        if self.__seq is None or stamp != self.__seen:
+            seq, self.__torn = self.__read_tail()
+            if seq is None:
+                _, seq = self.__read_snapshot()
+            self.__seq = seq
+            self.__seen = stamp
+        return self.__seq
+
+    def __read_snapshot(self) -> Tuple[PlayerStatistics, int]:
+        if not os.path.exists(self.snapshot_path):
+            return PlayerStatistics(), 0
+        with open(self.snapshot_path, "rb") as f:
+            data = f.read()
+        metrics.count("storage_bytes_read", len(data))
+        snapshot = json.loads(data)
+        return stats_from_dict(snapshot), snapshot.get(SNAPSHOT_SEQ, 0)
+
+    def __read_journal(self, start: int = 0, end: Optional[int] = None) -> bytes:
+        if not os.path.exists(self.journal_path):
+            return b""
+        with open(self.journal_path, "rb") as f:
+            f.seek(start)
+            data = f.read() if end is None else f.read(end - start)
+        metrics.count("storage_bytes_read", len(data))
+        return data
+
+    @staticmethod
+    def __records(raw: bytes) -> List[Dict]:
+        # Недописанная последняя строка (сбой во время записи) пропускается.
+        records = []
+        for line in raw.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+        return records
+
+    def __write_atomic(self, path: str, data: bytes) -> None:
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        metrics.count("storage_bytes_written", len(data))
+
+    def size(self) -> int:
+        """Суммарный размер снимка и журнала в байтах."""
+        return sum(
+            os.path.getsize(path)
+            for path in (self.snapshot_path, self.journal_path)
+            if os.path.exists(path)
+        )
+
+    def __read_state(self) -> Tuple[PlayerStatistics, int, List[Dict]]:
+        try:
+            stats, base = self.__read_snapshot()
+            records = self.__records(self.__read_journal())
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+            raise StorageError("Ошибка чтения статистики из 'player_statistics.json'")
+        return stats, base, records
+
+    def load(self) -> PlayerStatistics:
+        """Загрузить снимок и применить к нему журнал."""
+        with self.__locked(shared=True):
+            stats, base, records = self.__read_state()
+            self.__pending = len(records)
+        replay_records(stats, base, records)
+        return stats
+
+    def append(self, records: Iterable[Dict]) -> None:
+        """Дописать записи в журнал."""
+        records = list(records)
+        if not records:
+            return
+        with self.__locked():
+            try:
+                seq = self.__disk_seq()
+            except (OSError, ValueError):
+                raise StorageError("Ошибка чтения статистики из журнала")
+            # Строку, оборванную упавшим процессом, нужно закончить, иначе
+            # с ней склеится первая новая запись.
+            lines = ("\n" if self.__torn else "") + "".join(
+                json.dumps(
+                    {**record, SEQ: seq + i},
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+                + "\n"
+                for i, record in enumerate(records, 1)
+            )
+            data = lines.encode("utf-8")
+            try:
+                with open(self.journal_path, "ab") as f:
+                    f.write(data)
+            except OSError:
+                raise StorageError("Ошибка записи статистики в журнал")
+            self.__seq = seq + len(records)
+            self.__seen = self.__stamp()
+            self.__torn = False
+            self.__pending = (self.__pending or 0) + len(records)
+            pending = self.__pending
+        metrics.count("storage_bytes_written", len(data))
+        if pending >= self.compact_every:
+            self.compact_in_background()
+
+    def write_snapshot(self, stats: PlayerStatistics) -> None:
+        """Записать полный снимок и очистить журнал."""
+        try:
+            with self.__locked():
+                data = _encode_snapshot(stats, self.__disk_seq())
+                self.__write_atomic(self.snapshot_path, data)
+                if os.path.exists(self.journal_path):
+                    os.remove(self.journal_path)
+                self.__pending = 0
+                self.__seen = self.__stamp()
+                self.__torn = False
+        except (OSError, ValueError):
+            raise StorageError("Ошибка записи статистики в 'player_statistics.json'")
+
+    def compact(self) -> None:
+        """Свернуть журнал в снимок.
+
+        Снимок и журнал читаются под общей блокировкой, записи применяются
+        без блокировки. Под исключительной блокировкой (дозапись других
+        потоков и процессов ждёт) дочитывается хвост журнала, дописанный
+        за это время, заменяются снимок и журнал. Если снимок или журнал
+        тем временем заменил кто-то другой, сворачивание отменяется.
+        """
+        with self.__locked(shared=True):
+            stamp = self.__stamp()
+            if stamp[0] is None:
+                return
+            stats, base = self.__read_snapshot()
+            raw = self.__read_journal(0, stamp[0][1])
+        # Учитываются только полные строки, хвост остаётся в журнале.
+        offset = raw.rfind(b"\n") + 1
+        last = replay_records(stats, base, self.__records(raw[:offset]))
+        data = _encode_snapshot(stats, last)
+        # Если процесс упадёт после замены снимка, но до замены журнала,
+        # записи с номерами до last при загрузке будут пропущены.
+        with self.__locked():
+            current = self.__stamp()
+            if current[1] != stamp[1] or (current[0] or ())[:1] != stamp[0][:1]:
+                return
+            tail = self.__read_journal(offset)
+            self.__write_atomic(self.snapshot_path, data)
+            self.__write_atomic(self.journal_path, tail)
+            self.__pending = len(self.__records(tail))
+            # Свёрнутые записи других процессов могли быть новее
+            # запомненного номера: следующая дозапись перечитает его.
+            self.__seen = None
+
+    def compact_in_background(self) -> None:
+        """Запустить сворачивание журнала в фоновом потоке (если ещё не идёт)."""
+        with self.__lock:
+            if self.__compactor and self.__compactor.is_alive():
+                return
+            self.__compactor = threading.Thread(
+                target=self.compact, name="statistics-compactor", daemon=True
+            )
+            self.__compactor.start()
+
+    def wait(self) -> None:
+        """Дождаться завершения фонового сворачивания."""
+        compactor = self.__compactor
+        if compactor:
+            compactor.join()
+
+    def close(self) -> None:
+        """Дождаться фонового сворачивания и свернуть разросшийся журнал.
+
+        Вызывается и при завершении процесса: процесс, сыгравший одну игру,
+        не успевает дождаться фонового потока, и без этого журнал рос бы
+        без ограничений.
+        """
+        self.wait()
+        if (self.__pending or 0) >= self.compact_every:
+            try:
+                self.compact()
+            except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+                raise StorageError(f"Ошибка сворачивания журнала статистики: {e}")
@@ -0,0 +1,46 @@
+import copy
+import threading
+from dataclasses import dataclass, field
+from typing import List
+
+from src.core.entities import MatchStatistics, PlayerStatistics
+from src.infrastructure.journal import achievement_record, apply_record, match_record
+from src.infrastructure.storage import FileStorage
+
+
+@dataclass
+class MemoryStorage(FileStorage):
+    """Хранилище со словарём из конфигурации и статистикой только в памяти.
+
+    Предназначено для нагрузочного тестирования и локальных запусков:
+    ничего не пишет на диск и не видит статистику других процессов.
+    """
+
+    _stats: PlayerStatistics = field(
+        default_factory=PlayerStatistics, init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def load_achievements(self) -> PlayerStatistics:
+        """Копия текущей статистики."""
+        with self._lock:
+            return copy.deepcopy(self._stats)
+
+    def save_achievements(self, stats: PlayerStatistics) -> None:
+        with self._lock:
+            self._stats = copy.deepcopy(stats)
+
+    def record_match(self, match: MatchStatistics) -> None:
+        self.record_matches([match])
+
+    def record_matches(self, matches: List[MatchStatistics]) -> None:
+        with self._lock:
+            for match in matches:
+                apply_record(self._stats, match_record(match))
+
+    def unlock_achievements(self, names: List[str]) -> None:
+        with self._lock:
+            for name in names:
+                apply_record(self._stats, achievement_record(name))
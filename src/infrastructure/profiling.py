@@ -0,0 +1,173 @@
+"""
+Профилирование запуска по фазам игры (cProfile).
+
+Для каждой фазы из src.core.phases ведётся отдельный профиль; время вне
+фаз (разбор аргументов, меню, ожидание ввода) попадает в фазу ``other``.
+При входе в фазу профилировщик переключается на её профиль, при выходе -
+возвращается к внешнему, поэтому время вложенной фазы учитывается только в
+ней самой. Профилируется поток, запустивший профилировщик; фоновые потоки
+и процессы-обработчики пакетного режима (--workers) в профиль не попадают.
+
+Результат - файлы <фаза>.pstats, общий all.pstats и текстовая сводка
+summary.txt в указанном каталоге.
+"""
+
+import cProfile
+import os
+import pstats
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
+
+from src.core.exceptions import StorageError
+from src.core.phases import PHASES, PhaseObserver, set_observer
+
+OTHER = "other"
+TOP_FUNCTIONS = 10
+
+
+def function_label(key: tuple) -> str:
+    """Подпись функции pstats: файл:строка(имя) с путём относительно проекта."""
+    filename, line, name = key
+    if filename == "~":
+        return name
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    if filename.startswith(root + os.sep):
+        filename = filename[len(root) + 1 :]
+    return f"{filename}:{line}({name})"
+
+
+class PhaseProfiler(PhaseObserver):
+    """Профилировщик с отдельным профилем cProfile на каждую фазу."""
+
+    def __init__(self):
+        self.__profiles: Dict[str, cProfile.Profile] = {}
+        self.__seconds: Dict[str, float] = defaultdict(float)
+        self.__calls: Counter = Counter()
+        self.__stack: List[str] = []
+        self.__since = 0.0
+        self.__thread: Optional[int] = None
+        self.__previous: Optional[PhaseObserver] = None
+
+    def __profile(self, name: str) -> cProfile.Profile:
+        profile = self.__profiles.get(name)
+        if profile is None:
+            profile = self.__profiles[name] = cProfile.Profile()
+        return profile
+
+    def __switch(self, source: Optional[str], target: Optional[str]) -> None:
+        now = time.perf_counter()
+        if source is not None:
+            self.__profiles[source].disable()
+            self.__seconds[source] += now - self.__since
+        self.__since = now
+        if target is not None:
+            self.__profile(target).enable()
+
+    def start(self) -> None:
+        """Начать профилирование текущего потока."""
+        self.__thread = threading.get_ident()
+        self.__stack = [OTHER]
+        self.__previous = set_observer(self)
+        self.__switch(None, OTHER)
+
+    def stop(self) -> None:
+        """Остановить профилирование."""
+        if self.__thread is None:
+            return
+        set_observer(self.__previous)
+        self.__switch(self.__stack[-1], None)
+        self.__thread = None
+
+    def enter(self, name: str) -> object:
+        if threading.get_ident() != self.__thread:
+            return False
+        current = self.__stack[-1]
+        self.__stack.append(name)
+        if current != name:
+            self.__calls[name] += 1
+            self.__switch(current, name)
+        return True
+
+    def exit(self, name: str, token: object) -> None:
+        if not token or self.__thread is None:
+            return
+        self.__stack.pop()
+        outer = self.__stack[-1]
+        if outer != name:
+            self.__switch(name, outer)
+
+    @property
+    def seconds(self) -> Dict[str, float]:
+        """Время по фазам (без вложенных фаз), в секундах."""
+        return dict(self.__seconds)
+
+    def stats(self, name: str) -> Optional[pstats.Stats]:
+        """Статистика cProfile фазы; None, если фаза не выполнялась."""
+        profile = self.__profiles.get(name)
+        if profile is None:
+            return None
+        try:
+            return pstats.Stats(profile)
+        except TypeError:  # профиль без вызовов
+            return None
+
+    def summary(self, top: int = TOP_FUNCTIONS) -> str:
+        """Текстовая сводка: время фаз и самые дорогие функции каждой фазы."""
+        total = sum(self.__seconds.values())
+        names = [*PHASES, OTHER]
+        lines = [
+            f"Профиль по фазам, всего {total * 1000:.1f} мс",
+            f"{'Фаза':<18}{'Время, мс':>12}{'Доля':>8}{'Входов':>9}",
+        ]
+        for name in sorted(names, key=lambda n: -self.__seconds.get(n, 0.0)):
+            seconds = self.__seconds.get(name, 0.0)
+            share = seconds / total * 100 if total else 0.0
+            calls = self.__calls[name] if name != OTHER else "-"
+            lines.append(f"{name:<18}{seconds * 1000:>12.2f}{share:>7.1f}%{calls:>9}")
+        for name in names:
+            stats = self.stats(name)
+            if stats is None:
+                continue
+            lines += [
+                "",
+                f"== {name}: функции по собственному времени ==",
+                f"{'собств., мс':>12}{'всего, мс':>12}{'вызовов':>10}  функция",
+            ]
+            # Собственные вызовы профилировщика в сводку не попадают.
+            ranked = sorted(
+                (item for item in stats.stats.items() if item[0][0] != __file__),
+                key=lambda item: -item[1][2],
+            )
+            for key, (_, calls, tottime, cumtime, _) in ranked[:top]:
+                lines.append(
+                    f"{tottime * 1000:>12.3f}{cumtime * 1000:>12.3f}{calls:>10}  "
+                    f"{function_label(key)}"
+                )
+        return "\n".join(lines)
+
+    def dump(self, directory: str, top: int = TOP_FUNCTIONS) -> str:
+        """Записать <фаза>.pstats, all.pstats и summary.txt; вернуть сводку."""
+        summary = self.summary(top)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            combined: Optional[pstats.Stats] = None
+            for name in [*PHASES, OTHER]:
+                stats = self.stats(name)
+                if stats is None:
+                    continue
+                stats.dump_stats(os.path.join(directory, f"{name}.pstats"))
+                if combined is None:
+                    combined = stats
+                else:
+                    combined.add(stats)
+            if combined is not None:
+                combined.dump_stats(os.path.join(directory, "all.pstats"))
+            with open(
+                os.path.join(directory, "summary.txt"), "w", encoding="utf-8"
+            ) as f:
+                f.write(summary + "\n")
+        except OSError as e:
+            raise StorageError(f"Не удалось записать профиль в '{directory}': {e}")
+        return summary
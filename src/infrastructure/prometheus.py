@@ -0,0 +1,235 @@
+"""
+Экспорт метрик в текстовом формате Prometheus.
+
+Значения берутся из реестра src.core.metrics: счётчики выводятся как
+``hangman_<имя>_total``, показатели - как ``hangman_<имя>``, гистограммы
+задержек - как ``hangman_<имя>_seconds`` с фиксированными границами корзин.
+Дополнительно считаются доля побед и доля попаданий в кэши (по парам
+счётчиков ``<кэш>_cache_hits`` и ``<кэш>_cache_misses``).
+
+Экспортёр периодически записывает файл (например, для textfile collector
+node_exporter) и/или отдаёт ``/metrics`` по HTTP на локальном порту.
+"""
+
+import os
+import re
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from src.core.exceptions import StorageError
+from src.core.metrics import Metrics
+
+PREFIX = "hangman"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_INTERVAL = 15.0
+METRICS_HOST = "127.0.0.1"
+# Границы корзин гистограмм в секундах.
+LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+CACHE_HITS = "_cache_hits"
+CACHE_MISSES = "_cache_misses"
+
+_INVALID = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def metric_name(name: str) -> str:
+    """Имя метрики Prometheus для имени из реестра."""
+    return f"{PREFIX}_{_INVALID.sub('_', name)}"
+
+
+def format_value(value: float) -> str:
+    """Значение в текстовом формате: целые без дробной части."""
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def cumulative_buckets(
+    buckets: Sequence[Tuple[int, int]], bounds: Sequence[float] = LATENCY_BUCKETS
+) -> List[Tuple[float, int]]:
+    """Накопленное число значений не больше каждой границы (в секундах).
+
+    Корзина гистограммы учитывается в границе, если её верхняя граница не
+    больше границы Prometheus, поэтому погрешность не превышает ширину
+    корзины.
+    """
+    result = []
+    seen = i = 0
+    for bound in bounds:
+        limit = bound * 1e9
+        while i < len(buckets) and buckets[i][0] <= limit:
+            seen += buckets[i][1]
+            i += 1
+        result.append((bound, seen))
+    return result
+
+
+def render(registry: Metrics) -> str:
+    """Все метрики реестра в текстовом формате Prometheus."""
+    lines: List[str] = []
+
+    def family(name: str, kind: str, description: str) -> None:
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    counters = registry.counters
+    for name, value in counters.items():
+        exported = f"{metric_name(name)}_total"
+        family(exported, "counter", f"Счётчик {name}")
+        lines.append(f"{exported} {value}")
+
+    for name, value in registry.gauges.items():
+        exported = metric_name(name)
+        family(exported, "gauge", f"Показатель {name}")
+        lines.append(f"{exported} {format_value(value)}")
+
+    finished = counters.get("wins", 0) + counters.get("losses", 0)
+    if finished:
+        exported = metric_name("win_ratio")
+        family(exported, "gauge", "Доля побед среди завершённых игр")
+        lines.append(f"{exported} {format_value(counters.get('wins', 0) / finished)}")
+
+    ratios = []
+    for name, hits in counters.items():
+        if name.endswith(CACHE_HITS):
+            cache = name[: -len(CACHE_HITS)]
+            total = hits + counters.get(cache + CACHE_MISSES, 0)
+            ratios.append((cache, hits / total if total else 0.0))
+    if ratios:
+        exported = metric_name("cache_hit_ratio")
+        family(exported, "gauge", "Доля попаданий в кэш")
+        for cache, ratio in ratios:
+            lines.append(f'{exported}{{cache="{cache}"}} {format_value(ratio)}')
+
+    for name, histogram in registry.histograms():
+        exported = f"{metric_name(name)}_seconds"
+        family(exported, "histogram", f"Длительность {name}")
+        # Корзины, число и сумма из одного снимка: иначе при параллельной
+        # записи _sum и _count в одном ответе могут не совпасть.
+        buckets, total = histogram.snapshot()
+        count = sum(n for _, n in buckets)
+        for bound, seen in cumulative_buckets(buckets):
+            lines.append(f'{exported}_bucket{{le="{bound}"}} {seen}')
+        lines.append(f'{exported}_bucket{{le="+Inf"}} {count}')
+        lines.append(f"{exported}_sum {format_value(total / 1e9)}")
+        lines.append(f"{exported}_count {count}")
+
+    return "\n".join(lines) + "\n"
+
+
+class _MetricsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], registry: Metrics):
+        super().__init__(address, _MetricsHandler)
+        self.registry = registry
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    server: _MetricsServer
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        body = render(self.server.registry).encode("utf-8")
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class PrometheusExporter:
+    """Периодическая запись метрик в файл и/или отдача по HTTP."""
+
+    def __init__(
+        self,
+        registry: Metrics,
+        path: Optional[str] = None,
+        port: Optional[int] = None,
+        host: str = METRICS_HOST,
+        interval: float = DEFAULT_INTERVAL,
+    ):
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self.__address = None if port is None else (host, port)
+        self.__server: Optional[_MetricsServer] = None
+        self.__stopped = threading.Event()
+        self.__threads: List[threading.Thread] = []
+
+    @property
+    def port(self) -> Optional[int]:
+        """Порт HTTP-сервера (после start(); полезно при порте 0)."""
+        return None if self.__server is None else self.__server.server_address[1]
+
+    def write(self) -> None:
+        """Записать метрики в файл атомарной заменой."""
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(render(self.registry))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            raise StorageError(f"Не удалось записать метрики в '{self.path}': {e}")
+
+    def start(self) -> None:
+        """Начать запись файла и/или открыть порт.
+
+        Ошибка первой записи или открытия порта возникает сразу; ошибки
+        следующих периодических записей пропускаются до следующей попытки.
+        """
+        if self.__address is not None:
+            self.__server = _MetricsServer(self.__address, self.registry)
+            self.__spawn(self.__server.serve_forever)
+        if self.path:
+            self.write()
+            self.__spawn(self.__write_periodically)
+
+    def __spawn(self, target: Callable[[], None]) -> None:
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+        self.__threads.append(thread)
+
+    def __write_periodically(self) -> None:
+        while not self.__stopped.wait(self.interval):
+            try:
+                self.write()
+            except StorageError:
+                continue
+
+    def stop(self) -> None:
+        """Остановить экспорт; файл получает последние значения."""
+        if self.__stopped.is_set():
+            return
+        self.__stopped.set()
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+        for thread in self.__threads:
+            thread.join()
+        self.write()
@@ -0,0 +1,297 @@
+"""
+Хранилище игровых сессий с ограниченным объёмом памяти.
+
+Активные сессии держатся в памяти в порядке последнего обращения.
+Сессии, к которым не обращались дольше ttl секунд, считаются брошенными
+и удаляются. При превышении лимита числа сессий или оценки занимаемой
+памяти вытесняются давно не использованные сессии; незавершённые игры
+при этом сбрасываются на диск (если задан spill_dir) и восстанавливаются
+при следующем обращении. Сброшенные на диск сессии тоже удаляются через
+ttl секунд после сброса.
+
+Законченные игры, результат которых ещё не учтён, не теряются: при
+удалении или вытеснении они передаются обработчику on_finished (его
+назначает SessionService), а без обработчика сбрасываются на диск.
+Обработчик вызывается после снятия блокировки хранилища, поэтому
+медленная запись результата не задерживает поиск других сессий.
+
+Сессии, сброшенные на диск, остаются элементами отображения: их
+учитывают len(), итерация и проверка ``in``; число сессий в памяти
+возвращает свойство resident.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, MutableMapping, Optional, Tuple
+
+from src.application.session_service import GameSession
+from src.core import metrics
+from src.core.exceptions import StorageError
+
+SESSION_OVERHEAD = 1024
+
+
+def estimate_session_size(session: GameSession) -> int:
+    """Примерный объём памяти, занимаемый сессией, в байтах."""
+    word = session.game.word
+    return (
+        SESSION_OVERHEAD + sys.getsizeof(word.value) + sys.getsizeof(word.description)
+    )
+
+
+@dataclass
+class SessionStoreStats:
+    """Счётчики обращений к хранилищу сессий."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    spills: int = 0
+    restores: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SessionStore(MutableMapping):
+    """Отображение session_id -> GameSession с TTL, LRU и сбросом на диск."""
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = 10000,
+        max_memory: Optional[int] = None,
+        ttl: Optional[float] = 1800.0,
+        spill_dir: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+        on_finished: Optional[Callable[[GameSession], object]] = None,
+    ):
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError("Лимит сессий должен быть больше 0")
+        self.max_sessions = max_sessions
+        self.max_memory = max_memory
+        self.ttl = ttl
+        self.spill_dir = spill_dir
+        self.on_finished = on_finished
+        self.stats = SessionStoreStats()
+        self.__clock = clock
+        self.__sessions: "OrderedDict[str, Tuple[GameSession, float, int]]" = (
+            OrderedDict()
+        )
+        self.__memory = 0
+        # session_id -> время сброса по clock, в порядке сброса.
+        self.__spilled: "OrderedDict[str, float]" = OrderedDict()
+        self.__lock = threading.RLock()
+        # Законченные игры, ждущие передачи on_finished вне блокировки.
+        self.__finished: List[GameSession] = []
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+            self.__load_spilled()
+
+    def __load_spilled(self) -> None:
+        # Время сброса файлов прошлых запусков пересчитывается из mtime
+        # в шкалу clock, чтобы TTL отсчитывался от момента сброса.
+        offset = self.__clock() - time.time()
+        found = []
+        for name in os.listdir(self.spill_dir):
+            session_id = name[: -len(".json")]
+            if not name.endswith(".json") or not session_id.isalnum():
+                continue
+            try:
+                mtime = os.path.getmtime(os.path.join(self.spill_dir, name))
+            except OSError:
+                continue
+            found.append((mtime + offset, session_id))
+        for spilled_at, session_id in sorted(found):
+            self.__spilled[session_id] = spilled_at
+
+    @property
+    def spilled(self) -> int:
+        """Число сессий, сброшенных на диск."""
+        return len(self.__spilled)
+
+    @property
+    def resident(self) -> int:
+        """Число сессий в памяти."""
+        with self.__lock:
+            return len(self.__sessions)
+
+    @property
+    def memory(self) -> int:
+        """Оценка памяти, занятой сессиями в памяти, в байтах."""
+        return self.__memory
+
+    def __spill_path(self, session_id: str) -> Optional[str]:
+        if not self.spill_dir or not session_id.isalnum():
+            return None
+        return os.path.join(self.spill_dir, f"{session_id}.json")
+
+    def __getitem__(self, session_id: str) -> GameSession:
+        try:
+            with self.__lock:
+                self.__expire()
+                entry = self.__sessions.get(session_id)
+                if entry is not None:
+                    self.stats.hits += 1
+                    metrics.count("sessions_cache_hits")
+                    self.__insert(session_id, entry[0])
+                    return entry[0]
+                self.stats.misses += 1
+                metrics.count("sessions_cache_misses")
+                session = self.__restore(session_id)
+                if session is None:
+                    raise KeyError(session_id)
+                self.__insert(session_id, session)
+                self.__evict()
+                return session
+        finally:
+            self.__hand_over()
+
+    def __setitem__(self, session_id: str, session: GameSession) -> None:
+        try:
+            with self.__lock:
+                self.__remove_spilled(session_id)
+                self.__insert(session_id, session)
+                self.__expire()
+                self.__evict()
+        finally:
+            self.__hand_over()
+
+    def __delitem__(self, session_id: str) -> None:
+        with self.__lock:
+            entry = self.__sessions.pop(session_id, None)
+            spilled = self.__remove_spilled(session_id)
+            if entry is None and not spilled:
+                raise KeyError(session_id)
+            if entry is not None:
+                self.__memory -= entry[2]
+
+    def __iter__(self) -> Iterator[str]:
+        with self.__lock:
+            return iter([*self.__sessions, *self.__spilled])
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return len(self.__sessions) + len(self.__spilled)
+
+    def __contains__(self, session_id: object) -> bool:
+        with self.__lock:
+            return session_id in self.__sessions or session_id in self.__spilled
+
+    def __insert(self, session_id: str, session: GameSession) -> None:
+        old = self.__sessions.pop(session_id, None)
+        if old is not None:
+            self.__memory -= old[2]
+        size = estimate_session_size(session)
+        self.__sessions[session_id] = (session, self.__clock(), size)
+        self.__memory += size
+
+    def __over_limit(self) -> bool:
+        if self.max_sessions is not None and len(self.__sessions) > self.max_sessions:
+            return True
+        return self.max_memory is not None and self.__memory > self.max_memory
+
+    def __evict(self) -> None:
+        while len(self.__sessions) > 1 and self.__over_limit():
+            session_id, (session, _, size) = self.__sessions.popitem(last=False)
+            self.__memory -= size
+            self.stats.evictions += 1
+            if session.closed:
+                continue
+            if session.game.game_finished and self.on_finished is not None:
+                self.__finished.append(session)
+            else:
+                self.__spill(session)
+
+    def expire(self) -> int:
+        """Удалить сессии и файлы сброса старше ttl секунд.
+
+        Брошенные незаконченные игры удаляются, законченные передаются
+        on_finished (или сбрасываются на диск, если обработчика нет).
+        """
+        try:
+            with self.__lock:
+                return self.__expire()
+        finally:
+            self.__hand_over()
+
+    def __expire(self) -> int:
+        if self.ttl is None:
+            return 0
+        deadline = self.__clock() - self.ttl
+        expired = 0
+        with self.__lock:
+            while self.__sessions:
+                session_id, (session, last_access, size) = next(
+                    iter(self.__sessions.items())
+                )
+                if last_access > deadline:
+                    break
+                del self.__sessions[session_id]
+                self.__memory -= size
+                expired += 1
+                if not session.closed and session.game.game_finished:
+                    if self.on_finished is None:
+                        self.__spill(session)
+                    else:
+                        self.__finished.append(session)
+            while self.__spilled:
+                session_id, spilled_at = next(iter(self.__spilled.items()))
+                if spilled_at > deadline:
+                    break
+                self.__remove_spilled(session_id)
+                expired += 1
+            self.stats.expirations += expired
+        return expired
+
+    def __hand_over(self) -> None:
+        with self.__lock:
+            finished, self.__finished = self.__finished, []
+        for session in finished:
+            self.on_finished(session)
+
+    def __spill(self, session: GameSession) -> None:
+        path = self.__spill_path(session.session_id)
+        if path is None:
+            return
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(session.to_dict(), f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            raise StorageError(f"Ошибка сохранения сессии '{path}': {e}")
+        self.__spilled.pop(session.session_id, None)
+        self.__spilled[session.session_id] = self.__clock()
+        self.stats.spills += 1
+
+    def __restore(self, session_id: str) -> Optional[GameSession]:
+        if session_id not in self.__spilled:
+            return None
+        path = self.__spill_path(session_id)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data: Dict = json.load(f)
+            os.remove(path)
+        except (OSError, json.JSONDecodeError) as e:
+            raise StorageError(f"Ошибка загрузки сессии '{path}': {e}")
+        del self.__spilled[session_id]
+        self.stats.restores += 1
+        return GameSession.from_dict(data)
+
+    def __remove_spilled(self, session_id: str) -> bool:
+        if session_id not in self.__spilled:
+            return False
+        del self.__spilled[session_id]
+        try:
+            os.remove(self.__spill_path(session_id))
+        except FileNotFoundError:
+            pass
+        return True
@@ -0,0 +1,509 @@
+"""
+Хранилище слов, статистики и истории матчей в SQLite.
+
+База открывается в режиме WAL, поэтому несколько процессов могут читать
+её одновременно с писателем. Итоги игрока хранятся отдельной строкой и
+обновляются в одной транзакции с добавлением матча; запросы вроде
+"последний матч" или "победы в категории" выполняются по индексам.
+"""
+
+import json
+import random
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from src.application.config import GameConfig
+from src.core import metrics
+from src.core.entities import (
+    MatchStatistics,
+    PlayerStatistics,
+    StatisticsRollups,
+    Word,
+)
+from src.core.exceptions import (
+    CategoryNotFoundError,
+    LevelNotFoundError,
+    NoWordsError,
+    StorageError,
+)
+from src.core.interfaces import Storage
+from src.core.phases import DICTIONARY_LOAD, STATISTICS_IO, WORD_SELECTION, phase
+from src.infrastructure.storage import WordEntry
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS words (
+    position INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    level TEXT NOT NULL,
+    value TEXT NOT NULL,
+    description TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS words_value ON words (value);
+CREATE INDEX IF NOT EXISTS words_category_level ON words (category, level);
+
+CREATE TABLE IF NOT EXISTS player (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    games_played INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    total_score INTEGER NOT NULL DEFAULT 0,
+    rollups TEXT NOT NULL DEFAULT '{}'
+);
+INSERT OR IGNORE INTO player (id) VALUES (1);
+
+CREATE TABLE IF NOT EXISTS achievements (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    unlocked_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS matches (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    match_id TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    hint_used INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    category TEXT NOT NULL DEFAULT '',
+    level TEXT NOT NULL DEFAULT '',
+    timestamp REAL NOT NULL DEFAULT 0,
+    word_length INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS matches_match_id ON matches (match_id);
+CREATE INDEX IF NOT EXISTS matches_result ON matches (result);
+CREATE INDEX IF NOT EXISTS matches_timestamp ON matches (timestamp);
+CREATE INDEX IF NOT EXISTS matches_category_result ON matches (category, result);
+"""
+
+_MATCH_DEFAULTS = {
+    "match_id": "",
+    "score": 0,
+    "hint_used": False,
+    "errors": 0,
+    "result": "",
+    "category": "",
+    "level": "",
+    "timestamp": 0.0,
+    "word_length": 0,
+}
+_MATCH_COLUMNS = tuple(_MATCH_DEFAULTS)
+
+# Столбцы, добавленные после первой версии схемы.
+_MIGRATIONS = (
+    ("player", "rollups", "TEXT NOT NULL DEFAULT '{}'"),
+    ("matches", "word_length", "INTEGER NOT NULL DEFAULT 0"),
+)
+_SELECT_MATCHES = f"SELECT {', '.join(_MATCH_COLUMNS)} FROM matches"
+_INSERT_MATCH = (
+    f"INSERT INTO matches ({', '.join(_MATCH_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_MATCH_COLUMNS))})"
+)
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    """Добавить недостающие столбцы в базу, созданную старой версией схемы."""
+    for table, column, declaration in _MIGRATIONS:
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if columns and column not in columns:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+
+
+def _match_row(match: Mapping) -> tuple:
+    row = {
+        column: match.get(column, default)
+        for column, default in _MATCH_DEFAULTS.items()
+    }
+    row["hint_used"] = int(row["hint_used"])
+    return tuple(row.values())
+
+
+def _match_dict(row: tuple) -> Dict:
+    match = dict(zip(_MATCH_COLUMNS, row))
+    match["hint_used"] = bool(match["hint_used"])
+    return match
+
+
+@dataclass
+class SQLiteStorage(Storage):
+    """Хранилище на основе SQLite (WAL) с индексированной историей матчей."""
+
+    config: GameConfig
+    path: str
+    timeout: float = 30.0
+    _connection: Optional[sqlite3.Connection] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _lock: threading.RLock = field(
+        default_factory=threading.RLock, init=False, repr=False, compare=False
+    )
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Соединение с базой; схема и словарь создаются при первом открытии."""
+        if self._connection is None:
+            self._connection = self.__open()
+        return self._connection
+
+    @metrics.timed("storage.dictionary_load")
+    @phase(DICTIONARY_LOAD)
+    def __open(self) -> sqlite3.Connection:
+        """Открыть базу, создать схему и при необходимости импортировать словарь."""
+        try:
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            _migrate(conn)
+            conn.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            raise StorageError(f"Ошибка открытия базы '{self.path}': {e}")
+        self._connection = conn
+        if not self.__query_one("SELECT 1 FROM words LIMIT 1"):
+            self.import_words(self.config.categories)
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        try:
+            with self._lock:
+                return self.connection.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            raise StorageError(f"Ошибка чтения из базы: {e}")
+
+    def __query_one(self, sql: str, params: tuple = ()) -> Optional[tuple]:
+        rows = self.__query(sql, params)
+        return rows[0] if rows else None
+
+    @contextmanager
+    def __transaction(self) -> Iterator[sqlite3.Connection]:
+        """Транзакция с блокировкой записи (BEGIN IMMEDIATE)."""
+        try:
+            with self._lock:
+                conn = self.connection
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield conn
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            raise StorageError(f"Ошибка записи в базу: {e}")
+
+    def __write(self, statements: Iterable[Tuple[str, Iterable[tuple]]]) -> None:
+        """Выполнить набор изменений одной транзакцией."""
+        with self.__transaction() as conn:
+            for sql, rows in statements:
+                conn.executemany(sql, rows)
+
+    def import_words(self, categories: Mapping[str, Mapping[str, List[Word]]]) -> None:
+        """Заменить словарь в базе."""
+        rows = [
+            (category, level, word.value, word.description)
+            for category, levels in categories.items()
+            for level, word_list in levels.items()
+            for word in word_list
+        ]
+        self.__write(
+            [
+                ("DELETE FROM words", [()]),
+                (
+                    "INSERT INTO words (category, level, value, description) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                ),
+            ]
+        )
+
+    def get_categories(self) -> Sequence[str]:
+        """Получить список категорий."""
+        rows = self.__query(
+            "SELECT category FROM words GROUP BY category ORDER BY MIN(position)"
+        )
+        return tuple(row[0] for row in rows)
+
+    def get_levels(self) -> Sequence[str]:
+        """Получить список доступных уровней."""
+        rows = self.__query("SELECT DISTINCT level FROM words ORDER BY level")
+        return tuple(row[0] for row in rows)
+
+    def __check_category_level(self, category: str, level: Optional[str]) -> None:
+        if not self.__query_one(
+            "SELECT 1 FROM words WHERE category = ? LIMIT 1", (category,)
+        ):
+            raise CategoryNotFoundError(f"Категория '{category}' не найдена")
+        if level is not None and not self.__query_one(
+            "SELECT 1 FROM words WHERE category = ? AND level = ? LIMIT 1",
+            (category, level),
+        ):
+            raise LevelNotFoundError(f"Уровень '{level}' не найден")
+
+    @metrics.timed("storage.get_word")
+    @phase(WORD_SELECTION)
+    def get_word(self, category: str, level: str) -> Word:
+        """Получить случайное слово для категории и уровня."""
+        self.__check_category_level(category, level)
+        # import_words записывает слова одной группы подряд, поэтому их
+        # позиции образуют непрерывный отрезок. Индекс words_category_level
+        # неявно включает position (rowid), так что границы отрезка и строка
+        # по позиции находятся поиском по индексу, без перебора группы.
+        group = "FROM words WHERE category = ? AND level = ?"
+        first, last = self.__query_one(
+            f"SELECT (SELECT MIN(position) {group}), (SELECT MAX(position) {group})",
+            (category, level, category, level),
+        )
+        row = None
+        if first is not None:
+            row = self.__query_one(
+                "SELECT value, description FROM words "
+                "WHERE position = ? AND category = ? AND level = ?",
+                (random.randint(first, last), category, level),
+            )
+        if row is None:
+            raise NoWordsError(
+                f"Нет слов для категории '{category}' и уровня '{level}'"
+            )
+        return Word(*row)
+
+    def get_words_for_category_level(self, category: str, level: str) -> Sequence[Word]:
+        """Получить все слова для категории и уровня."""
+        self.__check_category_level(category, level)
+        rows = self.__query(
+            "SELECT value, description FROM words WHERE category = ? AND level = ? "
+            "ORDER BY position",
+            (category, level),
+        )
+        return tuple(Word(value, description) for value, description in rows)
+
+    def get_words_by_category(self, category: str) -> List[Tuple[str, Sequence[Word]]]:
+        """Получить слова по категории."""
+        self.__check_category_level(category, None)
+        by_level: Dict[str, List[Word]] = {}
+        for level, value, description in self.__query(
+            "SELECT level, value, description FROM words WHERE category = ? "
+            "ORDER BY position",
+            (category,),
+        ):
+            by_level.setdefault(level, []).append(Word(value, description))
+        return [(level, tuple(words)) for level, words in by_level.items()]
+
+    def __entry(self, word: str) -> Optional[WordEntry]:
+        row = self.__query_one(
+            "SELECT category, level, description FROM words WHERE value = ? "
+            "ORDER BY position LIMIT 1",
+            (word.lower(),),
+        )
+        if row is None:
+            return None
+        category, level, description = row
+        return WordEntry(
+            category,
+            level,
+            self.config.level_attempts.get(level, 6),
+            self.config.hints.get(word.lower(), description),
+        )
+
+    def get_hint(self, word: str) -> str:
+        """Получить подсказку для слова."""
+        hint = self.config.hints.get(word.lower())
+        if hint is None:
+            entry = self.__entry(word)
+            hint = entry.hint if entry else None
+        return hint if hint is not None else "Подсказка недоступна"
+
+    def check_word(self, word: str) -> Tuple[str, str]:
+        """Проверить наличие слова в базе."""
+        entry = self.__entry(word)
+        if entry is None:
+            raise NoWordsError(f"Слово '{word}' отсутствует в базе")
+        return entry.category, entry.level
+
+    def check_words(
+        self, words: Iterable[str]
+    ) -> List[Tuple[str, Optional[WordEntry]]]:
+        """Проверить набор слов."""
+        return [(word, self.__entry(word)) for word in words]
+
+    def determine_category_level_attempts(self, word: str) -> Tuple[str, str, int]:
+        """Определить категорию, уровень и попытки для слова."""
+        entry = self.__entry(word)
+        if entry is None:
+            return "внешнее", "внешнее", 6
+        return entry.category, entry.level, entry.attempts
+
+    @metrics.timed("storage.load")
+    @phase(STATISTICS_IO)
+    def load_achievements(self) -> PlayerStatistics:
+        """Загрузить статистику, достижения и историю матчей."""
+        games_played, wins, total_score, rollups = self.__query_one(
+            "SELECT games_played, wins, total_score, rollups FROM player WHERE id = 1"
+        )
+        match_history = [
+            _match_dict(row) for row in self.__query(f"{_SELECT_MATCHES} ORDER BY seq")
+        ]
+        rollups = json.loads(rollups)
+        return PlayerStatistics(
+            games_played=games_played,
+            wins=wins,
+            total_score=total_score,
+            unlocked_achievements=[
+                row[0]
+                for row in self.__query("SELECT name FROM achievements ORDER BY seq")
+            ],
+            match_history=match_history,
+            rollups=(
+                StatisticsRollups.from_dict(rollups)
+                if rollups
+                else StatisticsRollups.from_history(match_history)
+            ),
+        )
+
+    def load_rollups(self) -> StatisticsRollups:
+        """Загрузить только сводки статистики, без истории матчей."""
+        (rollups,) = self.__query_one("SELECT rollups FROM player WHERE id = 1")
+        rollups = json.loads(rollups)
+        if rollups:
+            return StatisticsRollups.from_dict(rollups)
+        return StatisticsRollups.from_history(
+            [
+                _match_dict(row)
+                for row in self.__query(f"{_SELECT_MATCHES} ORDER BY seq")
+            ]
+        )
+
+    @metrics.timed("storage.save")
+    @phase(STATISTICS_IO)
+    def save_achievements(self, stats: PlayerStatistics) -> None:
+        """Заменить всю статистику игрока."""
+        now = time.time()
+        self.__write(
+            [
+                ("DELETE FROM achievements", [()]),
+                ("DELETE FROM matches", [()]),
+                (
+                    "UPDATE player SET games_played = ?, wins = ?, total_score = ?, "
+                    "rollups = ? WHERE id = 1",
+                    [
+                        (
+                            stats.games_played,
+                            stats.wins,
+                            stats.total_score,
+                            json.dumps(stats.rollups.to_dict(), ensure_ascii=False),
+                        )
+                    ],
+                ),
+                (
+                    "INSERT OR IGNORE INTO achievements (name, unlocked_at) "
+                    "VALUES (?, ?)",
+                    [(name, now) for name in stats.unlocked_achievements],
+                ),
+                (_INSERT_MATCH, [_match_row(m) for m in stats.match_history]),
+            ]
+        )
+
+    @metrics.timed("storage.append")
+    @phase(STATISTICS_IO)
+    def record_match(self, match: MatchStatistics) -> None:
+        """Добавить матч, обновить итоги и сводки одной транзакцией."""
+        self.record_matches([match])
+
+    @metrics.timed("storage.append")
+    @phase(STATISTICS_IO)
+    def record_matches(self, matches: List[MatchStatistics]) -> None:
+        """Добавить несколько матчей одной транзакцией."""
+        with self.__transaction() as conn:
+            (raw,) = conn.execute("SELECT rollups FROM player WHERE id = 1").fetchone()
+            data = json.loads(raw)
+            if data:
+                rollups = StatisticsRollups.from_dict(data)
+            else:
+                rollups = StatisticsRollups.from_history(
+                    [_match_dict(row) for row in conn.execute(_SELECT_MATCHES)]
+                )
+            for match in matches:
+                rollups.add(match.__dict__)
+            conn.executemany(
+                _INSERT_MATCH, [_match_row(match.__dict__) for match in matches]
+            )
+            conn.execute(
+                "UPDATE player SET games_played = games_played + ?, "
+                "wins = wins + ?, total_score = total_score + ?, rollups = ? "
+                "WHERE id = 1",
+                (
+                    len(matches),
+                    sum(match.result == "win" for match in matches),
+                    sum(match.score for match in matches),
+                    json.dumps(rollups.to_dict(), ensure_ascii=False),
+                ),
+            )
+
+    @metrics.timed("storage.append")
+    @phase(STATISTICS_IO)
+    def unlock_achievements(self, names: List[str]) -> None:
+        """Записать открытые достижения."""
+        now = time.time()
+        self.__write(
+            [
+                (
+                    "INSERT OR IGNORE INTO achievements (name, unlocked_at) "
+                    "VALUES (?, ?)",
+                    [(name, now) for name in names],
+                )
+            ]
+        )
+
+    def last_match(self) -> Optional[Dict]:
+        """Последний сыгранный матч."""
+        row = self.__query_one(f"{_SELECT_MATCHES} ORDER BY seq DESC LIMIT 1")
+        return _match_dict(row) if row else None
+
+    def find_match(self, match_id: str) -> Optional[Dict]:
+        """Найти матч по идентификатору."""
+        row = self.__query_one(
+            f"{_SELECT_MATCHES} WHERE match_id = ? ORDER BY seq DESC LIMIT 1",
+            (match_id,),
+        )
+        return _match_dict(row) if row else None
+
+    def count_results(self, result: str, category: Optional[str] = None) -> int:
+        """Число матчей с результатом (например, 'win'), при необходимости в категории."""
+        if category is None:
+            row = self.__query_one(
+                "SELECT COUNT(*) FROM matches WHERE result = ?", (result,)
+            )
+        else:
+            row = self.__query_one(
+                "SELECT COUNT(*) FROM matches WHERE category = ? AND result = ?",
+                (category, result),
+            )
+        return row[0]
+
+    def matches_since(self, timestamp: float) -> List[Dict]:
+        """Матчи, сыгранные начиная с указанного момента."""
+        return [
+            _match_dict(row)
+            for row in self.__query(
+                f"{_SELECT_MATCHES} WHERE timestamp >= ? ORDER BY timestamp",
+                (timestamp,),
+            )
+        ]
@@ -0,0 +1,115 @@
+"""
+Профиль запуска командной строки: время импорта модулей.
+
+Команда выполняется в дочернем интерпретаторе с ``-X importtime``;
+вывод команды отбрасывается, а по строкам importtime строится отчёт:
+общее время процесса и импорта, собственное время импорта по пакетам и
+самые дорогие модули вместе с зависимостями.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, TextIO
+
+IMPORTTIME_PREFIX = "import time:"
+TOP_MODULES = 15
+
+
+class ImportTiming(NamedTuple):
+    """Время импорта одного модуля в микросекундах."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(lines: Iterable[str]) -> List[ImportTiming]:
+    """Разобрать строки вывода ``-X importtime`` (прочие строки пропускаются)."""
+    timings = []
+    for line in lines:
+        if not line.startswith(IMPORTTIME_PREFIX):
+            continue
+        fields = line[len(IMPORTTIME_PREFIX) :].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # строка заголовка
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        depth = (len(name) - len(module) - 1) // 2
+        timings.append(ImportTiming(module, self_us, cumulative_us, depth))
+    return timings
+
+
+def package_of(module: str) -> str:
+    """Группа модуля для отчёта: слой для src, пакет верхнего уровня иначе."""
+    parts = module.split(".")
+    if parts[0] == "src" and len(parts) > 1:
+        return ".".join(parts[:2])
+    return parts[0]
+
+
+def format_report(
+    timings: Sequence[ImportTiming], wall_seconds: float, top: int = TOP_MODULES
+) -> str:
+    """Текстовый отчёт о времени импорта."""
+    total_us = sum(t.self_us for t in timings)
+    by_package: Dict[str, int] = defaultdict(int)
+    for t in timings:
+        by_package[package_of(t.module)] += t.self_us
+
+    lines = [
+        f"Время процесса: {wall_seconds * 1000:.1f} мс, "
+        f"импорт: {total_us / 1000:.1f} мс ({len(timings)} модулей)",
+        "",
+        "Собственное время импорта по пакетам:",
+    ]
+    for package, us in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+        share = us / total_us * 100 if total_us else 0.0
+        lines.append(f"  {us / 1000:8.2f} мс  {share:5.1f}%  {package}")
+    lines += ["", "Самые дорогие модули (с зависимостями / собственное):"]
+    for t in sorted(timings, key=lambda t: -t.cumulative_us)[:top]:
+        lines.append(
+            f"  {t.cumulative_us / 1000:8.2f} мс  {t.self_us / 1000:8.2f} мс  "
+            f"{'  ' * t.depth}{t.module}"
+        )
+    return "\n".join(lines)
+
+
+def profile_startup(
+    argv: Sequence[str], out: Optional[TextIO] = None, top: int = TOP_MODULES
+) -> int:
+    """Выполнить ``python -m src.main argv`` с профилем импорта и вывести отчёт.
+
+    Возвращает код завершения команды.
+    """
+    out = out or sys.stdout
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in (root, env.get("PYTHONPATH")) if path
+    )
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "src.main", *argv],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        env=env,
+        encoding="utf-8",
+        errors="replace",
+    )
+    wall_seconds = time.perf_counter() - started
+
+    lines = completed.stderr.splitlines()
+    for line in lines:
+        if not line.startswith(IMPORTTIME_PREFIX):
+            print(line, file=sys.stderr)
+    out.write(format_report(parse_importtime(lines), wall_seconds, top) + "\n")
+    return completed.returncode
@@ -1,11 +1,20 @@
-import json
 import os
 import random
-from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from dataclasses import dataclass, field
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from src.application.config import GameConfig
-from src.core.entities import PlayerStatistics, Word
+from src.core import metrics
+from src.core.entities import MatchStatistics, PlayerStatistics, Word
 from src.core.exceptions import (
     CategoryNotFoundError,
     LevelNotFoundError,
@@ -13,120 +22,284 @@ from src.core.exceptions import (
     StorageError,
 )
 from src.core.interfaces import Storage
+from src.core.phases import DICTIONARY_LOAD, STATISTICS_IO, WORD_SELECTION, phase
+from src.infrastructure.dictionary import MappedDictionary
+from src.infrastructure.journal import (
+    DEFAULT_COMPACT_EVERY,
+    StatisticsJournal,
+    achievement_record,
+    match_record,
+)
+
+
+class WordEntry(NamedTuple):
+    """Запись обратного индекса слов."""
+
+    category: str
+    level: str
+    attempts: int
+    hint: str
+
+
+class DictionaryViews:
+    """Производные представления словаря, вычисленные для одного поколения.
+
+    Категории и уровни считаются сразу, кортежи слов и их количество -
+    при первом запросе пары (категория, уровень).
+    """
+
+    def __init__(self, words: Mapping[str, Mapping[str, List[Word]]], generation: int):
+        self.generation = generation
+        self.categories: Tuple[str, ...] = tuple(words)
+        self.levels: Tuple[str, ...] = tuple(
+            sorted({level for levels in words.values() for level in levels})
+        )
+        self.__words = words
+        self.__word_lists: Dict[Tuple[str, str], Tuple[Word, ...]] = {}
+
+    def words_for(self, category: str, level: str) -> Tuple[Word, ...]:
+        """Слова для категории и уровня."""
+        key = (category, level)
+        word_list = self.__word_lists.get(key)
+        if word_list is None:
+            if category not in self.__words:
+                raise CategoryNotFoundError(f"Категория '{category}' не найдена")
+            if level not in self.__words[category]:
+                raise LevelNotFoundError(f"Уровень '{level}' не найден")
+            word_list = tuple(self.__words[category][level])
+            self.__word_lists[key] = word_list
+        return word_list
+
+    def count(self, category: str, level: str) -> int:
+        """Количество слов для категории и уровня."""
+        return len(self.words_for(category, level))
 
 
 @dataclass
 class FileStorage(Storage):
-    """Хранилище слов и достижений на основе файлов."""
+    """Хранилище слов и достижений на основе файлов.
+
+    journal_path и compact_every настраивают журнал статистики: путь к
+    файлу журнала (по умолчанию рядом со снимком) и число записей, после
+    которого журнал сворачивается в снимок.
+    """
 
     config: GameConfig
+    dictionary_path: Optional[str] = None
+    statistics_path: Optional[str] = None
+    journal_path: Optional[str] = None
+    compact_every: int = DEFAULT_COMPACT_EVERY
+    _dictionary: Optional[MappedDictionary] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _word_index: Optional[Dict[str, WordEntry]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _views: Optional[DictionaryViews] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _journal: Optional[StatisticsJournal] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _generation: int = field(default=0, init=False, repr=False, compare=False)
+
+    @property
+    def generation(self) -> int:
+        """Поколение словаря; меняется при перезагрузке."""
+        return self._generation
+
+    def reload(self) -> None:
+        """Перечитать словарь и сбросить производные представления."""
+        if self._dictionary is not None:
+            self._dictionary.close()
+            self._dictionary = None
+        self._word_index = None
+        self._generation += 1
+
+    @property
+    def views(self) -> DictionaryViews:
+        """Кэшированные представления словаря текущего поколения."""
+        if self._views is None or self._views.generation != self._generation:
+            metrics.count("views_cache_misses")
+            self._views = self._load_views()
+        else:
+            metrics.count("views_cache_hits")
+        return self._views
+
+    @metrics.timed("storage.dictionary_load")
+    @phase(DICTIONARY_LOAD)
+    def _load_views(self) -> DictionaryViews:
+        return DictionaryViews(self.load_words(), self._generation)
+
+    def word_index(self) -> Dict[str, WordEntry]:
+        """Обратный индекс слово -> (категория, уровень, попытки, подсказка).
+
+        Строится один раз при первом обращении; при повторах слова
+        сохраняется первое вхождение в порядке словаря.
+        """
+        if self._word_index is None:
+            metrics.count("word_index_cache_misses")
+            self._word_index = self._build_word_index()
+        else:
+            metrics.count("word_index_cache_hits")
+        return self._word_index
+
+    @metrics.timed("storage.dictionary_load")
+    @phase(DICTIONARY_LOAD)
+    def _build_word_index(self) -> Dict[str, WordEntry]:
+        index: Dict[str, WordEntry] = {}
+        for category, levels in self.load_words().items():
+            for level, word_list in levels.items():
+                attempts = self.config.level_attempts.get(level, 6)
+                for w in word_list:
+                    if w.value not in index:
+                        index[w.value] = WordEntry(
+                            category,
+                            level,
+                            attempts,
+                            self.config.hints.get(w.value, w.description),
+                        )
+        return index
+
+    def find_word(self, word: str) -> Optional[WordEntry]:
+        """Найти одно слово.
+
+        В скомпилированном словаре, пока обратный индекс не построен, слово
+        ищется по таблице поиска файла без декодирования секций; иначе -
+        по обратному индексу.
+        """
+        if self.dictionary_path and self._word_index is None:
+            self.load_words()
+            found = self._dictionary.find(word)
+            if found is None:
+                return None
+            category, level, entry = found
+            return WordEntry(
+                category,
+                level,
+                self.config.level_attempts.get(level, 6),
+                self.config.hints.get(entry.value, entry.description),
+            )
+        return self.word_index().get(word)
 
-    def load_words(self) -> Dict[str, Dict[str, List[Word]]]:
-        """Получить слова из конфигурации."""
+    def load_words(self) -> Mapping[str, Mapping[str, List[Word]]]:
+        """Получить слова из скомпилированного словаря или конфигурации."""
+        if self.dictionary_path:
+            if self._dictionary is None:
+                self._dictionary = MappedDictionary(self.dictionary_path)
+            return self._dictionary
         if not self.config.categories:
             raise StorageError("Конфигурация не содержит слов")
         return self.config.categories
 
+    @property
+    def journal(self) -> StatisticsJournal:
+        """Журнал статистики игрока."""
+        if self._journal is None:
+            self._journal = StatisticsJournal(
+                self.statistics_path
+                or os.path.join(os.path.dirname(__file__), "player_statistics.json"),
+                journal_path=self.journal_path,
+                compact_every=self.compact_every,
+            )
+            metrics.gauge("statistics_file_bytes", self._journal.size)
+        return self._journal
+
+    def close(self) -> None:
+        """Довести сворачивание журнала статистики до конца."""
+        if self._journal is not None:
+            self._journal.close()
+
+    @metrics.timed("storage.load")
+    @phase(STATISTICS_IO)
     def load_achievements(self) -> PlayerStatistics:
         """Загрузить статистику и достижения игрока."""
-        try:
-            file_path = os.path.join(
-                os.path.dirname(__file__), "player_statistics.json"
-            )
-            if not os.path.exists(file_path):
-                default_stats = PlayerStatistics()
-                self.save_achievements(default_stats)
-                return default_stats
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return PlayerStatistics(
-                games_played=data.get("games_played", 0),
-                wins=data.get("wins", 0),
-                total_score=data.get("total_score", 0),
-                unlocked_achievements=data.get("unlocked_achievements", []),
-                match_history=data.get("match_history", []),
-            )
-        except (FileNotFoundError, json.JSONDecodeError):
-            raise StorageError("Ошибка чтения статистики из 'player_statistics.json'")
+        return self.journal.load()
 
+    @metrics.timed("storage.save")
+    @phase(STATISTICS_IO)
     def save_achievements(self, stats: PlayerStatistics) -> None:
-        """Сохранить статистику и достижения игрока."""
-        try:
-            file_path = os.path.join(
-                os.path.dirname(__file__), "player_statistics.json"
-            )
-            data = {
-                "games_played": stats.games_played,
-                "wins": stats.wins,
-                "total_score": stats.total_score,
-                "unlocked_achievements": stats.unlocked_achievements,
-                "match_history": stats.match_history,
-            }
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except OSError:
-            raise StorageError("Ошибка записи статистики в 'player_statistics.json'")
-
-    def get_categories(self) -> List[str]:
+        """Сохранить полный снимок статистики и достижений игрока."""
+        self.journal.write_snapshot(stats)
+
+    @metrics.timed("storage.append")
+    @phase(STATISTICS_IO)
+    def record_match(self, match: MatchStatistics) -> None:
+        """Дописать результат матча в журнал статистики."""
+        self.journal.append([match_record(match)])
+
+    @metrics.timed("storage.append")
+    @phase(STATISTICS_IO)
+    def record_matches(self, matches: List[MatchStatistics]) -> None:
+        """Дописать результаты нескольких матчей одной записью."""
+        self.journal.append(match_record(match) for match in matches)
+
+    @metrics.timed("storage.append")
+    @phase(STATISTICS_IO)
+    def unlock_achievements(self, names: List[str]) -> None:
+        """Дописать открытые достижения в журнал статистики."""
+        self.journal.append(achievement_record(name) for name in names)
+
+    def get_categories(self) -> Sequence[str]:
         """Получить список категорий."""
-        return list(self.load_words().keys())
+        return self.views.categories
 
-    def get_levels(self) -> List[str]:
+    def get_levels(self) -> Sequence[str]:
         """Получить список доступных уровней."""
-        words = self.load_words()
-        levels = set()
-        for category in words:
-            levels.update(words[category].keys())
-        return sorted(list(levels))
+        return self.views.levels
 
+    @metrics.timed("storage.get_word")
+    @phase(WORD_SELECTION)
     def get_word(self, category: str, level: str) -> Word:
         """Получить случайное слово для категории и уровня."""
-        words = self.load_words()
-        if category not in words:
-            raise CategoryNotFoundError(f"Категория '{category}' не найдена")
-        if level not in words[category]:
-            raise LevelNotFoundError(f"Уровень '{level}' не найден")
-        word_list = words[category][level]
+        word_list = self.views.words_for(category, level)
         if not word_list:
             raise NoWordsError(
                 f"Нет слов для категории '{category}' и уровня '{level}'"
             )
         return random.choice(word_list)
 
-    def get_words_by_category(self, category: str) -> List[Tuple[str, List[Word]]]:
+    def get_words_by_category(self, category: str) -> List[Tuple[str, Sequence[Word]]]:
         """Получить слова по категории."""
         words = self.load_words()
         if category not in words:
             raise CategoryNotFoundError(f"Категория '{category}' не найдена")
-        return [(level, word_list) for level, word_list in words[category].items()]
+        views = self.views
+        return [(level, views.words_for(category, level)) for level in words[category]]
 
-    def get_words_for_category_level(self, category: str, level: str) -> List[Word]:
+    def get_words_for_category_level(self, category: str, level: str) -> Sequence[Word]:
         """Получить все слова для категории и уровня."""
-        words = self.load_words()
-        if category not in words:
-            raise CategoryNotFoundError(f"Категория '{category}' не найдена")
-        if level not in words[category]:
-            raise LevelNotFoundError(f"Уровень '{level}' не найден")
-        return words[category][level]
+        return self.views.words_for(category, level)
+
+    def count_words(self, category: str, level: str) -> int:
+        """Количество слов для категории и уровня."""
+        return self.views.count(category, level)
 
     def get_hint(self, word: str) -> str:
         """Получить подсказку для слова."""
-        return self.config.hints.get(word.lower(), "Подсказка недоступна")
+        hint = self.config.hints.get(word.lower())
+        if hint is None and self.dictionary_path:
+            entry = self.find_word(word.lower())
+            hint = entry.hint if entry else None
+        return hint if hint is not None else "Подсказка недоступна"
 
     def check_word(self, word: str) -> Tuple[str, str]:
         """Проверить наличие слова в базе."""
-        words = self.load_words()
-        for category, levels in words.items():
-            for level, word_list in levels.items():
-                for w in word_list:
-                    if w.value == word.lower():
-                        return category, level
-        raise NoWordsError(f"Слово '{word}' отсутствует в базе")
+        entry = self.find_word(word.lower())
+        if entry is None:
+            raise NoWordsError(f"Слово '{word}' отсутствует в базе")
+        return entry.category, entry.level
+
+    def check_words(
+        self, words: Iterable[str]
+    ) -> List[Tuple[str, Optional[WordEntry]]]:
+        """Проверить набор слов за один проход по индексу."""
+        index = self.word_index()
+        return [(word, index.get(word.lower())) for word in words]
 
     def determine_category_level_attempts(self, word: str) -> Tuple[str, str, int]:
         """Определить категорию, уровень и попытки для слова."""
-        try:
-            category, level = self.check_word(word)
-            return category, level, self.config.level_attempts.get(level, 6)
-        except NoWordsError:
+        entry = self.find_word(word.lower())
+        if entry is None:
             return "внешнее", "внешнее", 6
+        return entry.category, entry.level, entry.attempts
@@ -0,0 +1,95 @@
+"""
+Отрисовка экранов консольного интерфейса ANSI-последовательностями.
+
+Кадр собирается целиком в памяти и выводится одной записью в поток.
+Первый кадр очищает экран; следующие перерисовывают только строки,
+отличающиеся от предыдущего кадра, и стирают всё ниже кадра (приглашение
+ввода и сообщения прошлого хода). Если кадр не помещается в терминал и
+экран мог прокрутиться, он рисуется заново целиком. Когда поток не
+терминал, кадры выводятся обычным текстом без управляющих
+последовательностей.
+"""
+
+import re
+import shutil
+import sys
+from typing import List, Optional, Sequence, TextIO
+
+from src.core import metrics
+from src.core.phases import RENDERING, phase
+
+CLEAR_SCREEN = "\x1b[H\x1b[2J"
+CLEAR_LINE = "\x1b[2K"
+CLEAR_BELOW = "\x1b[J"
+# Строки под кадром для приглашения ввода, ответа и сообщения об ошибке.
+RESERVED_LINES = 4
+
+_STYLE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def move_to(row: int) -> str:
+    """Переместить курсор в начало строки row (нумерация с нуля)."""
+    return f"\x1b[{row + 1};1H"
+
+
+def visible_width(line: str) -> int:
+    """Ширина строки на экране без учёта цветовых последовательностей."""
+    return len(_STYLE.sub("", line))
+
+
+class TerminalRenderer:
+    """Вывод кадров с перерисовкой только изменившихся строк."""
+
+    def __init__(self, stream: Optional[TextIO] = None, ansi: Optional[bool] = None):
+        self.__stream = stream
+        self.__ansi = ansi
+        self.__previous: Optional[List[str]] = None
+
+    @property
+    def stream(self) -> TextIO:
+        return self.__stream or sys.stdout
+
+    @property
+    def ansi(self) -> bool:
+        if self.__ansi is None:
+            isatty = getattr(self.stream, "isatty", None)
+            return bool(isatty and isatty())
+        return self.__ansi
+
+    def reset(self) -> None:
+        """Нарисовать следующий кадр целиком."""
+        self.__previous = None
+
+    @metrics.timed("render")
+    @phase(RENDERING)
+    def render(self, blocks: Sequence[str]) -> None:
+        """Вывести кадр; многострочные элементы разбиваются на строки."""
+        frame = [line for block in blocks for line in block.split("\n")]
+        if not self.ansi:
+            self.__write("\n".join(frame) + "\n")
+            return
+        fits = self.__fits(frame)
+        if self.__previous is None or not fits:
+            output = CLEAR_SCREEN + "\n".join(frame) + "\n"
+        else:
+            parts = [
+                f"{move_to(row)}{CLEAR_LINE}{line}"
+                for row, line in enumerate(frame)
+                if row >= len(self.__previous) or self.__previous[row] != line
+            ]
+            parts.append(move_to(len(frame)) + CLEAR_BELOW)
+            output = "".join(parts)
+        self.__write(output)
+        # После прокрутки строки экрана не совпадают с номерами строк кадра.
+        self.__previous = frame if fits else None
+
+    def __fits(self, frame: List[str]) -> bool:
+        columns, lines = shutil.get_terminal_size()
+        return len(frame) + RESERVED_LINES <= lines and all(
+            visible_width(line) <= columns for line in frame
+        )
+
+    def __write(self, text: str) -> None:
+        stream = self.stream
+        stream.write(text)
+        stream.flush()
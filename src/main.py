@@ -1,12 +1,22 @@
 """
 Точка входа в приложение Виселица.
+
+Модули режимов (CLI, хранилища, серверы, пакетный режим) импортируются
+внутри обработчиков, чтобы каждый вызов загружал только то, что использует.
 """
 
 import argparse
+import atexit
+import signal
 import sys
+from typing import Iterable
 
-from src.application.config import GameConfig
-from src.application.game_service import GameService
+from src.application.config import (
+    DEFAULT_HOST,
+    DEFAULT_HTTP_PORT,
+    DEFAULT_PORT,
+    GameConfig,
+)
 from src.core.exceptions import (
     CLIArgumentError,
     HangmanError,
@@ -14,8 +24,7 @@ from src.core.exceptions import (
     NonInteractiveModeError,
     StorageError,
 )
-from src.infrastructure.cli_ui import InteractiveCLI, NonInteractiveCLI
-from src.infrastructure.storage import FileStorage
+from src.core.interfaces import Storage
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -32,6 +41,17 @@ def create_parser() -> argparse.ArgumentParser:
   python -m src.main --words животные
   python -m src.main --hint кот
   python -m src.main --stats
+  python -m src.main --batch games.txt --workers 4
+  python -m src.main --check-file words.txt
+  python -m src.main --compile-dictionary words.hmd
+  python -m src.main --compile-dictionary words.hmd --source words.txt
+  python -m src.main --dictionary words.hmd --words животные
+  python -m src.main --serve --port 7777
+  python -m src.main --http --memory --port 8080
+  python -m src.main --startup-profile --categories
+  python -m src.main --profile prof --batch games.txt
+  python -m src.main --metrics --batch games.txt
+  python -m src.main --http --prometheus-port 9464
         """,
     )
 
@@ -55,6 +75,12 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--check", type=str, metavar="WORD", help="Проверить наличие слова в базе"
     )
+    parser.add_argument(
+        "--check-file",
+        type=str,
+        metavar="FILE",
+        help="Проверить слова из файла, по одному в строке ('-' - стандартный ввод)",
+    )
     parser.add_argument(
         "--category",
         type=str,
@@ -70,30 +96,145 @@ def create_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--stats", action="store_true", help="Показать статистику игрока"
     )
+    parser.add_argument(
+        "--dictionary",
+        type=str,
+        metavar="PATH",
+        help="Использовать скомпилированный словарь",
+    )
+    parser.add_argument(
+        "--sqlite",
+        type=str,
+        metavar="PATH",
+        help="Хранить слова и статистику в базе SQLite",
+    )
+    parser.add_argument(
+        "--compile-dictionary",
+        type=str,
+        metavar="PATH",
+        help="Скомпилировать словарь (встроенный или из --source) в файл",
+    )
+    parser.add_argument(
+        "--source",
+        type=str,
+        metavar="FILE",
+        help="Текстовый словарь для --compile-dictionary: строки "
+        "'категория;уровень;слово[;подсказка]'",
+    )
+    parser.add_argument(
+        "--batch",
+        type=str,
+        metavar="FILE",
+        help="Сыграть записи 'слово буквы' из файла ('-' - стандартный ввод)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Число процессов для пакетного режима (0 - в текущем процессе)",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Запустить многопользовательский текстовый сервер",
+    )
+    parser.add_argument(
+        "--http",
+        action="store_true",
+        help="Запустить HTTP/JSON API вместо текстового сервера",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Хранить статистику только в памяти (для нагрузочных тестов)",
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default=DEFAULT_HOST,
+        help=f"Адрес сервера (по умолчанию {DEFAULT_HOST})",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        help=f"Порт сервера (по умолчанию {DEFAULT_PORT}, для HTTP {DEFAULT_HTTP_PORT})",
+    )
+    parser.add_argument(
+        "--profile",
+        type=str,
+        metavar="DIR",
+        help="Профилировать запуск по фазам игры (cProfile) и записать отчёт в каталог",
+    )
+    parser.add_argument(
+        "--metrics",
+        type=str,
+        nargs="?",
+        const="-",
+        metavar="PATH",
+        help="Собирать задержки фаз и счётчики; отчёт при выходе и по SIGUSR1 "
+        "(в файл PATH или в stderr)",
+    )
+    parser.add_argument(
+        "--prometheus-file",
+        type=str,
+        metavar="PATH",
+        help="Периодически записывать метрики в формате Prometheus в файл",
+    )
+    parser.add_argument(
+        "--prometheus-port",
+        type=int,
+        metavar="PORT",
+        help="Отдавать метрики в формате Prometheus по HTTP (127.0.0.1:PORT/metrics)",
+    )
+    parser.add_argument(
+        "--prometheus-interval",
+        type=float,
+        default=15.0,
+        metavar="SEC",
+        help="Период записи файла метрик в секундах (по умолчанию 15)",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="Выполнить команду и показать время импорта модулей при запуске",
+    )
     parser.add_argument("--version", action="version", version="Виселица v2.0 (2025)")
 
     return parser
 
 
-def handle_non_interactive_mode(
-    args: argparse.Namespace, storage: FileStorage, config: GameConfig
-) -> None:
-    """Обработать неинтерактивный режим."""
+def handle_non_interactive_mode(args: argparse.Namespace) -> None:
+    """Обработать неинтерактивный режим.
+
+    Конфигурация и хранилище создаются только командами, которым они
+    нужны: --levels обходится без хранилища, --compile-dictionary с
+    --source - без конфигурации.
+    """
+
+    def storage() -> Storage:
+        return open_storage(args, GameConfig())
+
     try:
         if args.word and args.guesses:
             if not args.word.strip() or not args.guesses.strip():
                 raise CLIArgumentError("Слово и буквы не могут быть пустыми")
-            ui = NonInteractiveCLI(args.word, args.guesses)
+            from src.infrastructure.cli_ui import NonInteractiveCLI
+
+            ui = NonInteractiveCLI(args.word, args.guesses, storage())
             output = ui.run()
             print(output)
+        elif args.batch:
+            handle_batch_mode(args, storage())
         elif args.categories:
             print("Доступные категории:")
-            categories = storage.get_categories()
+            categories = storage().get_categories()
             if not categories:
                 print("  (нет категорий)")
             for category in categories:
                 print(f"  - {category}")
         elif args.levels:
+            config = GameConfig()
             print("Уровни сложности:")
             if not config.level_attempts:
                 print("  (нет уровней)")
@@ -103,7 +244,7 @@ def handle_non_interactive_mode(
             if not args.words.strip():
                 raise CLIArgumentError("Категория не может быть пустой")
             print(f"Слова в категории '{args.words}':")
-            for level, words in storage.get_words_by_category(args.words):
+            for level, words in storage().get_words_by_category(args.words):
                 word_list = [word.value for word in words]
                 print(
                     f"  {level}: {', '.join(word_list) if word_list else '(нет слов)'}"
@@ -111,26 +252,105 @@ def handle_non_interactive_mode(
         elif args.hint:
             if not args.hint.strip():
                 raise CLIArgumentError("Требуется слово для подсказки")
-            hint = storage.get_hint(args.hint.lower())
+            hint = storage().get_hint(args.hint.lower())
             print(f"Подсказка для слова '{args.hint}': {hint}")
         elif args.check:
             if not args.check.strip():
                 raise CLIArgumentError("Требуется слово для проверки")
-            category, level = storage.check_word(args.check.lower())
+            category, level = storage().check_word(args.check.lower())
             print(
                 f"Слово '{args.check}' найдено: категория '{category}', уровень '{level}'"
             )
+        elif args.check_file:
+            handle_check_file_mode(args, storage())
+        elif args.compile_dictionary:
+            from src.infrastructure.dictionary import (
+                compile_dictionary,
+                load_word_list,
+            )
+
+            categories = (
+                load_word_list(args.source) if args.source else GameConfig().categories
+            )
+            compile_dictionary(categories, args.compile_dictionary)
+            print(f"Словарь записан в '{args.compile_dictionary}'")
         else:
             raise CLIArgumentError("Неверные аргументы для неинтерактивного режима")
     except Exception as e:
         raise NonInteractiveModeError(f"Ошибка в неинтерактивном режиме: {e}")
 
 
-def handle_interactive_mode(args: argparse.Namespace, config: GameConfig) -> None:
+def handle_batch_mode(args: argparse.Namespace, storage: Storage) -> None:
+    """Обработать пакетный режим: поток записей 'слово буквы'."""
+    if args.workers < 0:
+        raise CLIArgumentError("Число процессов не может быть отрицательным")
+    from src.infrastructure.batch_cli import run_batch
+
+    if args.batch == "-":
+        run_batch(sys.stdin, sys.stdout, storage, args.workers)
+        return
+    try:
+        with open(args.batch, "r", encoding="utf-8") as f:
+            run_batch(f, sys.stdout, storage, args.workers)
+    except OSError as e:
+        raise CLIArgumentError(f"Не удалось прочитать файл '{args.batch}': {e}")
+
+
+def check_words_stream(lines: Iterable[str], storage: Storage) -> None:
+    """Вывести 'слово;категория;уровень;попытки' или 'слово;-' для каждого слова."""
+    words = (line.strip() for line in lines)
+    for word, entry in storage.check_words(word for word in words if word):
+        if entry is None:
+            print(f"{word};-")
+        else:
+            print(f"{word};{entry.category};{entry.level};{entry.attempts}")
+
+
+def handle_check_file_mode(args: argparse.Namespace, storage: Storage) -> None:
+    """Обработать массовую проверку слов из файла."""
+    if args.check_file == "-":
+        check_words_stream(sys.stdin, storage)
+        return
+    try:
+        with open(args.check_file, "r", encoding="utf-8") as f:
+            check_words_stream(f, storage)
+    except OSError as e:
+        raise CLIArgumentError(f"Не удалось прочитать файл '{args.check_file}': {e}")
+
+
+def create_storage(args: argparse.Namespace, config: GameConfig) -> Storage:
+    """Создать хранилище согласно аргументам командной строки."""
+    if args.sqlite:
+        from src.infrastructure.sqlite_storage import SQLiteStorage
+
+        return SQLiteStorage(config, args.sqlite)
+    if args.memory:
+        from src.infrastructure.memory_storage import MemoryStorage
+
+        return MemoryStorage(config, args.dictionary)
+    from src.infrastructure.storage import FileStorage
+
+    return FileStorage(config, args.dictionary)
+
+
+def open_storage(args: argparse.Namespace, config: GameConfig) -> Storage:
+    """Создать хранилище; ошибка создания сообщается как StorageError."""
+    try:
+        return create_storage(args, config)
+    except Exception as e:
+        raise StorageError(f"Ошибка инициализации хранилища: {e}")
+
+
+def handle_interactive_mode(args: argparse.Namespace) -> None:
     """Обработать интерактивный режим."""
+    from src.application.game_service import GameService
+    from src.infrastructure.cli_ui import InteractiveCLI
+
+    config = GameConfig()
+    storage = open_storage(args, config)
+    service = None
     try:
-        storage = FileStorage(config)
-        ui = InteractiveCLI(config, args.category, args.level)
+        ui = InteractiveCLI(config, args.category, args.level, storage)
         service = GameService(storage, ui, config)
         if ui.run(args.category, args.level):
             service.start_game(args.category, args.level)
@@ -139,25 +359,56 @@ def handle_interactive_mode(args: argparse.Namespace, config: GameConfig) -> Non
         print("\nИгра прервана")
     except Exception as e:
         raise InteractiveModeError(f"Ошибка в интерактивном режиме: {e}")
+    finally:
+        if service is not None:
+            service.close()
 
 
-def handle_statistics_mode(args: argparse.Namespace, config: GameConfig) -> None:
+def handle_statistics_mode(args: argparse.Namespace) -> None:
     """Обработать режим отображения статистики."""
+    from src.application.game_service import GameService
+    from src.infrastructure.cli_ui import InteractiveCLI
+
+    config = GameConfig()
+    storage = open_storage(args, config)
     try:
-        storage = FileStorage(config)
-        ui = InteractiveCLI(config)
+        ui = InteractiveCLI(config, storage=storage)
         service = GameService(storage, ui, config)
         service.view_statistics()
     except Exception as e:
         raise InteractiveModeError(f"Ошибка при отображении статистики: {e}")
 
 
-def main() -> None:
-    """Точка входа приложения."""
-    parser = create_parser()
-    args = parser.parse_args()
+def handle_serve_mode(args: argparse.Namespace) -> None:
+    """Обработать режим сервера (текстового или HTTP)."""
+    import asyncio
+
+    from src.infrastructure.game_server import GameServer
+    from src.infrastructure.http_api import HttpApiServer
+    from src.infrastructure.session_store import SessionStore
+
     config = GameConfig()
+    storage = open_storage(args, config)
+    if args.http:
+        server = HttpApiServer.from_storage(storage, config, SessionStore())
+        port = DEFAULT_HTTP_PORT if args.port is None else args.port
+    else:
+        server = GameServer.from_storage(storage, config)
+        port = DEFAULT_PORT if args.port is None else args.port
+    print(f"Сервер запущен на {args.host}:{port}")
+    try:
+        asyncio.run(server.serve_forever(args.host, port))
+    except KeyboardInterrupt:
+        print("\nСервер остановлен")
+    except OSError as e:
+        raise CLIArgumentError(f"Не удалось запустить сервер: {e}")
+
+
+def run(args: argparse.Namespace) -> None:
+    """Выполнить режим, выбранный аргументами командной строки.
 
+    Конфигурацию и хранилище создают обработчики режимов, которым они нужны.
+    """
     try:
         import src
     except ImportError as e:
@@ -167,25 +418,128 @@ def main() -> None:
         raise CLIArgumentError("Неверная структура проекта")
 
     try:
-        storage = FileStorage(config)
-    except Exception as e:
-        raise StorageError(f"Ошибка инициализации хранилища: {e}")
-
-    try:
-        if args.stats:
-            handle_statistics_mode(args, config)
+        if args.serve or args.http:
+            handle_serve_mode(args)
+        elif args.stats:
+            handle_statistics_mode(args)
         elif (
             args.word
             or args.guesses
+            or args.batch
+            or args.check_file
+            or args.compile_dictionary
             or any([args.categories, args.levels, args.words, args.hint, args.check])
         ):
-            handle_non_interactive_mode(args, storage, config)
+            handle_non_interactive_mode(args)
         else:
-            handle_interactive_mode(args, config)
+            handle_interactive_mode(args)
     except HangmanError as e:
         print(f"Ошибка: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def run_profiled(args: argparse.Namespace) -> None:
+    """Выполнить режим под cProfile с разбиением по фазам игры."""
+    from src.infrastructure.profiling import PhaseProfiler
+
+    profiler = PhaseProfiler()
+    profiler.start()
+    dump_failed = False
+    try:
+        run(args)
+    finally:
+        profiler.stop()
+        # Ошибка записи профиля сообщается, но не заменяет исключение режима.
+        try:
+            summary = profiler.dump(args.profile)
+        except StorageError as e:
+            print(f"Ошибка: {e}", file=sys.stderr)
+            dump_failed = True
+        else:
+            print(summary, file=sys.stderr)
+            print(f"Профиль записан в '{args.profile}'", file=sys.stderr)
+    if dump_failed:
+        sys.exit(1)
+
+
+def write_metrics_report(path: str) -> None:
+    """Записать отчёт метрик в файл path ('-' - в stderr)."""
+    from src.core import metrics
+
+    registry = metrics.current()
+    if registry is None:
+        return
+    report = registry.report() + "\n"
+    if path == "-":
+        sys.stderr.write(report)
+        return
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(report)
+    except OSError as e:
+        print(f"Не удалось записать метрики в '{path}': {e}", file=sys.stderr)
+
+
+def enable_metrics(path: str) -> None:
+    """Включить сбор метрик с отчётом при выходе и по сигналу SIGUSR1."""
+    from src.core import metrics
+
+    metrics.enable()
+    atexit.register(write_metrics_report, path)
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, lambda *_: write_metrics_report(path))
+
+
+def stop_exporter(exporter) -> None:
+    """Остановить экспорт метрик, записав последние значения."""
+    try:
+        exporter.stop()
+    except StorageError as e:
+        print(f"Ошибка: {e}", file=sys.stderr)
+
+
+def start_prometheus(args: argparse.Namespace) -> None:
+    """Включить сбор метрик и их экспорт в формате Prometheus."""
+    from src.core import metrics
+    from src.infrastructure.prometheus import PrometheusExporter
+
+    if args.prometheus_interval <= 0:
+        raise CLIArgumentError("Период записи метрик должен быть положительным")
+    exporter = PrometheusExporter(
+        metrics.current() or metrics.enable(),
+        path=args.prometheus_file,
+        port=args.prometheus_port,
+        interval=args.prometheus_interval,
+    )
+    try:
+        exporter.start()
+    except OSError as e:
+        raise CLIArgumentError(f"Не удалось открыть порт метрик: {e}")
+    atexit.register(stop_exporter, exporter)
+
+
+def main() -> None:
+    """Точка входа приложения."""
+    parser = create_parser()
+    args = parser.parse_args()
+    if args.startup_profile:
+        from src.infrastructure.startup_profile import profile_startup
+
+        argv = [arg for arg in sys.argv[1:] if arg != "--startup-profile"]
+        sys.exit(profile_startup(argv))
+    if args.metrics:
+        enable_metrics(args.metrics)
+    if args.prometheus_file or args.prometheus_port is not None:
+        try:
+            start_prometheus(args)
+        except HangmanError as e:
+            print(f"Ошибка: {e}", file=sys.stderr)
+            sys.exit(1)
+    if args.profile:
+        run_profiled(args)
+    else:
+        run(args)
+
+
 if __name__ == "__main__":
     main()
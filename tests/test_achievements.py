@@ -0,0 +1,95 @@
+import pytest
+
+from src.application.achievements import (
+    AchievementEvaluator,
+    AchievementRule,
+    MatchContext,
+)
+from src.core.exceptions import InvalidAchievementError
+
+
+def make_context(**overrides) -> MatchContext:
+    values = dict(
+        is_won=True,
+        hint_used=False,
+        errors=2,
+        max_attempts=6,
+        score=40,
+        total_wins=3,
+        consecutive_wins=1,
+    )
+    values.update(overrides)
+    return MatchContext(**values)
+
+
+def names(achievements):
+    return [ach.name for ach in achievements]
+
+
+def test_default_rules_on_first_perfect_win():
+    evaluator = AchievementEvaluator()
+    result = evaluator.evaluate(make_context(errors=0, score=120, total_wins=1))
+    assert names(result) == ["Без подсказки", "Спидранер", "Новичок", "Высокий счёт"]
+
+
+def test_default_rules_on_loss_check_only_streak_and_score():
+    evaluator = AchievementEvaluator()
+    assert evaluator.evaluate(make_context(is_won=False, score=0)) == []
+
+
+def test_win_thresholds_and_last_attempt():
+    evaluator = AchievementEvaluator()
+    context = make_context(hint_used=True, errors=5, total_wins=10, consecutive_wins=5)
+    assert names(evaluator.evaluate(context)) == [
+        "С подсказкой",
+        "Профи",
+        "Серия побед",
+        "На грани",
+    ]
+
+
+def test_unlocked_rules_are_skipped():
+    evaluator = AchievementEvaluator()
+    unlocked = evaluator.mask_for(["Без подсказки", "Новичок", "неизвестное"])
+    result = evaluator.evaluate(make_context(total_wins=1), unlocked)
+    assert result == []
+
+
+def test_evaluate_batch_unlocks_once():
+    evaluator = AchievementEvaluator()
+    contexts = [
+        make_context(total_wins=1),
+        make_context(total_wins=2),
+        make_context(is_won=False, score=0),
+        make_context(errors=0, total_wins=3),
+    ]
+    results, mask = evaluator.evaluate_batch(contexts)
+    assert [names(r) for r in results] == [
+        ["Без подсказки", "Новичок"],
+        [],
+        [],
+        ["Спидранер"],
+    ]
+    assert mask == evaluator.mask_for(["Без подсказки", "Новичок", "Спидранер"])
+
+
+def test_custom_rules():
+    evaluator = AchievementEvaluator(
+        [
+            AchievementRule("Полсотни", "50 побед", metric="total_wins", threshold=50),
+            AchievementRule(
+                "Чётный счёт", "Чётные очки", predicate=lambda ctx: ctx.score % 2 == 0
+            ),
+        ]
+    )
+    assert names(evaluator.evaluate(make_context(total_wins=51, score=41))) == [
+        "Полсотни"
+    ]
+    assert names(evaluator.evaluate(make_context(score=42))) == ["Чётный счёт"]
+
+
+def test_invalid_rules():
+    with pytest.raises(InvalidAchievementError):
+        AchievementEvaluator([AchievementRule("a", ""), AchievementRule("a", "")])
+    with pytest.raises(InvalidAchievementError):
+        AchievementEvaluator([AchievementRule("a", "", metric="score", compare="<")])
@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from src.application.config import GameConfig
+from src.core.entities import Word
+from src.core.exceptions import InvalidGuessError
+from src.core.game import HangmanGame
+
+np = pytest.importorskip("numpy")
+
+from src.core.batch import simulate_batch  # noqa: E402
+
+
+def play_scalar(word: str, guesses: str, max_attempts: int):
+    game = HangmanGame(Word(word), max_attempts)
+    end_turn = 0
+    for turn, letter in enumerate(guesses, 1):
+        try:
+            game.guess(letter)
+        except InvalidGuessError:
+            continue
+        if game.game_finished:
+            end_turn = turn
+            break
+    return game.state(), end_turn
+
+
+def test_batch_matches_scalar_game():
+    rng = random.Random(42)
+    words = [
+        w.value
+        for levels in GameConfig().categories.values()
+        for word_list in levels.values()
+        for w in word_list
+    ] + ["Кот", "ГиппоПотам"]
+    alphabet = "абвгдеёжзийклмнопрстуфхцчшщъыьэюяАОК1 "
+    cases = [
+        (
+            rng.choice(words),
+            "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 25))),
+            rng.randint(1, 8),
+        )
+        for _ in range(2000)
+    ]
+    result = simulate_batch(*zip(*cases), chunk_size=300)
+    masks = result.reveal_masks()
+    for i, (word, guesses, attempts) in enumerate(cases):
+        state, end_turn = play_scalar(word, guesses, attempts)
+        assert masks[i] == state.reveal_mask
+        assert result.errors[i] == state.errors
+        assert result.won[i] == state.is_won
+        assert result.lost[i] == state.is_lost
+        assert result.end_turn[i] == end_turn
+
+
+def test_batch_end_turn_and_ignored_tail():
+    result = simulate_batch(["кот", "кот"], ["коткот", "абвгд"], [7, 2])
+    assert result.end_turn.tolist() == [3, 2]
+    assert result.won.tolist() == [True, False]
+    assert result.errors.tolist() == [0, 2]
+
+
+def test_batch_rejects_invalid_word():
+    with pytest.raises(ValueError, match="минимум 2 символа"):
+        simulate_batch(["к"], ["к"], 7)
@@ -0,0 +1,73 @@
+import json
+
+from benchmarks import micro, scale, stress
+from benchmarks.common import percentile, summarize
+
+
+def test_percentile_and_summary():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    summary = summarize(reversed(values))
+    assert summary["count"] == 100
+    assert summary["max"] == 100.0
+    assert summary["p90"] == 90.0
+
+
+def test_stress_threads(capsys):
+    results = stress.main(["--players", "1,3", "--games", "4", "--json"])
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == results
+    for result in results:
+        assert result["recorded"] == result["games"]
+        assert result["lost"] == 0
+        assert result["corrupted"] == 0
+        assert result["guess_p50_ms"] > 0
+
+
+def test_stress_processes_with_compaction_lose_nothing(capsys):
+    results = stress.main(
+        ["--players", "4", "--games", "10", "--mode", "process", "--compact-every", "5"]
+    )
+    assert [(r["recorded"], r["lost"], r["corrupted"]) for r in results] == [(40, 0, 0)]
+    assert stress.report_defects(results) == 0
+    assert stress.report_defects([{**results[0], "lost": 3}]) == 1
+    assert "потеряно 3 из 40" in capsys.readouterr().err
+
+
+def test_micro_smoke(capsys):
+    results = micro.main(
+        ["--min-time", "0.001", "--history", "0,10", "--filter", "achievement"]
+    )
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == results
+    names = {(r["name"], r["param"]) for r in results}
+    assert ("AchievementEvaluator.evaluate", "") in names
+    assert ("FileStorage.load_achievements", "history=10") in names
+    for result in results:
+        assert result["ops"] >= 1
+        assert result["ns_per_op"] > 0
+        assert result["alloc_peak_bytes"] >= 0
+
+
+def test_scale_synthesized_words_are_unique():
+    words = scale.synthesize_categories(5000, 4, ["лёгкий", "сложный"])
+    assert len(words) == 4
+    values = [
+        w.value for levels in words.values() for ws in levels.values() for w in ws
+    ]
+    assert len(values) == len(set(values)) == 5000
+
+
+def test_scale_smoke(capsys):
+    results = scale.main(
+        ["--sizes", "300", "--samples", "20", "--games", "3", "--json"]
+    )
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == results
+    assert [r["backend"] for r in results] == list(scale.BACKENDS)
+    for result in results:
+        assert result["error"] == ""
+        assert result["size"] == 300
+        assert result["check_hit_p50_us"] > 0
+        assert result["game_p50_ms"] > 0
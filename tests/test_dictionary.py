@@ -0,0 +1,155 @@
+import pytest
+
+from src.application.config import GameConfig
+from src.core.entities import Word
+from src.core.exceptions import StorageError
+from src.infrastructure.dictionary import (
+    MappedDictionary,
+    compile_dictionary,
+    load_word_list,
+    parse_word_list,
+)
+from src.infrastructure.storage import FileStorage
+from src.main import main
+
+
+@pytest.fixture
+def config():
+    return GameConfig()
+
+
+@pytest.fixture
+def dictionary_path(config, tmp_path):
+    path = str(tmp_path / "words.hmd")
+    compile_dictionary(config.categories, path)
+    return path
+
+
+def test_roundtrip_matches_config(config, dictionary_path):
+    dictionary = MappedDictionary(dictionary_path)
+    assert list(dictionary) == list(config.categories)
+    for category, levels in config.categories.items():
+        assert list(dictionary[category]) == list(levels)
+        for level, words in levels.items():
+            assert dictionary[category][level] == words
+    dictionary.close()
+
+
+def test_sections_decoded_once(dictionary_path):
+    dictionary = MappedDictionary(dictionary_path)
+    first = dictionary["животные"]["лёгкий"]
+    assert dictionary["животные"]["лёгкий"] is first
+    dictionary.close()
+
+
+def test_storage_uses_compiled_dictionary(dictionary_path, tmp_path):
+    custom = {"птицы": {"лёгкий": [Word("сова", "ночная птица")]}}
+    path = str(tmp_path / "birds.hmd")
+    compile_dictionary(custom, path)
+    storage = FileStorage(GameConfig(), path)
+    assert storage.get_categories() == ("птицы",)
+    assert storage.check_word("сова") == ("птицы", "лёгкий")
+    assert storage.get_hint("сова") == "ночная птица"
+
+
+def test_invalid_file_rejected(tmp_path):
+    path = tmp_path / "broken.hmd"
+    path.write_bytes(b"not a dictionary at all, definitely")
+    with pytest.raises(StorageError, match="не является словарём"):
+        MappedDictionary(str(path))
+
+
+def test_views_cached_until_reload(dictionary_path, tmp_path):
+    storage = FileStorage(GameConfig(), dictionary_path)
+    views = storage.views
+    assert storage.get_levels() is storage.get_levels()
+    assert storage.views is views
+    assert storage.count_words("животные", "лёгкий") == 3
+
+    compile_dictionary({"птицы": {"лёгкий": [Word("сова")]}}, dictionary_path)
+    assert storage.get_categories() == views.categories
+    storage.reload()
+    assert storage.generation == 1
+    assert storage.views is not views
+    assert storage.get_categories() == ("птицы",)
+
+
+def test_find_word_without_decoding_sections(dictionary_path, mocker):
+    dictionary = MappedDictionary(dictionary_path)
+    decode = mocker.spy(dictionary, "decode_section")
+    category, level, word = dictionary.find("кот")
+    assert (category, level) == ("животные", "лёгкий")
+    assert word == Word("кот", "маленькое домашнее животное")
+    assert dictionary.find("абракадабра") is None
+    assert dictionary.find("") is None
+    assert decode.call_count == 0
+    dictionary.close()
+
+
+def test_find_prefers_first_occurrence(tmp_path):
+    path = str(tmp_path / "dup.hmd")
+    compile_dictionary(
+        {
+            "б": {"лёгкий": [Word("сова", "первая")]},
+            "а": {"лёгкий": [Word("ёж"), Word("сова", "вторая")]},
+        },
+        path,
+    )
+    dictionary = MappedDictionary(path)
+    assert dictionary.find("сова")[0] == "б"
+    assert dictionary.find("ёж")[0] == "а"
+    dictionary.close()
+
+
+def test_storage_lookups_skip_word_index(dictionary_path):
+    storage = FileStorage(GameConfig(), dictionary_path)
+    assert storage.check_word("Кот") == ("животные", "лёгкий")
+    assert storage.determine_category_level_attempts("кот")[2] == 7
+    assert storage._word_index is None
+
+
+def test_truncated_or_corrupt_file_raises_storage_error(dictionary_path, tmp_path):
+    with open(dictionary_path, "rb") as f:
+        data = f.read()
+    path = tmp_path / "cut.hmd"
+    for size in range(len(data)):
+        path.write_bytes(data[:size])
+        try:
+            dictionary = MappedDictionary(str(path))
+        except StorageError:
+            continue
+        with pytest.raises(StorageError):
+            dictionary.find("кот")
+            for levels in dictionary.values():
+                list(levels.values())
+        dictionary.close()
+
+
+def test_parse_word_list():
+    categories = parse_word_list(
+        ["# комментарий", "", "птицы;лёгкий;Сова;ночная птица", "птицы;лёгкий;ёж"]
+    )
+    assert categories == {
+        "птицы": {"лёгкий": [Word("сова", "ночная птица"), Word("ёж")]}
+    }
+    with pytest.raises(StorageError, match="words.txt:1"):
+        parse_word_list(["только;два"], "words.txt")
+    with pytest.raises(StorageError, match="words.txt:1"):
+        parse_word_list(["птицы;лёгкий;с0ва"], "words.txt")
+    with pytest.raises(StorageError):
+        load_word_list("/nonexistent/words.txt")
+
+
+def test_main_compiles_source_file(mocker, tmp_path):
+    source = tmp_path / "words.txt"
+    source.write_text("птицы;лёгкий;сова;ночная птица\n", encoding="utf-8")
+    path = str(tmp_path / "words.hmd")
+    game_config = mocker.patch("src.main.GameConfig")
+    mocker.patch("sys.stdout")
+    mocker.patch(
+        "sys.argv",
+        ["main.py", "--compile-dictionary", path, "--source", str(source)],
+    )
+    main()
+    assert not game_config.called
+    assert FileStorage(GameConfig(), path).check_word("сова") == ("птицы", "лёгкий")
@@ -1,6 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
-from src.core.entities import Word
+from src.core.entities import GameState, Word, letter_bit, mask_to_letters
 from src.core.exceptions import (
     GameAlreadyFinishedError,
     HintAlreadyUsedError,
@@ -162,3 +164,49 @@ def test_long_word():
     game = HangmanGame(word, 7)
     result = game.guess("г")
     assert result.current_state == "г*********"
+
+
+def test_repeated_letters_revealed_at_once():
+    game = HangmanGame(Word("гиппопотам", ""), 7)
+    result = game.guess("п")
+    assert result.current_state == "**пп*п****"
+    assert result.errors == 0
+
+
+def test_mixed_case_word_won():
+    game = HangmanGame(Word("Кот", ""), 7)
+    game.guess("к")
+    game.guess("о")
+    result = game.guess("т")
+    assert result.current_state == "Кот"
+    assert result.is_won
+    assert game.state().is_won
+
+
+def test_state_snapshot_is_immutable(word):
+    game = HangmanGame(word, 7)
+    state = game.state()
+    game.guess("к")
+    assert state.guessed_letters == set()
+    with pytest.raises(AttributeError):
+        state.errors = 3
+
+
+def test_state_snapshot_matches_letters_constructor(word):
+    game = HangmanGame(word, 7)
+    game.guess("к")
+    game.guess("а")
+    expected = GameState(word, {"к", "а"}, errors=1, max_attempts=7)
+    assert game.state() == expected
+    assert expected.wrong_letters == {"а"}
+    assert expected.current_state == "к**"
+
+
+def test_new_letters_get_unique_bits_across_threads():
+    letters = [chr(code) for code in range(0x3B1, 0x3C9)]  # греческие буквы
+    with ThreadPoolExecutor(8) as pool:
+        for _ in range(4):
+            bits = list(pool.map(letter_bit, letters * 8))
+    assert len(set(bits)) == len(letters)
+    for letter in letters:
+        assert mask_to_letters(1 << letter_bit(letter)) == {letter}
@@ -0,0 +1,118 @@
+import asyncio
+
+from src.application.config import GameConfig
+from src.core.exceptions import NoWordsError
+from src.infrastructure.game_server import GameServer, render_state
+from src.infrastructure.storage import FileStorage
+from src.infrastructure.visuals import STAGES
+
+
+def make_server(tmp_path) -> GameServer:
+    config = GameConfig()
+    storage = FileStorage(config, statistics_path=str(tmp_path / "stats.json"))
+    return GameServer.from_storage(storage, config)
+
+
+async def read_until(reader: asyncio.StreamReader, marker: str) -> str:
+    data = b""
+    while marker.encode() not in data:
+        chunk = await asyncio.wait_for(reader.read(4096), timeout=5)
+        assert chunk, data.decode()
+        data += chunk
+    return data.decode()
+
+
+async def send(writer: asyncio.StreamWriter, line: str) -> None:
+    writer.write(f"{line}\n".encode())
+    await writer.drain()
+
+
+def test_render_state():
+    from src.core.entities import GameState, Word
+
+    state = GameState(Word("кот", ""), ["к", "я"], errors=1, max_attempts=6)
+    text = render_state(state, "животные", "лёгкий")
+    assert "Слово: к**" in text
+    assert "Неверные буквы: я" in text
+    assert STAGES[1] in text
+
+
+def test_play_over_tcp(tmp_path):
+    async def scenario():
+        server = make_server(tmp_path)
+        tcp = await server.start("127.0.0.1", 0)
+        port = tcp.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await read_until(reader, "Подсказка:")
+
+        await send(writer, "new животные лёгкий")
+        await read_until(reader, "Подсказка:")
+        session = next(iter(server.service._SessionService__sessions.values()))
+        await send(writer, "hint")
+        text = await read_until(reader, "Подсказка:")
+        assert session.game.word.description in text
+
+        for letter in dict.fromkeys(session.game.word.value):
+            await send(writer, letter)
+        text = await read_until(reader, "Введите new")
+        assert "Вы выиграли!" in text
+
+        await send(writer, "stats")
+        text = await read_until(reader, "Достижения:")
+        assert "Побед: 1" in text
+        await send(writer, "quit")
+        await read_until(reader, "До свидания!")
+        writer.close()
+        await server.close()
+        return server
+
+    server = asyncio.run(scenario())
+    assert server.connections == 0
+    stats = FileStorage(
+        GameConfig(), statistics_path=str(tmp_path / "stats.json")
+    ).load_achievements()
+    assert (stats.games_played, stats.wins) == (2, 1)
+
+
+def test_error_on_connect_is_reported(tmp_path, mocker):
+    async def scenario():
+        server = make_server(tmp_path)
+        mocker.patch.object(
+            server.service.storage, "get_word", side_effect=NoWordsError("Нет слов")
+        )
+        tcp = await server.start("127.0.0.1", 0)
+        port = tcp.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        text = await read_until(reader, "Ошибка:")
+        assert "Ошибка: Нет слов" in text
+        await send(writer, "quit")
+        await read_until(reader, "До свидания!")
+        writer.close()
+        await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_many_concurrent_clients(tmp_path):
+    async def client(port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await read_until(reader, "Подсказка:")
+        await send(writer, "ъ")
+        text = await read_until(reader, "Подсказка:")
+        await send(writer, "quit")
+        await read_until(reader, "До свидания!")
+        writer.close()
+        return "Неверные буквы: ъ" in text
+
+    async def scenario():
+        server = make_server(tmp_path)
+        tcp = await server.start("127.0.0.1", 0)
+        port = tcp.sockets[0].getsockname()[1]
+        results = await asyncio.gather(*(client(port) for _ in range(50)))
+        await server.close()
+        return results, server
+
+    results, server = asyncio.run(scenario())
+    assert all(results)
+    assert server.service.statistics.stats.games_played == 50
+    assert not server.service.statistics.dirty
@@ -1,10 +1,21 @@
+import gc
+import subprocess
+import sys
+import time
+import weakref
+
 import pytest
 from io import StringIO
 from typing import List, Tuple
 
 from src.application.config import GameConfig
 from src.application.game_service import GameService
-from src.core.entities import Word
+from src.application.statistics_cache import (
+    StatisticsCache,
+    _flush_open_caches,
+    _open_caches,
+)
+from src.core.entities import MatchStatistics, Word
 from src.core.exceptions import CategoryNotFoundError, LevelNotFoundError, NoWordsError
 from src.infrastructure.storage import FileStorage
 from src.infrastructure.cli_ui import InteractiveCLI
@@ -96,3 +107,71 @@ def test_view_statistics(mocker, service):
     mock_stdout = mocker.patch("sys.stdout", new_callable=StringIO)
     service.view_statistics()
     assert mock_stdout.getvalue().strip()
+
+
+@pytest.fixture
+def stats_storage(config, tmp_path):
+    return FileStorage(config, statistics_path=str(tmp_path / "stats.json"))
+
+
+def make_match(i: int) -> MatchStatistics:
+    return MatchStatistics(str(i), 30, False, 0, "win", "животные", "лёгкий")
+
+
+def test_statistics_cache_defers_writes(stats_storage):
+    cache = StatisticsCache(stats_storage, flush_every=3, flush_interval=None)
+    cache.record_match(make_match(1))
+    cache.unlock_achievements(["Новичок"])
+    assert cache.stats.games_played == 1
+    assert stats_storage.load_achievements().games_played == 0
+    cache.flush()
+    stats = stats_storage.load_achievements()
+    assert stats.games_played == 1
+    assert stats.unlocked_achievements == ["Новичок"]
+    cache.close()
+
+
+def test_statistics_cache_flushes_after_n_games(stats_storage):
+    cache = StatisticsCache(stats_storage, flush_every=2, flush_interval=None)
+    cache.record_match(make_match(1))
+    cache.record_match(make_match(2))
+    assert not cache.dirty
+    assert stats_storage.load_achievements().games_played == 2
+    cache.close()
+
+
+def test_statistics_cache_flushes_on_timer(stats_storage):
+    cache = StatisticsCache(stats_storage, flush_every=100, flush_interval=0.01)
+    cache.record_match(make_match(1))
+    deadline = time.monotonic() + 2
+    while cache.dirty and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert stats_storage.load_achievements().games_played == 1
+    cache.close()
+
+
+def test_statistics_cache_flushed_once_on_exit(stats_storage):
+    cache = StatisticsCache(stats_storage, flush_every=100, flush_interval=None)
+    cache.record_match(make_match(1))
+    _flush_open_caches()
+    assert stats_storage.load_achievements().games_played == 1
+
+    closed = StatisticsCache(stats_storage, flush_interval=None)
+    closed.close()
+    assert closed not in _open_caches
+    abandoned = weakref.ref(StatisticsCache(stats_storage, flush_interval=None))
+    gc.collect()
+    assert abandoned() is None
+    cache.close()
+
+
+def test_game_service_does_not_import_session_service():
+    code = (
+        "import sys\n"
+        "import src.application.game_service\n"
+        "print('src.application.session_service' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
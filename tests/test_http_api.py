@@ -0,0 +1,189 @@
+import asyncio
+import json
+from urllib.parse import quote
+
+from src.application.config import GameConfig
+from src.infrastructure.http_api import HttpApiServer
+from src.infrastructure.memory_storage import MemoryStorage
+from src.infrastructure.session_store import SessionStore
+
+
+def make_request(method: str, path: str, body=None, close: bool = False) -> bytes:
+    data = json.dumps(body).encode() if body is not None else b""
+    head = f"{method} {quote(path)} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(data)}\r\n"
+    if close:
+        head += "Connection: close\r\n"
+    return (head + "\r\n").encode() + data
+
+
+async def read_response(reader: asyncio.StreamReader, with_headers: bool = False):
+    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5)
+    lines = head.decode().split("\r\n")
+    status = int(lines[0].split()[1])
+    headers = {
+        k.lower(): v.strip() for k, _, v in (l.partition(":") for l in lines[1:] if l)
+    }
+    body = await reader.readexactly(int(headers["content-length"]))
+    if with_headers:
+        return status, json.loads(body), headers
+    return status, json.loads(body)
+
+
+def run_with_server(scenario):
+    async def main():
+        config = GameConfig()
+        server = HttpApiServer.from_storage(
+            MemoryStorage(config), config, SessionStore()
+        )
+        tcp = await server.start("127.0.0.1", 0)
+        port = tcp.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            return await scenario(server, reader, writer)
+        finally:
+            writer.close()
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def test_game_over_keep_alive():
+    async def scenario(server, reader, writer):
+        writer.write(
+            make_request("POST", "/games", {"category": "животные", "level": "лёгкий"})
+        )
+        status, game = await read_response(reader)
+        assert status == 201
+        assert game["attempts_left"] == 7
+        word = server.service.get_session(game["id"]).game.word.value
+
+        writer.write(make_request("POST", f"/games/{game['id']}/hint"))
+        status, hint = await read_response(reader)
+        assert status == 200 and hint["hint"]
+        writer.write(make_request("POST", f"/games/{game['id']}/hint"))
+        assert (await read_response(reader))[0] == 409
+
+        for letter in dict.fromkeys(word):
+            writer.write(
+                make_request("POST", f"/games/{game['id']}/guess", {"letter": letter})
+            )
+            status, result = await read_response(reader)
+            assert status == 200 and result["is_correct"]
+        assert result["is_won"]
+        assert result["result"]["word"] == word
+
+        writer.write(make_request("GET", f"/games/{game['id']}"))
+        assert (await read_response(reader))[0] == 404
+        writer.write(make_request("GET", "/stats"))
+        status, stats = await read_response(reader)
+        assert stats["wins"] == 1
+        assert "Новичок" in stats["unlocked_achievements"]
+
+    run_with_server(scenario)
+
+
+def test_pipelined_dictionary_queries():
+    async def scenario(server, reader, writer):
+        writer.write(
+            make_request("GET", "/categories")
+            + make_request("GET", "/levels")
+            + make_request("GET", "/categories/животные")
+            + make_request("GET", "/words/кот")
+            + make_request("GET", "/nowhere", close=True)
+        )
+        responses = [await read_response(reader) for _ in range(5)]
+        assert responses[0] == (200, list(server.service.categories()))
+        assert responses[1] == (200, server.service.levels())
+        # Слова словаря не выдаются: по ним можно узнать ответ своей игры.
+        assert [status for status, _ in responses[2:]] == [404, 404, 404]
+        assert await reader.read() == b""
+
+    run_with_server(scenario)
+
+
+def test_bad_requests():
+    async def scenario(server, reader, writer):
+        writer.write(make_request("POST", "/games", {"category": "нет"}))
+        assert (await read_response(reader))[0] == 404
+        writer.write(b"POST /games HTTP/1.1\r\nContent-Length: 3\r\n\r\n{{{")
+        assert (await read_response(reader))[0] == 400
+        writer.write(make_request("POST", "/games"))
+        status, game = await read_response(reader)
+        writer.write(
+            make_request("POST", f"/games/{game['id']}/guess", {"letter": "12"})
+        )
+        assert (await read_response(reader))[0] == 400
+        writer.write(make_request("DELETE", f"/games/{game['id']}"))
+        status, summary = await read_response(reader)
+        assert status == 200 and not summary["is_won"]
+
+    run_with_server(scenario)
+
+
+def test_wrong_field_types():
+    async def scenario(server, reader, writer):
+        writer.write(make_request("POST", "/games", {"level": []}))
+        status, error = await read_response(reader)
+        assert status == 400 and "level" in error["error"]
+        writer.write(make_request("POST", "/games", {"category": 1}))
+        assert (await read_response(reader))[0] == 400
+        writer.write(make_request("GET", "/levels"))
+        assert (await read_response(reader))[0] == 200
+
+    run_with_server(scenario)
+
+
+def test_unexpected_error_keeps_connection(mocker):
+    async def scenario(server, reader, writer):
+        mocker.patch.object(
+            server.service, "get_session", side_effect=RuntimeError("сбой")
+        )
+        writer.write(make_request("GET", "/games/abc"))
+        status, error = await read_response(reader)
+        assert status == 500 and "сбой" not in error["error"]
+        writer.write(make_request("GET", "/levels"))
+        assert (await read_response(reader))[0] == 200
+
+    run_with_server(scenario)
+
+
+def test_chunked_body_rejected():
+    async def scenario(server, reader, writer):
+        writer.write(
+            b"POST /games HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n"
+            b"2\r\n{}\r\n0\r\n\r\n"
+        )
+        assert (await read_response(reader))[0] == 501
+        assert await reader.read() == b""
+
+    run_with_server(scenario)
+
+
+def test_close_stops_idle_connections():
+    async def scenario(server, reader, writer):
+        writer.write(make_request("GET", "/levels"))
+        assert (await read_response(reader))[0] == 200
+        assert server.connections == 1
+        await asyncio.wait_for(server.close(), timeout=5)
+        assert server.connections == 0
+        assert await asyncio.wait_for(reader.read(), timeout=5) == b""
+
+    run_with_server(scenario)
+
+
+def test_unsupported_method_on_known_path():
+    async def scenario(server, reader, writer):
+        for method, path, allow in [
+            ("GET", "/games", "POST"),
+            ("PUT", "/games/abc", "GET, DELETE"),
+            ("GET", "/games/abc/guess", "POST"),
+            ("POST", "/stats", "GET"),
+        ]:
+            writer.write(make_request(method, path))
+            status, _, headers = await read_response(reader, with_headers=True)
+            assert (status, headers["allow"]) == (405, allow)
+        writer.write(make_request("POST", "/games/abc/other"))
+        status, _, headers = await read_response(reader, with_headers=True)
+        assert status == 404 and "allow" not in headers
+
+    run_with_server(scenario)
@@ -0,0 +1,218 @@
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.application.config import GameConfig
+from src.core.entities import MatchStatistics
+from src.infrastructure.journal import (
+    SEQ,
+    StatisticsJournal,
+    _close_journals,
+    match_record,
+)
+from src.infrastructure.storage import FileStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return FileStorage(GameConfig(), statistics_path=str(tmp_path / "stats.json"))
+
+
+def make_match(i: int, result: str = "win") -> MatchStatistics:
+    return MatchStatistics(f"{i:09d}", 30, False, 0, result)
+
+
+def test_record_match_and_achievements(storage):
+    storage.record_match(make_match(1))
+    storage.record_match(make_match(2, "loss"))
+    storage.unlock_achievements(["Новичок", "Новичок"])
+    stats = storage.load_achievements()
+    assert stats.games_played == 2
+    assert stats.wins == 1
+    assert stats.total_score == 60
+    assert stats.unlocked_achievements == ["Новичок"]
+    assert [m["match_id"] for m in stats.match_history] == ["000000001", "000000002"]
+
+
+def test_compaction_keeps_history(tmp_path):
+    journal = StatisticsJournal(str(tmp_path / "stats.json"), compact_every=10)
+    for i in range(25):
+        journal.append([match_record(make_match(i))])
+    journal.wait()
+    journal.compact()
+    with open(journal.snapshot_path, encoding="utf-8") as f:
+        assert json.load(f)["games_played"] == 25
+    stats = journal.load()
+    assert stats.games_played == 25
+    assert len(stats.match_history) == 25
+
+
+def test_torn_journal_line_ignored(tmp_path):
+    journal = StatisticsJournal(str(tmp_path / "stats.json"))
+    journal.append([match_record(make_match(1))])
+    with open(journal.journal_path, "a", encoding="utf-8") as f:
+        f.write('{"type": "match", "sco')
+    assert journal.load().games_played == 1
+    journal.append([match_record(make_match(2))])
+    assert journal.load().games_played == 2
+
+
+def test_save_achievements_replaces_journal(storage):
+    storage.record_match(make_match(1))
+    stats = storage.load_achievements()
+    stats.unlocked_achievements.append("Новичок")
+    storage.save_achievements(stats)
+    assert storage.load_achievements().unlocked_achievements == ["Новичок"]
+    assert storage.load_achievements().games_played == 1
+
+
+def test_snapshot_without_rollups_is_migrated(tmp_path):
+    path = tmp_path / "stats.json"
+    path.write_text(
+        json.dumps(
+            {
+                "games_played": 1,
+                "wins": 1,
+                "total_score": 30,
+                "match_history": [{"match_id": "1", "score": 30, "result": "win"}],
+            }
+        ),
+        encoding="utf-8",
+    )
+    stats = StatisticsJournal(str(path)).load()
+    assert stats.rollups.best_win_streak == 1
+    assert stats.rollups.best_score == 30
+
+
+def line_count(path):
+    if not os.path.exists(path):
+        return 0
+    with open(path, encoding="utf-8") as f:
+        return sum(1 for _ in f)
+
+
+def test_records_are_numbered_and_seq_not_in_history(tmp_path):
+    journal = StatisticsJournal(str(tmp_path / "stats.json"))
+    journal.append([match_record(make_match(1)), match_record(make_match(2))])
+    with open(journal.journal_path, encoding="utf-8") as f:
+        assert [json.loads(line)[SEQ] for line in f] == [1, 2]
+    stats = StatisticsJournal(journal.snapshot_path).load()
+    assert "seq" not in stats.match_history[0]
+
+    other = StatisticsJournal(journal.snapshot_path)
+    other.append([match_record(make_match(3))])
+    with open(journal.journal_path, encoding="utf-8") as f:
+        assert json.loads(f.readlines()[-1])[SEQ] == 3
+
+
+def test_crash_after_compaction_snapshot_does_not_double_count(tmp_path):
+    journal = StatisticsJournal(str(tmp_path / "stats.json"))
+    for i in range(5):
+        journal.append([match_record(make_match(i))])
+    shutil.copy(journal.journal_path, tmp_path / "old.journal")
+    journal.compact()
+    # Снимок заменён, а журнал - ещё нет.
+    shutil.copy(tmp_path / "old.journal", journal.journal_path)
+    journal.append([match_record(make_match(5))])
+    stats = StatisticsJournal(journal.snapshot_path).load()
+    assert stats.games_played == 6
+    assert len(stats.match_history) == 6
+
+
+def test_crash_after_write_snapshot_does_not_double_count(storage, tmp_path):
+    storage.record_match(make_match(1))
+    journal_path = storage.journal.journal_path
+    shutil.copy(journal_path, tmp_path / "old.journal")
+    storage.save_achievements(storage.load_achievements())
+    shutil.copy(tmp_path / "old.journal", journal_path)
+    reopened = FileStorage(GameConfig(), statistics_path=storage.statistics_path)
+    assert reopened.load_achievements().games_played == 1
+
+
+def test_legacy_journal_without_numbers_is_applied(tmp_path):
+    journal = StatisticsJournal(str(tmp_path / "stats.json"))
+    with open(journal.journal_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(match_record(make_match(1))) + "\n")
+    assert journal.load().games_played == 1
+    journal.append([match_record(make_match(2))])
+    journal.compact()
+    assert StatisticsJournal(journal.snapshot_path).load().games_played == 2
+
+
+def test_close_compacts_journal_of_short_lived_processes(tmp_path):
+    path = str(tmp_path / "stats.json")
+    for i in range(25):
+        # Каждый запуск CLI: загрузка статистики, одна игра, выход.
+        storage = FileStorage(GameConfig(), statistics_path=path, compact_every=10)
+        storage.load_achievements()
+        storage.record_match(make_match(i))
+        storage.close()
+        assert line_count(storage.journal.journal_path) < 10
+    assert (
+        FileStorage(GameConfig(), statistics_path=path).load_achievements().games_played
+        == 25
+    )
+
+
+def test_exit_hook_closes_open_journals(tmp_path):
+    journal = StatisticsJournal(str(tmp_path / "stats.json"), compact_every=3)
+    journal.append([match_record(make_match(i)) for i in range(3)])
+    journal.wait()
+    journal.append([match_record(make_match(3))])
+    _close_journals()
+    assert line_count(journal.journal_path) < 3
+    assert StatisticsJournal(journal.snapshot_path).load().games_played == 4
+
+
+def test_storage_journal_settings(tmp_path):
+    journal_path = tmp_path / "other" / "stats.log"
+    journal_path.parent.mkdir()
+    storage = FileStorage(
+        GameConfig(),
+        statistics_path=str(tmp_path / "stats.json"),
+        journal_path=str(journal_path),
+        compact_every=3,
+    )
+    assert storage.journal.journal_path == str(journal_path)
+    assert storage.journal.compact_every == 3
+    storage.record_match(make_match(1))
+    assert line_count(str(journal_path)) == 1
+    storage.close()
+
+
+def test_two_journals_on_one_file(tmp_path):
+    path = str(tmp_path / "stats.json")
+    a, b = StatisticsJournal(path), StatisticsJournal(path)
+    b.append([match_record(make_match(0))])
+    a.append([match_record(make_match(1))])
+    a.append([match_record(make_match(2))])
+    a.compact()
+    b.append([match_record(make_match(3))])
+    b.compact()
+    a.append([match_record(make_match(4))])
+    stats = StatisticsJournal(path).load()
+    assert stats.games_played == 5
+    assert sorted(m["match_id"] for m in stats.match_history) == [
+        make_match(i).match_id for i in range(5)
+    ]
+
+
+def _append_matches(path: str, first: int, count: int) -> None:
+    journal = StatisticsJournal(path, compact_every=5)
+    for i in range(first, first + count):
+        journal.append([match_record(make_match(i))])
+    journal.close()
+
+
+def test_processes_sharing_journal_lose_nothing(tmp_path):
+    path = str(tmp_path / "stats.json")
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(_append_matches, path, i * 20, 20) for i in range(4)]
+        for future in futures:
+            future.result()
+    stats = StatisticsJournal(path).load()
+    assert stats.games_played == 80
+    assert len({m["match_id"] for m in stats.match_history}) == 80
@@ -69,11 +69,23 @@ def test_main_categories(mocker, service):
 
 
 def test_main_levels(mocker, service):
+    create_storage = mocker.patch("src.main.create_storage")
     mock_stdout = mocker.patch("sys.stdout", new_callable=StringIO)
     mocker.patch("sys.argv", ["main.py", "--levels"])
     main()
     output = mock_stdout.getvalue()
     assert "лёгкий" in output
+    assert not create_storage.called
+
+
+def test_main_storage_error(mocker):
+    mocker.patch("src.main.create_storage", side_effect=OSError("нет доступа"))
+    mock_stderr = mocker.patch("sys.stderr", new_callable=StringIO)
+    mocker.patch("sys.argv", ["main.py", "--stats"])
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 1
+    assert "Ошибка инициализации хранилища: нет доступа" in mock_stderr.getvalue()
 
 
 def test_main_words_valid(mocker, service):
@@ -150,3 +162,24 @@ def test_main_stats(mocker, service):
     mocker.patch("sys.argv", ["main.py", "--stats"])
     main()
     assert mock_stdout.getvalue().strip()
+
+
+def test_main_batch_file(mocker, tmp_path):
+    games = tmp_path / "games.txt"
+    games.write_text("кот кот\nкот абв\n", encoding="utf-8")
+    mock_stdout = mocker.patch("sys.stdout", new_callable=StringIO)
+    mocker.patch("sys.argv", ["main.py", "--batch", str(games)])
+    main()
+    assert mock_stdout.getvalue().splitlines() == ["кот;POS", "***;NEG"]
+
+
+def test_main_check_file(mocker, tmp_path):
+    words = tmp_path / "words.txt"
+    words.write_text("кот\nабракадабра\n", encoding="utf-8")
+    mock_stdout = mocker.patch("sys.stdout", new_callable=StringIO)
+    mocker.patch("sys.argv", ["main.py", "--check-file", str(words)])
+    main()
+    assert mock_stdout.getvalue().splitlines() == [
+        "кот;животные;лёгкий;7",
+        "абракадабра;-",
+    ]
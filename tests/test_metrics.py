@@ -0,0 +1,156 @@
+import random
+from io import StringIO
+
+import pytest
+
+from src.application.config import GameConfig
+from src.application.session_service import SessionService
+from src.application.statistics_cache import StatisticsCache
+from src.core import metrics
+from src.core.entities import MatchStatistics
+from src.core.metrics import (
+    SIGNIFICANT_BITS,
+    LatencyHistogram,
+    Metrics,
+    bucket_index,
+    bucket_upper_bound,
+)
+from src.infrastructure.storage import FileStorage
+from src.main import main, write_metrics_report
+
+
+@pytest.fixture(autouse=True)
+def no_metrics():
+    yield
+    metrics.disable()
+
+
+@metrics.timed("work")
+def work(value):
+    metrics.count("calls")
+    return value * 2
+
+
+def test_buckets_are_contiguous_and_precise():
+    limit = 1 << SIGNIFICANT_BITS
+    for value in range(0, 1 << 16):
+        index = bucket_index(value)
+        assert value <= bucket_upper_bound(index)
+        if index:
+            assert value > bucket_upper_bound(index - 1)
+        if value >= limit:
+            assert bucket_upper_bound(index) - value < value / (limit / 2)
+    assert bucket_index(10**12) > bucket_index(10**9)
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    values = list(range(1, 10001))
+    random.Random(1).shuffle(values)
+    for value in values:
+        histogram.record(value * 1000)
+    assert histogram.count == 10000
+    assert histogram.max == 10**7
+    assert histogram.mean == pytest.approx(5000.5 * 1000)
+    for q in (50, 90, 99):
+        expected = q * 100 * 1000
+        assert expected <= histogram.percentile(q) <= expected * 1.07
+    assert histogram.percentile(100) == 10**7
+    assert sum(n for _, n in histogram.buckets()) == 10000
+    assert LatencyHistogram().percentile(50) == 0
+
+
+def test_disabled_metrics_are_noop():
+    assert metrics.current() is None
+    assert work(2) == 4
+    metrics.count("calls")
+    assert metrics.current() is None
+
+
+def test_timed_and_count_record_into_registry():
+    registry = metrics.enable()
+    for value in range(5):
+        work(value)
+    assert registry.histogram("work").count == 5
+    assert registry.counters == {"calls": 5}
+
+    report = registry.report()
+    assert "p50, мкс" in report and "p99, мкс" in report
+    assert "work" in report and "calls" in report
+
+
+def test_gauges_are_read_on_report():
+    registry = metrics.enable()
+    sessions = [1, 2]
+    metrics.gauge("active_sessions", sessions.__len__)
+    sessions.append(3)
+    assert registry.gauges == {"active_sessions": 3.0}
+    assert "active_sessions" in registry.report()
+
+
+def test_timed_records_failed_calls():
+    registry = metrics.enable(Metrics())
+
+    @metrics.timed("failing")
+    def failing():
+        raise ValueError("ошибка")
+
+    with pytest.raises(ValueError):
+        failing()
+    assert registry.histogram("failing").count == 1
+
+
+def test_game_phases_and_storage_io_are_counted(tmp_path):
+    registry = metrics.enable()
+    storage = FileStorage(GameConfig(), statistics_path=str(tmp_path / "stats.json"))
+    service = SessionService(
+        storage, GameConfig(), StatisticsCache(storage, flush_interval=None)
+    )
+    try:
+        session = service.create_session("животные", "лёгкий")
+        for letter in dict.fromkeys(session.game.word.value):
+            service.guess(session.session_id, letter)
+        service.finish(session.session_id)
+    finally:
+        service.close()
+    storage.record_match(
+        MatchStatistics("m1", 10, False, 1, "win", "животные", "лёгкий")
+    )
+    storage.load_achievements()
+
+    counters = registry.counters
+    assert counters["games_started"] == 1
+    assert counters["games_finished"] == 1
+    assert counters["wins"] == 1
+    assert counters["guesses"] == len(set(session.game.word.value))
+    assert counters["storage_bytes_written"] > 0
+    assert counters["storage_bytes_read"] > 0
+    names = {name for name, _ in registry.histograms()}
+    assert {"game.start", "game.guess", "game.finish", "storage.append"} <= names
+
+
+def test_main_metrics_report_on_exit(mocker, tmp_path):
+    games = tmp_path / "games.txt"
+    games.write_text("кот кот\nкот абв\n", encoding="utf-8")
+    report = tmp_path / "metrics.txt"
+    register = mocker.patch("atexit.register")
+    mocker.patch("signal.signal")
+    mock_stdout = mocker.patch("sys.stdout", new_callable=StringIO)
+    mocker.patch(
+        "sys.argv",
+        ["main.py", f"--metrics={report}", "--memory", "--batch", str(games)],
+    )
+    main()
+    assert mock_stdout.getvalue().splitlines() == ["кот;POS", "***;NEG"]
+
+    (path,) = [
+        call.args[1]
+        for call in register.call_args_list
+        if call.args[0] is write_metrics_report
+    ]
+    write_metrics_report(path)
+    text = report.read_text(encoding="utf-8")
+    assert "game.play" in text
+    counters = metrics.current().counters
+    assert counters["games_started"] == counters["games_finished"] == 2
+    assert "wins" in text and "losses" in text
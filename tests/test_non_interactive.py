@@ -1,10 +1,13 @@
 import pytest
+from io import StringIO
 
 from src.application.config import GameConfig
 from src.application.game_service import GameService
 from src.core.entities import Word
 from src.core.exceptions import CategoryNotFoundError, NoWordsError
+from src.infrastructure.batch_cli import run_batch, storage_settings
 from src.infrastructure.cli_ui import NonInteractiveCLI
+from src.infrastructure.dictionary import compile_dictionary
 from src.infrastructure.storage import FileStorage
 
 
@@ -128,3 +131,67 @@ def test_run_with_spaces_in_guesses():
     cli = NonInteractiveCLI("кот", "к о т")
     output = cli.run()
     assert output == "кот;POS"
+
+
+def test_run_batch_preserves_order(storage):
+    lines = ["кот кот\n", "\n", "кот абвгдеё\n", "кот к о т\n", "кот\n"]
+    output = StringIO()
+    count = run_batch(lines, output, storage, chunk_size=2)
+    assert count == 4
+    assert output.getvalue().splitlines() == [
+        "кот;POS",
+        "***;NEG",
+        "кот;POS",
+        "***;NEG",
+    ]
+
+
+def test_run_batch_with_workers(storage):
+    lines = [f"кот {guesses}" for guesses in ["кот", "абв", "ко"] * 5]
+    output = StringIO()
+    run_batch(lines, output, storage, workers=2, chunk_size=4)
+    assert output.getvalue().splitlines() == ["кот;POS", "***;NEG", "ко*;NEG"] * 5
+
+
+def test_run_batch_workers_use_same_storage(tmp_path):
+    path = str(tmp_path / "words.hmd")
+    compile_dictionary({"птицы": {"лёгкий": [Word("сова", "ночная птица")]}}, path)
+    storage = FileStorage(GameConfig(), dictionary_path=path, compact_every=10)
+    assert storage_settings(storage) == (
+        FileStorage,
+        {
+            "config": storage.config,
+            "dictionary_path": path,
+            "statistics_path": None,
+            "journal_path": None,
+            "compact_every": 10,
+        },
+    )
+    lines = ["сова сова", "сова с"] * 4
+    serial, parallel = StringIO(), StringIO()
+    run_batch(lines, serial, storage)
+    run_batch(lines, parallel, storage, workers=2, chunk_size=2)
+    assert parallel.getvalue() == serial.getvalue()
+    assert serial.getvalue().splitlines() == ["сова;POS", "с***;NEG"] * 4
+
+
+@pytest.mark.parametrize(
+    "word, guesses, expected",
+    [
+        ("волокно", "барахло", "******о;NEG"),
+        ("волокно", "толокно", "*олокно;NEG"),
+        ("волокно", "волк", "волок*о;NEG"),
+        ("Волокно", "ВОЛОКНО", "волокно;POS"),
+        ("гиппопотам", "п", "**пп*п****;NEG"),
+    ],
+)
+def test_run_reveal_policies(word, guesses, expected):
+    assert NonInteractiveCLI(word, guesses).run() == expected
+
+
+def test_check_words_bulk(storage):
+    results = dict(storage.check_words(["кот", "Китай", "абракадабра"]))
+    assert results["кот"].category == "животные"
+    assert results["Китай"].level == "лёгкий"
+    assert results["Китай"].hint == "страна с Великой стеной"
+    assert results["абракадабра"] is None
@@ -0,0 +1,117 @@
+import os
+import pstats
+from io import StringIO
+
+import pytest
+
+from src.core import phases
+from src.core.phases import GUESS, STATISTICS_IO, phase, set_observer
+from src.infrastructure.profiling import OTHER, PhaseProfiler
+from src.main import main
+
+
+@pytest.fixture(autouse=True)
+def no_observer():
+    yield
+    set_observer(None)
+
+
+@phase(STATISTICS_IO)
+def save(calls):
+    calls.append("save")
+    return "saved"
+
+
+@phase(GUESS)
+def guess(calls):
+    calls.append("guess")
+    guess_again(calls)
+    return save(calls)
+
+
+@phase(GUESS)
+def guess_again(calls):
+    calls.append("again")
+
+
+def test_phase_without_observer_calls_through():
+    assert phases._observer is None
+    calls = []
+    assert guess(calls) == "saved"
+    assert calls == ["guess", "again", "save"]
+
+
+def test_profiler_splits_nested_phases(tmp_path):
+    profiler = PhaseProfiler()
+    profiler.start()
+    try:
+        for _ in range(3):
+            guess([])
+    finally:
+        profiler.stop()
+    assert phases._observer is None
+
+    seconds = profiler.seconds
+    assert set(seconds) == {OTHER, GUESS, STATISTICS_IO}
+    guess_stats = profiler.stats(GUESS).stats
+    save_stats = profiler.stats(STATISTICS_IO).stats
+    assert any(key[2] == "guess_again" for key in guess_stats)
+    assert not any(key[2] == "guess_again" for key in save_stats)
+    assert profiler.stats("rendering") is None
+
+    summary = profiler.dump(str(tmp_path))
+    assert "guess" in summary and "statistics_io" in summary
+    assert sorted(os.listdir(tmp_path)) == [
+        "all.pstats",
+        "guess.pstats",
+        "other.pstats",
+        "statistics_io.pstats",
+        "summary.txt",
+    ]
+    pstats.Stats(str(tmp_path / "all.pstats"))
+
+
+def test_set_observer_returns_previous():
+    profiler = PhaseProfiler()
+    assert set_observer(profiler) is None
+    assert set_observer(None) is profiler
+
+
+def test_main_profile_batch(mocker, tmp_path):
+    games = tmp_path / "games.txt"
+    games.write_text("кот кот\nкот абв\n", encoding="utf-8")
+    directory = tmp_path / "profile"
+    mock_stdout = mocker.patch("sys.stdout", new_callable=StringIO)
+    mock_stderr = mocker.patch("sys.stderr", new_callable=StringIO)
+    mocker.patch(
+        "sys.argv", ["main.py", "--profile", str(directory), "--batch", str(games)]
+    )
+    main()
+    assert mock_stdout.getvalue().splitlines() == ["кот;POS", "***;NEG"]
+    assert "Профиль по фазам" in mock_stderr.getvalue()
+    assert (directory / "guess.pstats").exists()
+    assert (directory / "summary.txt").exists()
+    assert phases._observer is None
+
+
+def test_main_profile_unwritable_directory(mocker, tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("", encoding="utf-8")
+    mocker.patch("sys.stdout", new_callable=StringIO)
+    mock_stderr = mocker.patch("sys.stderr", new_callable=StringIO)
+    mocker.patch("sys.argv", ["main.py", "--profile", str(blocker), "--levels"])
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 1
+    assert "Ошибка: Не удалось записать профиль" in mock_stderr.getvalue()
+
+
+def test_main_profile_error_keeps_mode_error(mocker, tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("", encoding="utf-8")
+    mocker.patch("src.main.run", side_effect=KeyError("режим"))
+    mock_stderr = mocker.patch("sys.stderr", new_callable=StringIO)
+    mocker.patch("sys.argv", ["main.py", "--profile", str(blocker), "--levels"])
+    with pytest.raises(KeyError):
+        main()
+    assert "Не удалось записать профиль" in mock_stderr.getvalue()
@@ -0,0 +1,200 @@
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from src.application.config import GameConfig
+from src.application.session_service import SessionService
+from src.application.statistics_cache import StatisticsCache
+from src.core import metrics
+from src.core.exceptions import StorageError
+from src.core.metrics import Metrics
+from src.infrastructure.prometheus import (
+    CONTENT_TYPE,
+    PrometheusExporter,
+    cumulative_buckets,
+    metric_name,
+    render,
+)
+from src.infrastructure.storage import FileStorage
+from src.main import main, stop_exporter
+
+
+@pytest.fixture(autouse=True)
+def no_metrics():
+    yield
+    metrics.disable()
+
+
+@pytest.fixture
+def registry():
+    registry = Metrics()
+    for value in (50_000, 200_000, 3_000_000):
+        registry.histogram("game.guess").record(value)
+    registry.increment("wins", 3)
+    registry.increment("losses", 1)
+    registry.increment("views_cache_hits", 9)
+    registry.increment("views_cache_misses", 1)
+    registry.register_gauge("active_sessions", lambda: 2)
+    return registry
+
+
+def samples(text):
+    """Строки значений текстового формата: имя с метками -> значение."""
+    return dict(
+        line.rsplit(" ", 1) for line in text.splitlines() if not line.startswith("#")
+    )
+
+
+def test_metric_name():
+    assert metric_name("game.guess") == "hangman_game_guess"
+    assert metric_name("storage_bytes_read") == "hangman_storage_bytes_read"
+
+
+def test_cumulative_buckets(registry):
+    buckets = dict(cumulative_buckets(registry.histogram("game.guess").buckets()))
+    assert buckets[0.0001] == 1
+    assert buckets[0.00025] == 2
+    assert buckets[0.0025] == 2
+    assert buckets[0.005] == 3
+    assert buckets[10.0] == 3
+
+
+def test_render_text_format(registry):
+    text = render(registry)
+    assert "# TYPE hangman_wins_total counter" in text
+    assert "# TYPE hangman_game_guess_seconds histogram" in text
+    values = samples(text)
+    assert values["hangman_wins_total"] == "3"
+    assert values["hangman_active_sessions"] == "2"
+    assert values["hangman_win_ratio"] == "0.75"
+    assert values['hangman_cache_hit_ratio{cache="views"}'] == "0.9"
+    assert values['hangman_game_guess_seconds_bucket{le="+Inf"}'] == "3"
+    assert values["hangman_game_guess_seconds_count"] == "3"
+    assert float(values["hangman_game_guess_seconds_sum"]) == pytest.approx(0.00325)
+    assert text.endswith("\n")
+
+
+def test_failing_gauge_is_skipped(registry):
+    registry.register_gauge("broken", lambda: 1 / 0)
+    assert "hangman_broken" not in render(registry)
+
+
+def test_exporter_writes_file(registry, tmp_path):
+    path = tmp_path / "hangman.prom"
+    exporter = PrometheusExporter(registry, path=str(path), interval=60)
+    exporter.start()
+    assert "hangman_wins_total 3" in path.read_text(encoding="utf-8")
+    registry.increment("wins")
+    exporter.stop()
+    assert "hangman_wins_total 4" in path.read_text(encoding="utf-8")
+    assert not (tmp_path / "hangman.prom.tmp").exists()
+
+
+def test_exporter_write_error(registry, tmp_path):
+    exporter = PrometheusExporter(registry, path=str(tmp_path / "missing" / "m"))
+    with pytest.raises(StorageError):
+        exporter.start()
+
+
+def test_histogram_sum_matches_count_under_load():
+    registry = Metrics()
+    histogram = registry.histogram("game.guess")
+    histogram.record(1000)
+    stop = threading.Event()
+
+    def record():
+        while not stop.is_set():
+            histogram.record(1000)
+
+    writers = [threading.Thread(target=record) for _ in range(4)]
+    for writer in writers:
+        writer.start()
+    try:
+        for _ in range(200):
+            values = samples(render(registry))
+            count = int(values["hangman_game_guess_seconds_count"])
+            assert values['hangman_game_guess_seconds_bucket{le="+Inf"}'] == str(count)
+            assert float(values["hangman_game_guess_seconds_sum"]) == count * 1000 / 1e9
+    finally:
+        stop.set()
+        for writer in writers:
+            writer.join()
+
+
+def test_exporter_serves_http(registry):
+    exporter = PrometheusExporter(registry, port=0)
+    exporter.start()
+    try:
+        url = f"http://127.0.0.1:{exporter.port}"
+        with urllib.request.urlopen(f"{url}/metrics") as response:
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+            body = response.read().decode("utf-8")
+        assert "hangman_win_ratio 0.75" in body
+        with pytest.raises(urllib.error.HTTPError) as error:
+            urllib.request.urlopen(f"{url}/other")
+        assert error.value.code == 404
+    finally:
+        exporter.stop()
+
+
+def test_service_metrics_exported(tmp_path):
+    registry = metrics.enable()
+    storage = FileStorage(GameConfig(), statistics_path=str(tmp_path / "stats.json"))
+    service = SessionService(
+        storage, GameConfig(), StatisticsCache(storage, flush_interval=None)
+    )
+    try:
+        session = service.create_session("животные", "лёгкий")
+        service.guess(session.session_id, "ъ")
+        values = samples(render(registry))
+        assert values["hangman_active_sessions"] == "1"
+        service.finish(session.session_id)
+        service.statistics.flush()
+    finally:
+        service.close()
+
+    values = samples(render(registry))
+    assert values["hangman_active_sessions"] == "0"
+    assert values["hangman_games_started_total"] == "1"
+    assert values["hangman_games_finished_total"] == "1"
+    assert values["hangman_win_ratio"] == "0"
+    assert int(values["hangman_statistics_file_bytes"]) > 0
+    assert 'hangman_cache_hit_ratio{cache="views"}' in values
+    assert values['hangman_game_guess_seconds_bucket{le="+Inf"}'] == "1"
+    assert "hangman_storage_load_seconds_count" in values
+    assert "hangman_storage_append_seconds_count" in values
+
+
+def test_main_prometheus_file(mocker, tmp_path):
+    path = tmp_path / "hangman.prom"
+    register = mocker.patch("atexit.register")
+    mocker.patch("sys.stdout")
+    mocker.patch(
+        "sys.argv",
+        ["main.py", "--prometheus-file", str(path), "--memory", "кот", "кот"],
+    )
+    main()
+    (exporter,) = [
+        call.args[1]
+        for call in register.call_args_list
+        if call.args[0] is stop_exporter
+    ]
+    stop_exporter(exporter)
+    values = samples(path.read_text(encoding="utf-8"))
+    assert values["hangman_wins_total"] == "1"
+    assert values["hangman_games_started_total"] == "1"
+    assert values["hangman_games_finished_total"] == "1"
+    assert values["hangman_win_ratio"] == "1"
+
+
+def test_main_prometheus_invalid_interval(mocker):
+    mocker.patch("sys.stderr")
+    mocker.patch(
+        "sys.argv",
+        ["main.py", "--prometheus-port", "0", "--prometheus-interval", "0", "--levels"],
+    )
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+    assert exit_info.value.code == 1
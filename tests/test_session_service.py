@@ -0,0 +1,146 @@
+import gc
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.application.config import GameConfig
+from src.application.scoring import calculate_score, consecutive_wins
+from src.application.session_service import SessionService, active_sessions
+from src.application.statistics_cache import StatisticsCache
+from src.core.exceptions import (
+    CategoryNotFoundError,
+    GameAlreadyFinishedError,
+    HintAlreadyUsedError,
+    LevelNotFoundError,
+    SessionNotFoundError,
+)
+from src.core import metrics
+from src.infrastructure.storage import FileStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return FileStorage(GameConfig(), statistics_path=str(tmp_path / "stats.json"))
+
+
+@pytest.fixture
+def service(storage):
+    service = SessionService(
+        storage, GameConfig(), StatisticsCache(storage, flush_interval=None)
+    )
+    yield service
+    service.close()
+
+
+def solve(service, session):
+    for letter in dict.fromkeys(session.game.word.value):
+        service.guess(session.session_id, letter)
+
+
+def test_sessions_are_independent(service):
+    first = service.create_session("животные", "лёгкий")
+    second = service.create_session("животные", "лёгкий")
+    assert first.session_id != second.session_id
+    service.guess(first.session_id, "ъ")
+    assert service.get_session(first.session_id).state().errors == 1
+    assert service.get_session(second.session_id).state().errors == 0
+    assert len(service) == 2
+
+
+def test_finish_records_win_and_achievements(service, storage):
+    session = service.create_session("животные", "лёгкий")
+    solve(service, session)
+    summary = service.finish(session.session_id)
+    assert summary.is_won
+    assert summary.word == session.game.word.value
+    assert summary.score == calculate_score(len(summary.word), 0, False, True)
+    assert "Новичок" in [ach.name for ach in summary.achievements]
+    assert len(service) == 0
+    with pytest.raises(SessionNotFoundError):
+        service.guess(session.session_id, "а")
+    service.close()
+    stats = storage.load_achievements()
+    assert stats.wins == 1
+    assert "Новичок" in stats.unlocked_achievements
+
+
+def test_unfinished_game_counts_as_loss(service):
+    session = service.create_session("фрукты", "сложный")
+    summary = service.finish(session.session_id)
+    assert not summary.is_won
+    assert summary.score == 0
+    stats = service.statistics.stats
+    assert (stats.games_played, stats.wins) == (1, 0)
+
+
+def test_hint_once_per_session(service):
+    session = service.create_session("животные", "лёгкий")
+    assert service.hint(session.session_id) == session.game.word.description
+    with pytest.raises(HintAlreadyUsedError):
+        service.hint(session.session_id)
+    solve(service, session)
+    with pytest.raises(GameAlreadyFinishedError):
+        service.guess(session.session_id, "ъ")
+    assert service.finish(session.session_id).score == calculate_score(
+        len(session.game.word.value), 0, True, True
+    )
+
+
+def test_invalid_arguments(service):
+    with pytest.raises(CategoryNotFoundError):
+        service.create_session("нет такой", "лёгкий")
+    with pytest.raises(LevelNotFoundError):
+        service.create_session("животные", "нет такого")
+    with pytest.raises(SessionNotFoundError):
+        service.finish("unknown")
+
+
+def test_concurrent_sessions(service):
+    def play(_):
+        session = service.create_session()
+        solve(service, session)
+        return service.finish(session.session_id).is_won
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(play, range(50)))
+    assert all(results)
+    stats = service.statistics.stats
+    assert stats.games_played == 50
+    assert stats.wins == 50
+
+
+def test_win_streak_comes_from_saved_statistics(storage):
+    for _ in range(2):
+        service = SessionService(
+            storage, GameConfig(), StatisticsCache(storage, flush_interval=None)
+        )
+        session = service.create_session("животные", "лёгкий")
+        solve(service, session)
+        service.finish(session.session_id)
+        service.close()
+    stats = storage.load_achievements()
+    assert stats.rollups.current_streak == 2
+    assert consecutive_wins(stats, True) == 3
+    assert consecutive_wins(stats, False) == 0
+
+
+@pytest.fixture
+def registry():
+    yield metrics.enable()
+    metrics.disable()
+
+
+def test_active_sessions_gauge_does_not_keep_services(storage, registry):
+    service = SessionService(
+        storage, GameConfig(), StatisticsCache(storage, flush_interval=None)
+    )
+    service.create_session("животные", "лёгкий")
+    assert active_sessions() == 1
+    assert registry.gauges["active_sessions"] == 1.0
+    service.close()
+    ref = weakref.ref(service)
+    del service
+    gc.collect()
+    assert ref() is None
+    assert registry.gauges["active_sessions"] == 0.0
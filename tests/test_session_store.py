@@ -0,0 +1,203 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.application.config import GameConfig
+from src.application.session_service import SessionService
+from src.application.statistics_cache import StatisticsCache
+from src.core.exceptions import SessionNotFoundError
+from src.infrastructure.session_store import SessionStore
+from src.infrastructure.storage import FileStorage
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_service(tmp_path, store):
+    storage = FileStorage(GameConfig(), statistics_path=str(tmp_path / "stats.json"))
+    return SessionService(
+        storage,
+        GameConfig(),
+        StatisticsCache(storage, flush_interval=None),
+        sessions=store,
+    )
+
+
+def test_lru_eviction_spills_and_restores(tmp_path, clock):
+    store = SessionStore(max_sessions=2, spill_dir=str(tmp_path / "spill"), clock=clock)
+    service = make_service(tmp_path, store)
+    first = service.create_session("животные", "лёгкий")
+    service.guess(first.session_id, "ъ")
+    service.hint(first.session_id)
+    second = service.create_session("животные", "лёгкий")
+    service.create_session("животные", "лёгкий")
+    assert store.resident == 2
+    assert len(store) == 3 == len(list(store))
+    assert store.stats.evictions == 1
+    assert store.spilled == 1
+    assert first.session_id in store
+
+    restored = service.get_session(first.session_id)
+    assert restored is not first
+    assert restored.state() == first.state()
+    assert restored.hint_used
+    assert store.stats.restores == 1
+    assert second.session_id in list(store)
+    assert store.resident == 2
+    assert store.spilled == 1
+
+    service.finish(first.session_id)
+    assert first.session_id not in store
+    service.close()
+
+
+def test_spilled_sessions_survive_restart(tmp_path, clock):
+    spill_dir = str(tmp_path / "spill")
+    store = SessionStore(max_sessions=1, spill_dir=spill_dir, clock=clock)
+    service = make_service(tmp_path, store)
+    first = service.create_session("животные", "лёгкий")
+    service.create_session("животные", "лёгкий")
+
+    service = make_service(tmp_path, SessionStore(spill_dir=spill_dir, clock=clock))
+    assert service.get_session(first.session_id).state() == first.state()
+
+
+def test_ttl_expiry(tmp_path, clock):
+    store = SessionStore(ttl=10, clock=clock)
+    service = make_service(tmp_path, store)
+    idle = service.create_session("животные", "лёгкий")
+    clock.now = 5
+    active = service.create_session("животные", "лёгкий")
+    clock.now = 11
+    service.get_session(active.session_id)
+    with pytest.raises(SessionNotFoundError):
+        service.get_session(idle.session_id)
+    assert store.stats.expirations == 1
+    assert store.stats.hits == 1
+    assert store.stats.misses == 1
+
+
+def test_memory_cap(clock, tmp_path):
+    store = SessionStore(max_sessions=None, max_memory=5000, ttl=None, clock=clock)
+    service = make_service(tmp_path, store)
+    for _ in range(20):
+        service.create_session("животные", "лёгкий")
+    assert store.memory <= 5000
+    assert store.stats.evictions == 20 - store.resident
+
+
+def win(service, session):
+    for letter in set(session.game.word.value):
+        service.guess(session.session_id, letter)
+
+
+def test_evicted_finished_games_are_recorded(tmp_path, clock):
+    store = SessionStore(max_sessions=1, spill_dir=str(tmp_path / "spill"), clock=clock)
+    service = make_service(tmp_path, store)
+    first = service.create_session("животные", "лёгкий")
+    win(service, first)
+    service.create_session("животные", "лёгкий")
+    assert store.spilled == 0
+    assert first.session_id not in store
+    assert first.closed
+    stats = service.statistics.stats
+    assert stats.games_played == 1 and stats.wins == 1
+    assert stats.unlocked_achievements
+
+
+def test_expired_finished_games_are_recorded(tmp_path, clock):
+    store = SessionStore(ttl=10, clock=clock)
+    service = make_service(tmp_path, store)
+    finished = service.create_session("животные", "лёгкий")
+    win(service, finished)
+    service.create_session("животные", "лёгкий")
+    clock.now = 11
+    assert store.expire() == 2
+    # Результат записывается следующей операцией сервиса, вне блокировок.
+    assert service.statistics.stats.games_played == 0
+    with pytest.raises(SessionNotFoundError):
+        service.finish(finished.session_id)
+    assert service.statistics.stats.games_played == 1
+
+
+def test_finished_games_are_spilled_without_handler(tmp_path, clock):
+    store = SessionStore(max_sessions=1, spill_dir=str(tmp_path / "spill"), clock=clock)
+    service = make_service(tmp_path, store)
+    store.on_finished = None
+    first = service.create_session("животные", "лёгкий")
+    win(service, first)
+    service.create_session("животные", "лёгкий")
+    assert store.spilled == 1
+    assert service.finish(first.session_id).is_won
+
+
+def test_spill_files_expire(tmp_path, clock):
+    spill_dir = tmp_path / "spill"
+    store = SessionStore(max_sessions=1, ttl=10, spill_dir=str(spill_dir), clock=clock)
+    service = make_service(tmp_path, store)
+    first = service.create_session("животные", "лёгкий")
+    clock.now = 5
+    second = service.create_session("животные", "лёгкий")
+    clock.now = 9
+    service.get_session(second.session_id)
+    assert store.spilled == 1
+    clock.now = 16
+    assert store.expire() == 1
+    assert store.spilled == 0
+    assert first.session_id not in store
+    assert not (spill_dir / f"{first.session_id}.json").exists()
+
+
+def test_spill_files_of_previous_run_expire(tmp_path, clock):
+    spill_dir = tmp_path / "spill"
+    store = SessionStore(max_sessions=1, spill_dir=str(spill_dir), clock=clock)
+    service = make_service(tmp_path, store)
+    first = service.create_session("животные", "лёгкий")
+    service.create_session("животные", "лёгкий")
+    path = spill_dir / f"{first.session_id}.json"
+    os.utime(path, (time.time() - 20, time.time() - 20))
+
+    store = SessionStore(ttl=10, spill_dir=str(spill_dir), clock=clock)
+    assert store.spilled == 1
+    assert store.expire() == 1
+    assert store.spilled == 0
+    assert not path.exists()
+
+
+def test_handler_runs_outside_store_lock(tmp_path, clock):
+    store = SessionStore(max_sessions=1, clock=clock)
+    service = make_service(tmp_path, store)
+    first = service.create_session("животные", "лёгкий")
+    win(service, first)
+    calls = []
+
+    def on_finished(session):
+        # Из другого потока хранилище доступно, пока работает обработчик.
+        with ThreadPoolExecutor(1) as pool:
+            calls.append(pool.submit(len, store).result(timeout=5))
+
+    store.on_finished = on_finished
+    service.create_session("животные", "лёгкий")
+    assert calls == [1]
+
+
+def test_close_records_dropped_games(tmp_path, clock):
+    store = SessionStore(ttl=10, clock=clock)
+    service = make_service(tmp_path, store)
+    win(service, service.create_session("животные", "лёгкий"))
+    clock.now = 11
+    store.expire()
+    service.close()
+    assert service.statistics.stats.games_played == 1
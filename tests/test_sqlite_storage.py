@@ -0,0 +1,105 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.application.config import GameConfig
+from src.core.entities import MatchStatistics, Word
+from src.core.exceptions import CategoryNotFoundError, LevelNotFoundError, NoWordsError
+from src.infrastructure.sqlite_storage import SQLiteStorage
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "hangman.db")
+
+
+@pytest.fixture
+def storage(db_path):
+    storage = SQLiteStorage(GameConfig(), db_path)
+    yield storage
+    storage.close()
+
+
+def make_match(i: int, result: str = "win", category: str = "животные"):
+    return MatchStatistics(f"{i:09d}", 30, False, 0, result, category, "лёгкий", i)
+
+
+def record_many(args):
+    path, start, count = args
+    storage = SQLiteStorage(GameConfig(), path)
+    for i in range(start, start + count):
+        storage.record_match(make_match(i))
+    storage.close()
+
+
+def test_words_seeded_from_config(storage):
+    assert storage.get_categories() == ("животные", "фрукты", "страны")
+    assert "лёгкий" in storage.get_levels()
+    assert storage.get_word("животные", "лёгкий").value in {"кот", "собака", "мышь"}
+    assert storage.check_word("Кот") == ("животные", "лёгкий")
+    assert storage.get_hint("кот") == "маленькое домашнее животное"
+    assert storage.determine_category_level_attempts("абракадабра") == (
+        "внешнее",
+        "внешнее",
+        6,
+    )
+
+
+def test_get_word_picks_every_word_of_its_group(storage):
+    storage.import_words(
+        {
+            "а": {"лёгкий": [Word(value, "") for value in ("аа", "аб", "ав")]},
+            "б": {
+                "лёгкий": [Word(value, "") for value in ("ба", "бб", "бв")],
+                "сложный": [Word("бг", "")],
+            },
+        }
+    )
+    picked = {storage.get_word("б", "лёгкий").value for _ in range(200)}
+    assert picked == {"ба", "бб", "бв"}
+    assert storage.get_word("б", "сложный").value == "бг"
+
+
+def test_word_lookup_errors(storage):
+    with pytest.raises(CategoryNotFoundError):
+        storage.get_word("bad", "лёгкий")
+    with pytest.raises(LevelNotFoundError):
+        storage.get_word("животные", "bad")
+    with pytest.raises(NoWordsError):
+        storage.check_word("абракадабра")
+
+
+def test_record_match_and_queries(storage):
+    storage.record_match(make_match(1))
+    storage.record_match(make_match(2, "loss"))
+    storage.record_match(make_match(3, category="фрукты"))
+    storage.unlock_achievements(["Новичок", "Новичок"])
+    stats = storage.load_achievements()
+    assert (stats.games_played, stats.wins, stats.total_score) == (3, 2, 90)
+    assert stats.unlocked_achievements == ["Новичок"]
+    assert storage.last_match()["match_id"] == "000000003"
+    assert storage.find_match("000000002")["result"] == "loss"
+    assert storage.count_results("win", "животные") == 1
+    assert storage.load_rollups().by_category["животные"].games == 2
+    assert stats.rollups.best_win_streak == 1
+    assert [m["match_id"] for m in storage.matches_since(2)] == [
+        "000000002",
+        "000000003",
+    ]
+
+
+def test_save_achievements_replaces_state(storage):
+    storage.record_match(make_match(1))
+    stats = storage.load_achievements()
+    stats.unlocked_achievements.append("Профи")
+    storage.save_achievements(stats)
+    assert storage.load_achievements() == stats
+
+
+def test_concurrent_processes(db_path):
+    SQLiteStorage(GameConfig(), db_path).close()
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        list(pool.map(record_many, [(db_path, i * 25, 25) for i in range(4)]))
+    storage = SQLiteStorage(GameConfig(), db_path)
+    assert storage.load_achievements().games_played == 100
+    storage.close()
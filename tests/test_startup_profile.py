@@ -0,0 +1,76 @@
+import subprocess
+import sys
+from io import StringIO
+
+import pytest
+
+import src
+from src.application.game_service import GameService
+from src.infrastructure.startup_profile import (
+    format_report,
+    package_of,
+    parse_importtime,
+)
+from src.main import main
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   encodings.utf_8
+import time:      3000 |       5000 | src
+import time:       800 |       2000 |   src.core.entities
+import time:      1200 |       1200 |     dataclasses
+Traceback: не строка importtime
+"""
+
+
+def test_parse_importtime():
+    timings = parse_importtime(IMPORTTIME.splitlines())
+    assert [t.module for t in timings] == [
+        "encodings.utf_8",
+        "src",
+        "src.core.entities",
+        "dataclasses",
+    ]
+    assert [t.depth for t in timings] == [1, 0, 1, 2]
+    assert timings[1].self_us == 3000
+    assert timings[1].cumulative_us == 5000
+
+
+def test_format_report_groups_by_layer():
+    assert package_of("src.core.entities") == "src.core"
+    assert package_of("json.decoder") == "json"
+    report = format_report(parse_importtime(IMPORTTIME.splitlines()), 0.05)
+    assert "импорт: 5.1 мс (4 модулей)" in report
+    assert "src.core" in report
+    assert report.index("5.00 мс") < report.index("2.00 мс")
+
+
+def test_import_src_is_lazy():
+    code = (
+        "import sys, src\n"
+        "heavy = ['numpy', 'asyncio', 'colorama', 'src.application.game_service',"
+        " 'src.infrastructure.storage']\n"
+        "print(','.join(m for m in heavy if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_exports_resolve():
+    assert src.GameService is GameService
+    assert "GameService" in dir(src)
+    with pytest.raises(AttributeError):
+        src.NoSuchName
+
+
+def test_main_startup_profile(mocker):
+    mock_stdout = mocker.patch("sys.stdout", new_callable=StringIO)
+    mocker.patch("sys.argv", ["main.py", "--startup-profile", "--levels"])
+    with pytest.raises(SystemExit) as exc:
+        main()
+    assert exc.value.code == 0
+    output = mock_stdout.getvalue()
+    assert "Время процесса" in output
+    assert "src.core" in output
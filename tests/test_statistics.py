@@ -0,0 +1,56 @@
+from src.core.entities import PlayerStatistics, StatisticsRollups
+
+
+def make_match(result: str, score: int = 0, category: str = "животные") -> dict:
+    return {
+        "result": result,
+        "score": score,
+        "category": category,
+        "level": "лёгкий",
+        "word_length": 3,
+    }
+
+
+def test_rollups_by_category_and_level():
+    stats = PlayerStatistics()
+    stats.add_match(make_match("win", 30))
+    stats.add_match(make_match("loss"))
+    stats.add_match(make_match("win", 80, "фрукты"))
+    rollups = stats.rollups
+    assert rollups.by_category["животные"].games == 2
+    assert rollups.by_category["животные"].wins == 1
+    assert rollups.by_category["фрукты"].total_score == 80
+    assert rollups.by_level["лёгкий"].games == 3
+    assert rollups.by_word_length[3].wins == 2
+    assert rollups.score_histogram == {0: 1, 25: 1, 75: 1}
+    assert rollups.best_score == 80
+
+
+def test_rollups_streaks():
+    rollups = StatisticsRollups()
+    for result in ["win", "win", "win", "loss", "loss", "win"]:
+        rollups.add(make_match(result))
+    assert rollups.current_streak == 1
+    assert rollups.best_win_streak == 3
+    assert rollups.worst_loss_streak == 2
+
+
+def test_rolling_win_percentage_matches_history():
+    results = ["win" if i % 3 else "loss" for i in range(250)]
+    rollups = StatisticsRollups()
+    for result in results:
+        rollups.add(make_match(result))
+    for window in (10, 100):
+        expected = sum(r == "win" for r in results[-window:]) / window * 100
+        assert rollups.rolling_win_percentage(window) == expected
+
+
+def test_rollups_roundtrip():
+    rollups = StatisticsRollups()
+    for result in ["win", "loss", "win"]:
+        rollups.add(make_match(result, 40))
+    restored = StatisticsRollups.from_dict(rollups.to_dict())
+    assert restored == rollups
+    restored.add(make_match("win"))
+    rollups.add(make_match("win"))
+    assert restored == rollups
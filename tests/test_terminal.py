@@ -0,0 +1,84 @@
+import os
+from io import StringIO
+
+import pytest
+
+from src.infrastructure.terminal import (
+    CLEAR_BELOW,
+    CLEAR_LINE,
+    CLEAR_SCREEN,
+    TerminalRenderer,
+    move_to,
+    visible_width,
+)
+
+
+@pytest.fixture(autouse=True)
+def terminal_size(monkeypatch):
+    monkeypatch.setattr("shutil.get_terminal_size", lambda: os.terminal_size((80, 40)))
+
+
+@pytest.fixture
+def stream():
+    return StringIO()
+
+
+def take(stream):
+    output = stream.getvalue()
+    stream.seek(0)
+    stream.truncate()
+    return output
+
+
+def test_plain_stream_gets_full_frames_without_escapes(stream):
+    renderer = TerminalRenderer(stream, ansi=False)
+    renderer.render(["Заголовок", "a\nb"])
+    renderer.render(["Заголовок", "a\nc"])
+    assert stream.getvalue() == "Заголовок\na\nb\nЗаголовок\na\nc\n"
+
+
+def test_first_frame_clears_screen(stream):
+    renderer = TerminalRenderer(stream, ansi=True)
+    renderer.render(["Заголовок", "Слово: ***"])
+    assert take(stream) == CLEAR_SCREEN + "Заголовок\nСлово: ***\n"
+
+
+def test_only_changed_lines_are_redrawn(stream):
+    renderer = TerminalRenderer(stream, ansi=True)
+    renderer.render(["Заголовок", "Слово: ***", "Попыток: 7"])
+    take(stream)
+    renderer.render(["Заголовок", "Слово: к**", "Попыток: 7"])
+    assert take(stream) == (
+        f"{move_to(1)}{CLEAR_LINE}Слово: к**" f"{move_to(3)}{CLEAR_BELOW}"
+    )
+
+
+def test_shorter_frame_clears_leftover_lines(stream):
+    renderer = TerminalRenderer(stream, ansi=True)
+    renderer.render(["a", "b", "c"])
+    take(stream)
+    renderer.render(["a"])
+    assert take(stream) == f"{move_to(1)}{CLEAR_BELOW}"
+
+
+def test_reset_forces_full_repaint(stream):
+    renderer = TerminalRenderer(stream, ansi=True)
+    renderer.render(["a"])
+    renderer.reset()
+    take(stream)
+    renderer.render(["a"])
+    assert take(stream).startswith(CLEAR_SCREEN)
+
+
+def test_frame_taller_than_terminal_is_always_repainted(stream, monkeypatch):
+    monkeypatch.setattr("shutil.get_terminal_size", lambda: os.terminal_size((80, 5)))
+    renderer = TerminalRenderer(stream, ansi=True)
+    frame = [str(i) for i in range(10)]
+    renderer.render(frame)
+    take(stream)
+    renderer.render(frame)
+    assert take(stream).startswith(CLEAR_SCREEN)
+
+
+def test_visible_width_ignores_colours():
+    assert visible_width("\x1b[33mСлово\x1b[0m") == 5